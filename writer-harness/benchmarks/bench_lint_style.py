@@ -0,0 +1,114 @@
+"""Benchmark lint_style on a synthetic manuscript.
+
+Usage: python benchmarks/bench_lint_style.py [--words N] [--repeat R] [--extra-banned K]
+
+--extra-banned adds K synthetic banned patterns that never match, to
+measure how the literal prefilter scales with large banned lists.
+"""
+import argparse
+import random
+import re
+import string
+import time
+
+from harness.models import BannedPhrases
+from harness.lint.patterns import INANIMATE_SUBJECTS, EMOTIONAL_VERBS
+from harness.lint.ruleset import compile_ruleset, load_ruleset
+from harness.lint.style import lint_style
+
+CLEAN = [
+    "He poured water into the glass and set it down.",
+    "She crossed to the window and checked the latch.",
+    "The aide knocked twice and waited outside the door.",
+    "Phoenix folded the towel and placed it on the bench.",
+    "He read the message, then turned the phone face down.",
+    '"Sit," he said.',
+    '"I prefer to stand."',
+    "Neither of them moved for a while.",
+]
+FLAGGED = [
+    "Her breath hitched.",
+    "The silence watches them from every corner.",
+    "You could see it in his face.",
+    "It was a victory for him.",
+    "The mood shifts as she enters.",
+    "She was the type to leave without warning.",
+]
+
+
+def make_manuscript(words: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    paragraphs = []
+    count = 0
+    while count < words:
+        sentences = []
+        for _ in range(rng.randint(2, 6)):
+            pool = FLAGGED if rng.random() < 0.03 else CLEAN
+            sentences.append(rng.choice(pool))
+        paragraph = " ".join(sentences)
+        count += len(paragraph.split())
+        paragraphs.append(paragraph)
+    return "\n\n".join(paragraphs)
+
+
+NAIVE_PAIRS = [
+    re.compile(rf'\b{re.escape(noun)}\b\s+(?:\w+\s+)*{re.escape(verb)}\b')
+    for noun in INANIMATE_SUBJECTS
+    for verb in EMOTIONAL_VERBS
+]
+
+
+def naive_lint(text: str, ruleset):
+    """Per-pattern, per-line scanning as lint_style did before the combined scanner."""
+    lines = text.split('\n')
+    hits = 0
+    for rule in ruleset.rules:
+        for line in lines:
+            if rule.regex.search(line):
+                hits += 1
+    for line in lines:
+        lower_line = line.lower()
+        for regex in NAIVE_PAIRS:
+            if regex.search(lower_line):
+                hits += 1
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--banned", default="workspace/banned_phrases.yaml")
+    parser.add_argument("--extra-banned", type=int, default=0)
+    args = parser.parse_args()
+
+    from pathlib import Path
+    ruleset = load_ruleset(Path(args.banned))
+    if args.extra_banned:
+        rng = random.Random(1)
+        extra = [
+            r"(?i)\b" + "".join(rng.choice(string.ascii_lowercase) for _ in range(6)) + r"\s+\w+"
+            for _ in range(args.extra_banned)
+        ]
+        banned = ruleset.banned_phrases
+        ruleset = compile_ruleset(
+            BannedPhrases(banned_regex=banned.banned_regex + extra, warn_regex=banned.warn_regex),
+            ruleset.lint_config,
+        )
+        print(f"rules: {len(ruleset.rules)}")
+    text = make_manuscript(args.words)
+    print(f"manuscript: {len(text.split())} words, {text.count(chr(10)) + 1} lines")
+
+    for name, fn in [("lint_style", lambda: lint_style(text, ruleset)), ("naive", lambda: naive_lint(text, ruleset))]:
+        best = min(_timed(fn) for _ in range(args.repeat))
+        print(f"{name:>12}: {best * 1000:8.1f} ms")
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark the language server's work per keystroke on a long scene.
+
+Usage: python benchmarks/bench_lsp.py [--words N] [--flagged F] [--keystrokes K] [--workspace DIR]
+
+Opens a scene of about N words, then types K characters one at a time
+into a paragraph in the middle, timing what the server does for each
+edit when the debounce never hides it: apply the incremental change,
+re-lint and build the diagnostics.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from harness.lsp import Document, LintLanguageServer, apply_change, line_starts
+
+sys.path.insert(0, str(Path(__file__).parent))
+from bench_violations import make_draft  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=10_000)
+    parser.add_argument("--flagged", type=float, default=0.2)
+    parser.add_argument("--keystrokes", type=int, default=200)
+    parser.add_argument("--workspace", default="workspace")
+    args = parser.parse_args()
+
+    # Bench sentences average about seven words.
+    text = make_draft(args.words // 7, args.flagged)
+    server = LintLanguageServer(Path(args.workspace), None, None)
+    document = Document("file:///scene.md", text)
+
+    started = time.perf_counter()
+    diagnostics = server.lint(document)
+    opened = time.perf_counter() - started
+    print(f"scene: {len(text.split())} words, {len(diagnostics)} diagnostics")
+    print(f"{'open':>12}: {opened * 1000:8.1f} ms")
+
+    line = len(line_starts(text)) // 2
+    timings = []
+    for character in range(args.keystrokes):
+        position = {"line": line, "character": character}
+        started = time.perf_counter()
+        document.text = apply_change(document.text, {"range": {"start": position, "end": position}, "text": "x"})
+        server.lint(document)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    print(f"{'keystroke':>12}: {statistics.median(timings) * 1000:8.1f} ms median, "
+          f"{timings[int(len(timings) * 0.95)] * 1000:.1f} ms p95, {timings[-1] * 1000:.1f} ms max")
+    print(f"{'rescanned':>12}: {document.linter.scanned} paragraph(s) per keystroke")
+
+
+if __name__ == "__main__":
+    main()
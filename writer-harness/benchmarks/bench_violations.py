@@ -0,0 +1,120 @@
+"""Benchmark violation handling on a draft where most sentences are flagged.
+
+Usage: python benchmarks/bench_violations.py [--sentences N] [--flagged F] [--cap C] [--repeat R]
+
+Compares building LintViolation models against the linters' compact
+Violation records, then times lint_style and an incremental re-lint
+(one paragraph inserted at the top, so every cached block is shifted)
+with and without a per-rule cap of C violations.
+"""
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from harness.models import ContinuityLedger, LintViolation
+from harness.lint.ruleset import compile_ruleset, load_ruleset
+from harness.lint.incremental import IncrementalLinter
+from harness.lint.style import lint_style
+from harness.lint.violation import Violation
+
+sys.path.insert(0, str(Path(__file__).parent))
+from bench_lint_style import CLEAN, FLAGGED  # noqa: E402
+
+
+def make_draft(sentences: int, flagged: float, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    paragraphs = []
+    for start in range(0, sentences, 4):
+        paragraphs.append(" ".join(
+            rng.choice(FLAGGED if rng.random() < flagged else CLEAN)
+            for _ in range(min(4, sentences - start))
+        ))
+    return "\n\n".join(paragraphs)
+
+
+def _records(count: int, make) -> list:
+    return [make(i) for i in range(count)]
+
+
+def _model(i: int) -> LintViolation:
+    return LintViolation(
+        rule_id="banned:0", category="style", severity="error", message="Banned phrase: 'breath hitch'",
+        line_number=i, context="Her breath hitched.", column=1, start=i * 20, end=i * 20 + 12,
+    )
+
+
+def _compact(i: int) -> Violation:
+    return Violation(
+        "banned:0", "style", "error", "Banned phrase: 'breath hitch'",
+        i, "Her breath hitched.", 1, i * 20, i * 20 + 12,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sentences", type=int, default=20_000)
+    parser.add_argument("--flagged", type=float, default=0.5)
+    parser.add_argument("--cap", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--banned", default="workspace/banned_phrases.yaml")
+    args = parser.parse_args()
+
+    ruleset = load_ruleset(Path(args.banned))
+    capped = compile_ruleset(
+        ruleset.banned_phrases,
+        ruleset.lint_config.model_copy(update={"max_violations_per_rule": args.cap}),
+    )
+    text = make_draft(args.sentences, args.flagged)
+    count = len(lint_style(text, ruleset))
+    print(f"draft: {len(text.split())} words, {count} violations")
+
+    print("records:")
+    for name, make in [("LintViolation", _model), ("Violation", _compact)]:
+        best = min(_timed(lambda: _records(count, make)) for _ in range(args.repeat))
+        print(f"{name:>24}: {best * 1000:8.1f} ms {_peak(lambda: _records(count, make)):8.1f} MB")
+
+    ledger = ContinuityLedger(
+        location_current="Salon",
+        time_of_day="evening",
+        date_or_day_count="Day 1",
+        elapsed_time_since_last_scene="10 minutes",
+        who_present=["Phoenix"],
+    )
+    edited = "A new opening paragraph.\n\n" + text
+    print("lint:")
+    for label, rules in [("uncapped", ruleset), (f"cap {args.cap}", capped)]:
+        found = len(lint_style(text, rules))
+        best = min(_timed(lambda: lint_style(text, rules)) for _ in range(args.repeat))
+        print(f"{'lint_style ' + label:>24}: {best * 1000:8.1f} ms {_peak(lambda: lint_style(text, rules)):8.1f} MB  {found} violations")
+
+        def relint():
+            linter = IncrementalLinter(rules, ledger)
+            linter.lint(text)
+            started = time.perf_counter()
+            linter.lint(edited)
+            return time.perf_counter() - started
+
+        best = min(relint() for _ in range(args.repeat))
+        print(f"{'re-lint ' + label:>24}: {best * 1000:8.1f} ms")
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _peak(fn) -> float:
+    """Peak traced allocation in MB while fn runs."""
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+if __name__ == "__main__":
+    main()
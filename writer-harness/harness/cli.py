@@ -1,21 +1,55 @@
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
 import click
-import yaml
 from pathlib import Path
 from datetime import datetime
-from rich.console import Console
 
-from harness.config import settings
-from harness.lint.rules import load_style_rules, load_banned_phrases
-from harness.pipelines.draft import draft_scene, load_continuity_ledger
-from harness.pipelines.revise import revise_draft
-from harness.lint.style import lint_style
-from harness.lint.continuity import lint_continuity
+# Commands import what they use: pydantic_settings, the linters and rich
+# cost a few hundred milliseconds, which `lint` skips when a daemon is up.
+from harness.client import DaemonClient, DaemonError, configured_workspace_root
+from harness.lint.targets import FileReport, expand_targets
 
-console = Console()
+
+class _Lazy:
+    """Stands in for a module-level object and creates it on first use."""
+
+    def __init__(self, load):
+        self._load = load
+        self._target = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def __getattr__(self, name):
+        if self._target is None:
+            self._target = self._load()
+        return getattr(self._target, name)
+
+
+def _load_settings():
+    from harness.config import settings
+    return settings
+
+
+def _load_console():
+    from rich.console import Console
+    return Console()
+
+
+settings = _Lazy(_load_settings)
+console = _Lazy(_load_console)
 
 
 def create_workspace(workspace_root: Path):
     """Initialize workspace with starter files."""
+    import yaml
+    from harness.lint.patterns import INANIMATE_SUBJECTS, EMOTIONAL_VERBS, ANTHROPOMORPHISM_WINDOW
+
     workspace_root.mkdir(exist_ok=True)
 
     (workspace_root / "lore").mkdir(exist_ok=True)
@@ -27,6 +61,7 @@ def create_workspace(workspace_root: Path):
         starter_state = {
             "location_current": "Novo-Ogaryovo — private salon",
             "location_previous": "Novo-Ogaryovo — bathing wing antechamber",
+            "location_aliases": {"private salon": ["the salon"]},
             "time_of_day": "early afternoon",
             "date_or_day_count": "Day 17",
             "elapsed_time_since_last_scene": "25 minutes",
@@ -126,6 +161,17 @@ def create_workspace(workspace_root: Path):
             "output_targets": {
                 "length_words": [600, 1200],
                 "include_continuity_footer": False
+            },
+            "lint": {
+                "object_anthropomorphism": {
+                    "nouns": list(INANIMATE_SUBJECTS),
+                    "verbs": list(EMOTIONAL_VERBS),
+                    "window": ANTHROPOMORPHISM_WINDOW,
+                },
+                "stream_abort": {
+                    "max_errors": 5,
+                    "within_words": 200,
+                }
             }
         }
         with open(rules_path, "w") as f:
@@ -138,16 +184,16 @@ def create_workspace(workspace_root: Path):
             "banned_regex": [
                 "(?i)breath\\s+hitch",
                 "(?i)silence\\s+pools",
-                "(?i)spilled\\s+ink",
+                {"pattern": "(?i)spilled\\s+ink", "fix": {"replace": "ink"}},
                 "(?i)the\\s+truth\\s+is",
                 "(?i)what\\s+he\\s+won'?t\\s+admit",
                 "(?i)what\\s+she\\s+won'?t\\s+admit",
-                "(?i)he\\s+realizes",
-                "(?i)she\\s+realizes",
-                "(?i)like\\s+a\\s+grandmaster",
+                {"pattern": "(?i)he\\s+realizes", "fix": "drop_clause"},
+                {"pattern": "(?i)she\\s+realizes", "fix": "drop_clause"},
+                {"pattern": "(?i)like\\s+a\\s+grandmaster", "fix": "delete"},
                 "(?i)chess(piece|board|\\s+pieces)?",
-                "(?i)the\\s+room\\s+(watches|listens|holds\\s+its\\s+breath)",
-                "(?i)the\\s+air\\s+(thickens|tightens)",
+                {"pattern": "(?i)the\\s+room\\s+(watches|listens|holds\\s+its\\s+breath)", "fix": "drop_clause"},
+                {"pattern": "(?i)the\\s+air\\s+(thickens|tightens)", "fix": "drop_clause"},
                 "(?i)(walls|ceiling|floor)\\s+(listen|witness|remember)",
                 "(?i)(light|shadow|darkness)\\s+(interrogates|judges|accuses)",
                 "(?i)the\\s+reader",
@@ -174,10 +220,58 @@ def create_workspace(workspace_root: Path):
     console.print(f"[green]✓[/green] Workspace ready: {workspace_root}")
 
 
+@contextmanager
+def _profiled(profile: bool, profile_json: str = None):
+    """Profile the lint rules run inside the block and print (or save) the results."""
+    if not profile and not profile_json:
+        yield
+        return
+
+    from rich.table import Table
+    from harness.lint.profile import profiling
+
+    with profiling() as profiler:
+        yield
+
+    if profile:
+        table = Table(title="Lint rule profile")
+        table.add_column("Rule", no_wrap=True)
+        table.add_column("Pattern", overflow="fold")
+        table.add_column("Calls", justify="right")
+        table.add_column("Hits", justify="right")
+        table.add_column("Time (ms)", justify="right")
+        table.add_column("%", justify="right")
+        total = profiler.total_seconds or 1.0
+        for stats in profiler.rows():
+            table.add_row(
+                stats.rule_id,
+                stats.label,
+                str(stats.calls),
+                str(stats.hits),
+                f"{stats.seconds * 1000:.2f}",
+                f"{stats.seconds / total * 100:.1f}",
+            )
+        console.print(table)
+        console.print(f"[yellow]Total rule time:[/yellow] {profiler.total_seconds * 1000:.1f} ms")
+    if profile_json:
+        profiler.write_json(Path(profile_json))
+        console.print(f"[green]✓[/green] Profile: {profile_json}")
+
+
+def profile_options(command):
+    """Add --profile and --profile-json to a command."""
+    command = click.option("--profile-json", type=click.Path(dir_okay=False), default=None,
+                           help="Write per-rule timings as JSON to this path")(command)
+    command = click.option("--profile", is_flag=True,
+                           help="Print wall time, calls and hits per lint rule")(command)
+    return command
+
+
 @click.group()
 def cli():
     """Writing Harness: CLI for continuity-enforced narrative writing."""
-    pass
+    # Rule and time-budget warnings from harness.lint go to stderr, never stdout.
+    logging.basicConfig(format="Warning: %(message)s", level=logging.WARNING, stream=sys.stderr)
 
 
 @cli.command()
@@ -195,6 +289,8 @@ def init():
 @click.option("--title", default="Untitled Scene", help="Scene title")
 def new_scene(title):
     """Create a new numbered scene file."""
+    from harness.pipelines.draft import load_continuity_ledger
+
     try:
         scenes_dir = settings.workspace_root / "scenes"
         scenes_dir.mkdir(exist_ok=True)
@@ -234,13 +330,31 @@ Tone: {ledger.tone_profile}
 @click.argument("scene_file", type=click.Path(exists=True))
 @click.option("--lore-k", default=8, help="Number of lore snippets to retrieve")
 @click.option("--no-lore", is_flag=True, help="Disable lore retrieval")
-def draft(scene_file, lore_k, no_lore):
+@click.option("--stream", is_flag=True, help="Lint while generating and stop early on too many errors")
+@click.option("--abort-after", type=click.IntRange(min=0), default=None,
+              help="With --stream, stop once more than this many errors appear (overrides lint.stream_abort)")
+@profile_options
+def draft(scene_file, lore_k, no_lore, stream, abort_after, profile, profile_json):
     """Generate a draft of a scene."""
+    from harness.pipelines.draft import draft_scene
+    from harness.ledger import workspace_history
+    from harness.lint.manuscript import scene_number
+
     try:
         scene_path = Path(scene_file)
         console.print(f"[blue]Drafting...[/blue]")
 
-        result = draft_scene(scene_path, settings.workspace_root, lore_k, use_lore=not no_lore)
+        with _profiled(profile, profile_json):
+            result = draft_scene(
+                scene_path,
+                settings.workspace_root,
+                lore_k,
+                use_lore=not no_lore,
+                stream=stream,
+                max_errors=abort_after,
+            )
+        if result.get("aborted"):
+            console.print("[red]Generation stopped early:[/red] error threshold exceeded; partial draft saved.")
 
         scene_num = scene_path.stem.split("_")[0]
         output_dir = settings.workspace_root / "outputs"
@@ -275,6 +389,10 @@ def draft(scene_file, lore_k, no_lore):
         console.print(f"[green]✓[/green] Draft: {draft_path}")
         console.print(f"[green]✓[/green] Style Lint: {style_report_path}")
         console.print(f"[green]✓[/green] Continuity Lint: {continuity_report_path}")
+        number = scene_number(scene_path)
+        if result.get("ledger") is not None and number is not None:
+            version = workspace_history(settings.workspace_root).record(number, result["ledger"])
+            console.print(f"[green]✓[/green] Ledger: scene {number} version {version}")
 
         style_count = len(result["style_violations"])
         continuity_count = len(result["continuity_violations"])
@@ -291,8 +409,13 @@ def draft(scene_file, lore_k, no_lore):
 @cli.command()
 @click.argument("draft_file", type=click.Path(exists=True))
 @click.option("--strict", is_flag=True, help="Fail if violations remain")
-def revise(draft_file, strict):
+@click.option("--autofix-first", is_flag=True,
+              help="Apply banned-phrase fixes first and only call the LLM for what remains")
+@profile_options
+def revise(draft_file, strict, autofix_first, profile, profile_json):
     """Revise a draft to fix violations."""
+    from harness.pipelines.revise import revise_draft
+
     try:
         draft_path = Path(draft_file)
 
@@ -300,7 +423,13 @@ def revise(draft_file, strict):
             draft_text = f.read()
 
         console.print("[blue]Revising...[/blue]")
-        result = revise_draft(draft_text, settings.workspace_root)
+        with _profiled(profile, profile_json):
+            result = revise_draft(draft_text, settings.workspace_root, autofix_first=autofix_first)
+
+        if autofix_first:
+            console.print(f"[green]✓[/green] Applied {len(result.get('autofixes', []))} autofixes")
+            if not result.get("provider_called", True):
+                console.print("[green]✓[/green] No violations left; skipped the LLM revision")
 
         scene_num = draft_path.stem.split("_")[0]
         output_dir = settings.workspace_root / "outputs"
@@ -342,49 +471,553 @@ def revise(draft_file, strict):
         raise click.Exit(1)
 
 
+def _print_file_report(report, show_path: bool = False):
+    """Print one file's violations in the lint command's format."""
+    if show_path:
+        console.print(f"\n[bold]{report.path}[/bold]")
+
+    if report.error:
+        console.print(f"  [red]Error:[/red] {report.error}")
+        return
+
+    if report.style:
+        console.print("\n[bold red]Style Violations:[/bold red]")
+        for v in report.style:
+            severity_color = "red" if v.severity == "error" else "yellow"
+            location = f"{v.line_number}:{v.column}" if v.column else f"{v.line_number}"
+            console.print(f"  [{severity_color}]{v.severity.upper()}[/{severity_color}] Line {location}: {v.message}")
+            if v.context:
+                console.print(f"    > {v.context}")
+
+    if report.continuity:
+        console.print("\n[bold red]Continuity Violations:[/bold red]")
+        for v in report.continuity:
+            severity_color = "red" if v.severity == "error" else "yellow"
+            console.print(f"  [{severity_color}]{v.severity.upper()}[/{severity_color}] {v.message}")
+            if v.context:
+                console.print(f"    > {v.context}")
+
+    if not report.total:
+        console.print("[green]No violations found.[/green]")
+    elif not show_path:
+        console.print(f"\n[yellow]Total violations:[/yellow] {report.total}")
+
+
+def _local_reports(paths, jobs, no_cache, select, ignore, fail_fast, stream):
+    """Lint paths in this process; a generator, so reports print as they finish."""
+    from harness.pipelines.draft import load_continuity_ledger
+    from harness.lint.ruleset import load_ruleset, select_rules
+    from harness.lint.cache import workspace_cache
+    from harness.lint.corpus import lint_file, lint_files
+
+    state_path = settings.workspace_root / "state.yaml"
+    ledger = load_continuity_ledger(state_path)
+
+    rules_path = settings.workspace_root / "style_rules.yaml"
+    banned_path = settings.workspace_root / "banned_phrases.yaml"
+    ruleset = select_rules(load_ruleset(banned_path, rules_path), select, ignore)
+    cache = None if no_cache else workspace_cache(settings.workspace_root)
+
+    if len(paths) == 1:
+        yield lint_file(paths[0], ruleset, ledger, cache, stream=stream, fail_fast=fail_fast)
+        return
+    yield from lint_files(paths, ruleset, ledger, jobs=jobs, cache=cache, stream=stream, fail_fast=fail_fast)
+
+
+# Seconds to wait on the daemon before linting locally instead, so a
+# wedged or overloaded daemon never stalls the command.
+DAEMON_TIMEOUT = 10.0
+
+
+def _daemon_client():
+    """A client for the workspace's daemon, found without loading settings unless they already are."""
+    root = settings.workspace_root if not isinstance(settings, _Lazy) or settings.loaded else configured_workspace_root()
+    return DaemonClient.connect(root, timeout=DAEMON_TIMEOUT)
+
+
+def _daemon_reports(client, paths, **options):
+    """Lint paths through a connected daemon; None if it cannot serve the request."""
+    by_name = {str(path.resolve()): path for path in paths}
+    try:
+        with client:
+            result = client.call("lint", {"paths": list(by_name), **options})
+    except (DaemonError, OSError, ValueError):
+        return None
+    # The violations are only printed, so they stay plain records rather
+    # than LintViolation models, which would mean importing pydantic.
+    return [
+        FileReport(
+            path=by_name.get(report["path"], Path(report["path"])),
+            style=[SimpleNamespace(**v) for v in report["style"]],
+            continuity=[SimpleNamespace(**v) for v in report["continuity"]],
+            error=report["error"],
+        )
+        for report in result["reports"]
+    ]
+
+
+def _print_watch_summary(reports, stamp=None):
+    style_count = sum(len(report.style) for report in reports)
+    continuity_count = sum(len(report.continuity) for report in reports)
+    prefix = f"[{stamp}] " if stamp else ""
+    console.print(
+        f"\n[yellow]{prefix}Linted {len(reports)} files:[/yellow] "
+        f"{style_count} style, {continuity_count} continuity in {sum(bool(report.total) for report in reports)} files"
+    )
+
+
+def _watch(targets, jobs, no_cache, select, ignore, stream):
+    """Lint the targets, then re-lint whatever changes until interrupted."""
+    if not targets:
+        targets = [str(path) for path in (settings.workspace_root / "scenes", settings.workspace_root / "outputs") if path.is_dir()]
+        if not targets:
+            console.print("[red]Error:[/red] Nothing to watch; run `harness init` or name targets")
+            raise click.Exit(1)
+    from harness.watch import InotifyWatcher, LintWatch, open_watcher
+
+    watcher = open_watcher()
+    try:
+        session = LintWatch(
+            settings.workspace_root, targets, jobs=jobs, no_cache=no_cache, select=select, ignore=ignore, stream=stream,
+        )
+        watched = session.start(watcher)
+        reports = session.lint(session.paths())
+        for report in reports:
+            _print_file_report(report, show_path=True)
+        _print_watch_summary(reports)
+        method = "inotify" if isinstance(watcher, InotifyWatcher) else "polling"
+        console.print(f"[green]Watching[/green] {', '.join(map(str, watched))} ({method}); Ctrl-C to stop")
+
+        for batch in session.batches(watcher):
+            stamp = datetime.now().strftime("%H:%M:%S")
+            if batch.error:
+                console.print(f"\n[red][{stamp}] Error:[/red] {batch.error}")
+            if batch.reloaded:
+                console.print(f"\n[cyan][{stamp}] Reloaded {', '.join(batch.reloaded)}; re-linting every file[/cyan]")
+            for path in batch.removed:
+                console.print(f"\n[{stamp}] Removed {path}")
+            for report in batch.reports:
+                _print_file_report(report, show_path=True)
+            if batch.reports:
+                _print_watch_summary(batch.reports, stamp)
+    except KeyboardInterrupt:
+        console.print("\n[green]✓[/green] Stopped watching")
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Exit(1)
+    finally:
+        watcher.close()
+
+
+def _rule_list(values):
+    """Selectors from repeated and/or comma-separated options; None when none were given."""
+    if not values:
+        return None
+    return [item.strip() for value in values for item in value.split(",") if item.strip()]
+
+
 @cli.command()
-@click.argument("text_file", type=click.Path(exists=True))
-def lint(text_file):
-    """Lint a text file for style and continuity violations."""
+@click.argument("targets", nargs=-1)
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=None,
+              help="Worker processes for multiple files (default: all CPUs)")
+@click.option("--no-cache", is_flag=True, help="Ignore and do not update workspace/.cache/lint")
+@click.option("--stream", is_flag=True,
+              help="Read files in paragraph chunks so memory stays flat on very large manuscripts")
+@click.option("--select", multiple=True,
+              help="Only run these rules: categories (style, continuity), groups or checks "
+                   "(banned, style:pov_and_address) or rule IDs (banned:3); overrides lint.select")
+@click.option("--ignore", multiple=True, help="Skip these rules, named as for --select; overrides lint.ignore")
+@click.option("--fail-fast", is_flag=True,
+              help="Run the cheapest checks first, stop at the first error and exit with status 1")
+@click.option("--no-daemon", is_flag=True, help="Lint in this process even if `harness daemon` is running")
+@click.option("--watch", is_flag=True,
+              help="Keep running and re-lint files as they change (default targets: workspace/scenes and outputs)")
+@profile_options
+def lint(targets, jobs, no_cache, stream, select, ignore, fail_fast, no_daemon, watch, profile, profile_json):
+    """Lint text files, directories or glob patterns for style and continuity violations."""
+    if fail_fast and stream:
+        raise click.UsageError("--fail-fast cannot be combined with --stream")
+    if watch:
+        if fail_fast:
+            raise click.UsageError("--fail-fast cannot be combined with --watch")
+        return _watch(targets, jobs, no_cache, _rule_list(select), _rule_list(ignore), stream)
+    if not targets:
+        raise click.UsageError("Missing argument 'TARGETS...'.")
+    client = None if (profile or profile_json or no_daemon) else _daemon_client()
     try:
-        text_path = Path(text_file)
+        paths = expand_targets(targets)
+        if not paths:
+            console.print(f"[red]Error:[/red] No files matched: {' '.join(targets)}")
+            raise click.Exit(1)
 
-        with open(text_path, "r") as f:
-            text = f.read()
+        options = dict(select=_rule_list(select), ignore=_rule_list(ignore), fail_fast=fail_fast, stream=stream)
+        reports = None
+        if client is not None:
+            reports = _daemon_reports(client, paths, jobs=jobs, no_cache=no_cache, **options)
+        if reports is None:
+            reports = _local_reports(paths, jobs=jobs, no_cache=no_cache, **options)
+
+        with _profiled(profile, profile_json):
+            if len(paths) == 1:
+                [report] = reports
+                if report.error:
+                    raise OSError(report.error)
+                _print_file_report(report)
+                if fail_fast and report.errors:
+                    raise click.Exit(1)
+                return
+
+            style_count = continuity_count = flagged = failed = linted = 0
+            stopped = None
+            started = time.perf_counter()
+            for report in reports:
+                _print_file_report(report, show_path=True)
+                style_count += len(report.style)
+                continuity_count += len(report.continuity)
+                flagged += bool(report.total)
+                failed += bool(report.error)
+                linted += 1
+                if fail_fast and report.errors:
+                    stopped = report.path
+            elapsed = time.perf_counter() - started
+
+            console.print(
+                f"\n[yellow]Linted {linted} files in {elapsed:.2f}s:[/yellow] "
+                f"{style_count} style, {continuity_count} continuity in {flagged} files"
+            )
+            if failed:
+                console.print(f"[red]{failed} files could not be read.[/red]")
+            if stopped is not None:
+                console.print(f"[red]Stopped at the first error, in {stopped}.[/red]")
+                raise click.Exit(1)
+    except click.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Exit(1)
+
+
+@cli.command()
+@click.argument("targets", nargs=-1, required=True)
+@click.option("--dry-run", is_flag=True, help="Show the fixes without writing files")
+def fix(targets, dry_run):
+    """Apply the fixes defined in banned_phrases.yaml to files, directories or glob patterns."""
+    from harness.pipelines.draft import load_continuity_ledger
+    from harness.lint.ruleset import load_ruleset
+    from harness.lint.cache import lint_text, workspace_cache
+    from harness.lint.autofix import apply_fixes
+
+    try:
+        paths = expand_targets(targets)
+        if not paths:
+            console.print(f"[red]Error:[/red] No files matched: {' '.join(targets)}")
+            raise click.Exit(1)
 
         state_path = settings.workspace_root / "state.yaml"
         ledger = load_continuity_ledger(state_path)
 
+        rules_path = settings.workspace_root / "style_rules.yaml"
         banned_path = settings.workspace_root / "banned_phrases.yaml"
-        banned = load_banned_phrases(banned_path)
+        ruleset = load_ruleset(banned_path, rules_path)
+        cache = workspace_cache(settings.workspace_root)
 
-        style_violations = lint_style(text, banned, scene_location=ledger.location_current)
-        continuity_violations = lint_continuity(text, ledger)
+        fixed_count = remaining_count = 0
+        for path in paths:
+            text = path.read_text()
+            result = apply_fixes(text, ruleset)
+            if len(paths) > 1:
+                console.print(f"\n[bold]{path}[/bold]")
+            for applied in result.applied:
+                after = f"'{applied.after}'" if applied.after else "(removed)"
+                console.print(f"  [green]FIX[/green] Line {applied.line_number}: '{applied.before.strip()}' → {after}")
+            if result.applied and not dry_run:
+                path.write_text(result.text)
 
-        if style_violations:
-            console.print("\n[bold red]Style Violations:[/bold red]")
-            for v in style_violations:
-                severity_color = "red" if v.severity == "error" else "yellow"
-                console.print(f"  [{severity_color}]{v.severity.upper()}[/{severity_color}] Line {v.line_number}: {v.message}")
-                if v.context:
-                    console.print(f"    > {v.context}")
+            style, continuity = lint_text(result.text, ruleset, ledger, cache)
+            fixed_count += len(result.applied)
+            remaining_count += len(style) + len(continuity)
 
-        if continuity_violations:
-            console.print("\n[bold red]Continuity Violations:[/bold red]")
-            for v in continuity_violations:
+        verb = "Would apply" if dry_run else "Applied"
+        console.print(
+            f"\n[yellow]{verb} {fixed_count} fixes in {len(paths)} files;[/yellow] "
+            f"{remaining_count} violations remain (use `harness revise` for those)"
+        )
+    except click.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Exit(1)
+
+
+@cli.group()
+def ledger():
+    """Record and inspect the continuity ledger each scene was written against."""
+
+
+@ledger.command()
+@click.argument("scene", type=click.IntRange(min=0))
+def record(scene):
+    """Record state.yaml as SCENE's ledger (`draft` does this for its scene)."""
+    from harness.pipelines.draft import load_continuity_ledger
+    from harness.ledger import workspace_history
+
+    try:
+        current = load_continuity_ledger(settings.workspace_root / "state.yaml")
+        version = workspace_history(settings.workspace_root).record(scene, current)
+        console.print(f"[green]✓[/green] Scene {scene}: ledger version {version}")
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Exit(1)
+
+
+@ledger.command()
+@click.argument("scene", type=click.IntRange(min=0))
+@click.option("--version", type=click.IntRange(min=1), default=None, help="Show this version instead of the latest")
+def show(scene, version):
+    """Print SCENE's recorded ledger as YAML."""
+    import yaml
+    from harness.ledger import workspace_history
+
+    found = workspace_history(settings.workspace_root).get(scene, version)
+    if found is None:
+        console.print(f"[red]Error:[/red] No ledger recorded for scene {scene}" + (f" version {version}" if version else ""))
+        raise click.Exit(1)
+    click.echo(yaml.safe_dump(found.model_dump(mode="json", exclude_none=True), sort_keys=False), nl=False)
+
+
+@ledger.command(name="log")
+def ledger_log():
+    """List every recorded ledger version, oldest first."""
+    from rich.table import Table
+    from harness.ledger import workspace_history
+
+    entries = workspace_history(settings.workspace_root).log()
+    if not entries:
+        console.print("[yellow]No ledgers recorded yet.[/yellow]")
+        return
+    table = Table()
+    table.add_column("Scene", justify="right")
+    table.add_column("Version", justify="right")
+    table.add_column("Recorded")
+    for scene, version, recorded in entries:
+        table.add_row(str(scene), str(version), recorded)
+    console.print(table)
+
+
+@cli.command()
+@click.argument("targets", nargs=-1)
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=None,
+              help="Scenes to check in parallel (default: one per CPU)")
+@click.option("--select", multiple=True, help="Only run these rules (as for `lint --select`)")
+@click.option("--ignore", multiple=True, help="Skip these rules (as for `lint --ignore`)")
+def continuity(targets, jobs, select, ignore):
+    """Check continuity across every scene with a recorded ledger.
+
+    Scene text comes from TARGETS (files, directories or glob patterns;
+    default: workspace/outputs), matched to ledgers by the number each
+    file name starts with; revised output is preferred over drafts.
+    """
+    from harness.ledger import workspace_history
+    from harness.lint.ruleset import load_ruleset, select_rules
+    from harness.lint.manuscript import check_manuscript, scene_texts
+
+    try:
+        ledgers = workspace_history(settings.workspace_root).latest()
+        if not ledgers:
+            console.print("[yellow]No ledgers recorded yet;[/yellow] run `harness ledger record SCENE` or `harness draft`.")
+            raise click.Exit(1)
+        output_dir = settings.workspace_root / "outputs"
+        paths = expand_targets(targets or ([str(output_dir)] if output_dir.is_dir() else []))
+        texts = scene_texts(paths)
+        rules_path = settings.workspace_root / "style_rules.yaml"
+        banned_path = settings.workspace_root / "banned_phrases.yaml"
+        ruleset = select_rules(load_ruleset(banned_path, rules_path), _rule_list(select), _rule_list(ignore))
+
+        started = time.perf_counter()
+        reports = check_manuscript(ledgers, texts, ruleset, jobs=jobs)
+        elapsed = time.perf_counter() - started
+
+        total = errors = 0
+        for report in reports:
+            label = f"Scene {report.scene}" + (f" ({report.path})" if report.path else " (no text)")
+            console.print(f"\n[bold]{label}[/bold]")
+            if report.error:
+                console.print(f"  [red]Error:[/red] {report.error}")
+                continue
+            if not report.violations:
+                console.print("[green]No violations found.[/green]")
+            for v in report.violations:
                 severity_color = "red" if v.severity == "error" else "yellow"
-                console.print(f"  [{severity_color}]{v.severity.upper()}[/{severity_color}] {v.message}")
+                location = f" Line {v.line_number}:" if v.line_number else ""
+                console.print(f"  [{severity_color}]{v.severity.upper()}[/{severity_color}]{location} {v.message}")
                 if v.context:
                     console.print(f"    > {v.context}")
+            total += len(report.violations)
+            errors += sum(1 for v in report.violations if v.severity == "error")
+
+        unrecorded = sorted(set(texts) - set(ledgers))
+        console.print(
+            f"\n[yellow]Checked {len(reports)} scenes in {elapsed:.2f}s:[/yellow] {total} continuity violations"
+        )
+        if unrecorded:
+            console.print(f"[yellow]No recorded ledger for scenes:[/yellow] {', '.join(map(str, unrecorded))}")
+        if errors:
+            raise click.Exit(1)
+    except click.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Exit(1)
+
+
+@cli.group(invoke_without_command=True)
+@click.option("--rebuild", is_flag=True, help="Re-index every file instead of only the changed ones")
+@click.pass_context
+def index(ctx, rebuild):
+    """Update the index of where ledger entities and lore titles are mentioned in scene files."""
+    if ctx.invoked_subcommand is not None:
+        return
+    from harness.index import update_workspace_index
+
+    try:
+        started = time.perf_counter()
+        entity_index, stats = update_workspace_index(settings.workspace_root, rebuild)
+        entity_index.close()
+        elapsed = time.perf_counter() - started
+        console.print(
+            f"[green]✓[/green] Indexed {stats.indexed} files ({stats.unchanged} unchanged, {stats.removed} removed) "
+            f"for {stats.entities} entities in {elapsed:.2f}s: {stats.postings} new mentions"
+        )
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Exit(1)
+
+
+@index.command()
+@click.argument("name")
+@click.option("--last", is_flag=True, help="Only show the last scene that mentions NAME")
+def query(name, last):
+    """Show where NAME (an entity or one of its aliases) is mentioned, by scene and line."""
+    from harness.index import update_workspace_index
+
+    entity_index, _ = update_workspace_index(settings.workspace_root)
+    with entity_index:
+        entities = entity_index.resolve(name)
+        if not entities:
+            console.print(f"[red]Error:[/red] '{name}' is not an indexed entity (see `harness index list`)")
+            raise click.Exit(1)
+        postings = entity_index.lookup(name)
+    label = ", ".join(f"{entity} ({kind})" for entity, kind in entities)
+    if not postings:
+        console.print(f"[yellow]{label}: no mentions.[/yellow]")
+        return
+    if last:
+        scene = max((p.scene for p in postings if p.scene is not None), default=None)
+        postings = [p for p in postings if p.scene == scene]
+    console.print(f"[bold]{label}[/bold]: {len(postings)} mentions")
+    lines = {}
+    for posting in postings:
+        lines.setdefault((posting.scene, posting.path), []).append(str(posting.line))
+    for (scene, path), numbers in lines.items():
+        prefix = f"Scene {scene}" if scene is not None else "No scene"
+        console.print(f"  {prefix}: {path} lines {', '.join(dict.fromkeys(numbers))}")
+
+
+@index.command(name="list")
+def list_entities():
+    """List indexed entities with their mention counts."""
+    from rich.table import Table
+    from harness.index import update_workspace_index
+
+    entity_index, _ = update_workspace_index(settings.workspace_root)
+    with entity_index:
+        rows = entity_index.counts()
+    table = Table()
+    table.add_column("Entity")
+    table.add_column("Kind")
+    table.add_column("Mentions", justify="right")
+    table.add_column("Files", justify="right")
+    for name, kind, mentions, files in rows:
+        table.add_row(name, kind, str(mentions), str(files))
+    console.print(table)
+
+
+@cli.command()
+@click.option("--debounce", type=click.FloatRange(min=0), default=0.3, show_default=True,  # harness.lsp.DEFAULT_DEBOUNCE
+              help="Seconds without edits before a document is re-linted")
+def lsp(debounce):
+    """Serve live lint diagnostics to editors over the Language Server Protocol on stdin/stdout."""
+    # stdout carries only protocol messages; anything else printed while
+    # serving goes to stderr.
+    from harness.lsp import LintLanguageServer
+
+    messages = sys.stdout.buffer
+    sys.stdout.flush()
+    sys.stdout = sys.stderr
+    server = LintLanguageServer(settings.workspace_root, sys.stdin.buffer, messages, debounce)
+    code = server.serve()
+    messages.flush()
+    # The reader thread may still be blocked on stdin, which a normal
+    # interpreter shutdown cannot finalize.
+    os._exit(code)
+
+
+@cli.group()
+def daemon():
+    """Keep rules, ledger and lore warm in a server that `harness lint` uses when it is running."""
+
 
-        if not style_violations and not continuity_violations:
-            console.print("[green]No violations found.[/green]")
-        else:
-            total = len(style_violations) + len(continuity_violations)
-            console.print(f"\n[yellow]Total violations:[/yellow] {total}")
+@daemon.command()
+def start():
+    """Serve lint, retrieve and prompt-build requests on the workspace socket until stopped."""
+    from harness.daemon import serve
+
+    try:
+        serve(
+            settings.workspace_root,
+            on_ready=lambda path: console.print(f"[green]✓[/green] Daemon listening on {path} (Ctrl-C to stop)"),
+        )
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         raise click.Exit(1)
+    console.print("[green]✓[/green] Daemon stopped")
+
+
+@daemon.command()
+def stop():
+    """Ask the workspace's daemon to exit."""
+    client = _daemon_client()
+    if client is None:
+        console.print("[yellow]No daemon is running.[/yellow]")
+        return
+    try:
+        with client:
+            client.call("shutdown")
+    except (DaemonError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Exit(1)
+    console.print("[green]✓[/green] Daemon stopping")
+
+
+@daemon.command()
+def status():
+    """Show whether the workspace's daemon is running."""
+    client = _daemon_client()
+    if client is None:
+        console.print("[yellow]No daemon is running.[/yellow]")
+        raise click.Exit(1)
+    try:
+        with client:
+            info = client.call("status")
+    except (DaemonError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Exit(1)
+    console.print(
+        f"[green]Daemon running[/green] (pid {info['pid']}, version {info['version']}) for {info['workspace']}: "
+        f"up {info['uptime_seconds']:.0f}s, {info['requests']} requests served"
+    )
 
 
 def main():
@@ -0,0 +1,162 @@
+"""Client for the lint daemon (see harness.daemon), using only the standard library.
+
+Importing this module is cheap, so editor hooks can run
+
+    python -m harness.client lint '{"paths": ["scene.md"]}'
+
+and get the daemon's JSON result in a few milliseconds; relative paths and
+scene_path are resolved against the current directory. The workspace is
+taken from --workspace, or from WORKSPACE_ROOT as harness.config reads it
+(environment, then .env) without importing pydantic.
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Unix socket paths are limited to about 104 bytes; longer ones go to the temp directory.
+MAX_SOCKET_PATH = 100
+
+DEFAULT_WORKSPACE = "./workspace"
+
+
+class DaemonError(Exception):
+    """A JSON-RPC error returned by the daemon."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def _env_file_value(env_file: Path, key: str) -> Optional[str]:
+    try:
+        lines = Path(env_file).read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    found = None
+    for line in lines:
+        line = line.strip()
+        if line.startswith("export "):
+            line = line[len("export "):].lstrip()
+        name, sep, value = line.partition("=")
+        if not sep or line.startswith("#") or name.strip().lower() != key:
+            continue
+        value = value.strip()
+        if value[:1] in ("'", '"') and value[-1:] == value[:1] and len(value) > 1:
+            value = value[1:-1]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        found = value
+    return found
+
+
+def configured_workspace_root(environ=None, env_file: Path = Path(".env")) -> Path:
+    """WORKSPACE_ROOT as harness.config resolves it (environment in any case, then .env), without pydantic."""
+    environ = os.environ if environ is None else environ
+    for name, value in environ.items():
+        if name.lower() == "workspace_root":
+            return Path(value)
+    value = _env_file_value(env_file, "workspace_root")
+    return Path(value if value is not None else DEFAULT_WORKSPACE)
+
+
+def socket_path(workspace_root: Path) -> Path:
+    """Where the daemon for a workspace listens: workspace/.cache/daemon.sock, or a temp path if that is too long."""
+    root = Path(workspace_root).resolve()
+    path = root / ".cache" / "daemon.sock"
+    if len(str(path)) <= MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"harness-{digest}.sock"
+
+
+class DaemonClient:
+    """One connection to a running daemon; call() sends a request and waits for its response."""
+
+    def __init__(self, workspace_root: Path, timeout: Optional[float] = None):
+        self.workspace_root = Path(workspace_root).resolve()
+        self._ids = itertools.count(1)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(str(socket_path(self.workspace_root)))
+        except OSError:
+            self._socket.close()
+            raise
+        self._reader = self._socket.makefile("r", encoding="utf-8")
+
+    @classmethod
+    def connect(cls, workspace_root: Path, timeout: Optional[float] = None) -> Optional["DaemonClient"]:
+        """A client for the workspace's daemon, or None when none is running."""
+        if not socket_path(workspace_root).exists():
+            return None
+        try:
+            return cls(workspace_root, timeout)
+        except OSError:
+            return None
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        request = {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params or {}}
+        request["params"].setdefault("workspace", str(self.workspace_root))
+        self._socket.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("daemon closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise DaemonError(response["error"]["code"], response["error"]["message"])
+        return response["result"]
+
+    def close(self):
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _absolute_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """params with relative paths and scene_path resolved against the current directory, as the daemon requires."""
+    params = dict(params)
+    if isinstance(params.get("paths"), list):
+        params["paths"] = [os.path.abspath(path) for path in params["paths"]]
+    if isinstance(params.get("scene_path"), str):
+        params["scene_path"] = os.path.abspath(params["scene_path"])
+    return params
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Send one request to the harness daemon and print its JSON result.")
+    parser.add_argument("method", help="lint, lint_text, retrieve, build_prompt, status or shutdown")
+    parser.add_argument("params", nargs="?", default="{}", help="JSON object of parameters")
+    parser.add_argument("--workspace", default=None, help="Workspace directory (default: WORKSPACE_ROOT)")
+    args = parser.parse_args(argv)
+    workspace = Path(args.workspace) if args.workspace else configured_workspace_root()
+
+    client = DaemonClient.connect(workspace)
+    if client is None:
+        print(f"No daemon is running for {workspace} (start one with `harness daemon start`)", file=sys.stderr)
+        return 2
+    with client:
+        try:
+            result = client.call(args.method, _absolute_params(json.loads(args.params)))
+        except DaemonError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    json.dump(result, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
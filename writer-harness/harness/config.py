@@ -12,6 +12,7 @@ class Settings(BaseSettings):
     model_name: str = "claude-3-5-sonnet-20241022"
     max_tokens: int = 4000
     workspace_root: Path = Path("./workspace")
+    lint_cache_max_bytes: int = 64 * 1024 * 1024
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,339 @@
+"""Long-running lint daemon that keeps a workspace's rules, ledger and lore warm.
+
+The daemon listens on a Unix socket (see harness.client.socket_path) and
+speaks JSON-RPC 2.0, one JSON object per line in each direction. A
+connection may carry any number of requests. Each connection is read on
+its own thread, so a client that holds one open does not block others,
+but requests are handled one at a time on the main thread, which keeps
+regex time budgets enforced.
+
+Methods (every params object may also carry "workspace", which must be
+the daemon's):
+
+- lint: paths (absolute), select, ignore, fail_fast, stream, no_cache, jobs
+  -> {"reports": [{"path", "style", "continuity", "error"}]}
+- lint_text: text, select, ignore, fail_fast -> {"style", "continuity"}
+- retrieve: text or keywords, top_k -> {"snippets"}
+- build_prompt: scene_path (absolute) or seed_text, lore_k, use_lore -> {"prompt"}
+- status -> {"version", "workspace", "pid", "uptime_seconds", "requests"}
+- shutdown -> {"stopping": true}
+"""
+import inspect
+import json
+import os
+import queue
+import signal
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from harness import __version__
+from harness.client import DaemonClient, socket_path
+from harness.models import ContinuityLedger, LintViolation, StyleRules
+from harness.lint.cache import lint_text, workspace_cache
+from harness.lint.corpus import FileReport, lint_files
+from harness.lint.rules import load_style_rules
+from harness.lint.ruleset import RuleSet, load_ruleset, select_rules
+from harness.lore.ingest import load_lore_entries
+from harness.lore.retrieve import extract_keywords, retrieve_lore
+from harness.pipelines.draft import build_scene_prompt, extract_seed_text, load_continuity_ledger
+
+# JSON-RPC 2.0 error codes; -32000 and below are this daemon's own.
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+WRONG_WORKSPACE = -32001
+
+LORE_SUFFIXES = (".md", ".txt")
+
+
+class RequestError(Exception):
+    """A request the daemon rejects with a JSON-RPC error code."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def _stat(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class WorkspaceState:
+    """A workspace's ledger, style rules, rule set and lore, reloaded only when their files change."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.cache = workspace_cache(root)
+        self._loaded: Dict[str, Tuple[Any, Any]] = {}
+
+    def _get(self, name: str, signature: Any, load: Callable[[], Any]) -> Any:
+        entry = self._loaded.get(name)
+        if entry is None or entry[0] != signature:
+            entry = (signature, load())
+            self._loaded[name] = entry
+        return entry[1]
+
+    def ledger(self) -> ContinuityLedger:
+        path = self.root / "state.yaml"
+        return self._get("ledger", _stat(path), lambda: load_continuity_ledger(path))
+
+    def style_rules(self) -> StyleRules:
+        path = self.root / "style_rules.yaml"
+        return self._get("style_rules", _stat(path), lambda: load_style_rules(path))
+
+    def ruleset(self) -> RuleSet:
+        banned_path = self.root / "banned_phrases.yaml"
+        rules_path = self.root / "style_rules.yaml"
+        return self._get(
+            "ruleset",
+            (_stat(banned_path), _stat(rules_path)),
+            lambda: load_ruleset(banned_path, rules_path),
+        )
+
+    def lore_entries(self) -> List[Tuple[str, str]]:
+        lore_dir = self.root / "lore"
+        files = sorted(path for path in lore_dir.glob("*") if path.suffix in LORE_SUFFIXES) if lore_dir.exists() else []
+        signature = tuple((path.name, _stat(path)) for path in files)
+        return self._get("lore", signature, lambda: load_lore_entries(lore_dir))
+
+
+def _violations(violations: List[LintViolation]) -> List[dict]:
+    return [v.model_dump() for v in violations]
+
+
+def _report(report: FileReport) -> dict:
+    return {
+        "path": str(report.path),
+        "style": _violations(report.style),
+        "continuity": _violations(report.continuity),
+        "error": report.error,
+    }
+
+
+def _absolute(path: str) -> Path:
+    if not os.path.isabs(path):
+        raise RequestError(INVALID_PARAMS, f"path must be absolute: {path}")
+    return Path(path)
+
+
+class LintDaemon:
+    """Dispatches JSON-RPC requests against one workspace's warm state."""
+
+    def __init__(self, workspace_root: Path):
+        self.workspace_root = Path(workspace_root).resolve()
+        self.state = WorkspaceState(self.workspace_root)
+        self.started = time.monotonic()
+        self.requests = 0
+        self.stopping = False
+        self.methods: Dict[str, Callable[..., Any]] = {
+            "lint": self.lint,
+            "lint_text": self.lint_text,
+            "retrieve": self.retrieve,
+            "build_prompt": self.build_prompt,
+            "status": self.status,
+            "shutdown": self.shutdown,
+        }
+
+    def _ruleset(self, select: Optional[List[str]], ignore: Optional[List[str]]) -> RuleSet:
+        return select_rules(self.state.ruleset(), select, ignore)
+
+    def lint(
+        self,
+        paths: List[str],
+        select: Optional[List[str]] = None,
+        ignore: Optional[List[str]] = None,
+        fail_fast: bool = False,
+        stream: bool = False,
+        no_cache: bool = False,
+        jobs: Optional[int] = 1,
+    ) -> dict:
+        reports = lint_files(
+            [_absolute(path) for path in paths],
+            self._ruleset(select, ignore),
+            self.state.ledger(),
+            jobs=jobs,
+            cache=None if no_cache else self.state.cache,
+            stream=stream,
+            fail_fast=fail_fast,
+        )
+        return {"reports": [_report(report) for report in reports]}
+
+    def lint_text(
+        self,
+        text: str,
+        select: Optional[List[str]] = None,
+        ignore: Optional[List[str]] = None,
+        fail_fast: bool = False,
+    ) -> dict:
+        style, continuity = lint_text(text, self._ruleset(select, ignore), self.state.ledger(), self.state.cache, fail_fast)
+        return {"style": _violations(style), "continuity": _violations(continuity)}
+
+    def retrieve(self, text: str = "", keywords: Optional[List[str]] = None, top_k: int = 8) -> dict:
+        if keywords is None:
+            keywords = extract_keywords(text)
+        snippets = retrieve_lore(keywords, self.workspace_root / "lore", top_k=top_k, entries=self.state.lore_entries())
+        return {"snippets": snippets}
+
+    def build_prompt(
+        self,
+        scene_path: Optional[str] = None,
+        seed_text: Optional[str] = None,
+        lore_k: int = 8,
+        use_lore: bool = True,
+    ) -> dict:
+        if seed_text is None:
+            if scene_path is None:
+                raise RequestError(INVALID_PARAMS, "scene_path or seed_text is required")
+            seed_text = extract_seed_text(_absolute(scene_path).read_text())
+        prompt = build_scene_prompt(
+            seed_text,
+            self.state.ledger(),
+            self.state.style_rules(),
+            self.workspace_root / "lore",
+            lore_k,
+            use_lore,
+            lore_entries=self.state.lore_entries() if use_lore else None,
+        )
+        return {"prompt": prompt}
+
+    def status(self) -> dict:
+        return {
+            "version": __version__,
+            "workspace": str(self.workspace_root),
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.monotonic() - self.started, 3),
+            "requests": self.requests,
+        }
+
+    def shutdown(self) -> dict:
+        self.stopping = True
+        return {"stopping": True}
+
+    def _dispatch(self, request: Any) -> Any:
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            raise RequestError(INVALID_REQUEST, "expected an object with a method")
+        method = self.methods.get(request["method"])
+        if method is None:
+            raise RequestError(METHOD_NOT_FOUND, f"unknown method: {request['method']}")
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            raise RequestError(INVALID_PARAMS, "params must be an object")
+        params = dict(params)
+        workspace = params.pop("workspace", None)
+        if workspace is not None and Path(workspace).resolve() != self.workspace_root:
+            raise RequestError(WRONG_WORKSPACE, f"this daemon serves {self.workspace_root}")
+        try:
+            inspect.signature(method).bind(**params)
+        except TypeError as e:
+            raise RequestError(INVALID_PARAMS, str(e))
+        return method(**params)
+
+    def respond(self, line: bytes) -> dict:
+        """Handle one request line and return the response object."""
+        self.requests += 1
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                raise RequestError(PARSE_ERROR, str(e))
+            if isinstance(request, dict):
+                request_id = request.get("id")
+            result = self._dispatch(request)
+        except RequestError as e:
+            return {"jsonrpc": "2.0", "id": request_id, "error": {"code": e.code, "message": str(e)}}
+        except Exception as e:
+            return {"jsonrpc": "2.0", "id": request_id, "error": {"code": INTERNAL_ERROR, "message": f"{type(e).__name__}: {e}"}}
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+class _Request:
+    """A request line passed from a connection's thread to the main thread, and its response."""
+
+    def __init__(self, line: bytes):
+        self.line = line
+        self.response: Optional[dict] = None
+        self.answered = threading.Event()
+        self.sent = threading.Event()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            if self.server.lint_daemon.stopping:
+                break
+            request = _Request(line)
+            self.server.requests.put(request)
+            request.answered.wait()
+            try:
+                self.wfile.write(json.dumps(request.response).encode("utf-8") + b"\n")
+            finally:
+                request.sent.set()
+            if self.server.lint_daemon.stopping:
+                break
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _terminate(signum, frame):
+    raise SystemExit(0)
+
+
+def serve(workspace_root: Path, on_ready: Optional[Callable[[Path], None]] = None):
+    """Serve the workspace's daemon until a shutdown request, SIGTERM or Ctrl-C.
+
+    A stale socket left by a daemon that did not exit cleanly is replaced;
+    a live one raises RuntimeError. The socket is removed on exit.
+    """
+    path = socket_path(workspace_root)
+    if path.exists():
+        client = DaemonClient.connect(workspace_root)
+        if client is not None:
+            client.close()
+            raise RuntimeError(f"A daemon is already running on {path}")
+        path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    daemon = LintDaemon(workspace_root)
+    server = _Server(str(path), _Handler)
+    server.lint_daemon = daemon
+    server.requests = queue.Queue()
+    listener = threading.Thread(target=server.serve_forever, name="harness-daemon", daemon=True)
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _terminate)
+    try:
+        if on_ready is not None:
+            on_ready(path)
+        listener.start()
+        while not daemon.stopping:
+            try:
+                request = server.requests.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            request.response = daemon.respond(request.line)
+            request.answered.set()
+        # New clients find no socket while the shutdown answer is sent.
+        path.unlink(missing_ok=True)
+        request.sent.wait(timeout=5)
+    finally:
+        if listener.is_alive():
+            server.shutdown()
+        server.server_close()
+        path.unlink(missing_ok=True)
+        while not server.requests.empty():
+            request = server.requests.get()
+            request.response = {"jsonrpc": "2.0", "id": None, "error": {"code": INTERNAL_ERROR, "message": "daemon is stopping"}}
+            request.answered.set()
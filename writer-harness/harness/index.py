@@ -0,0 +1,278 @@
+"""Inverted index of ledger entities across a workspace's scene files.
+
+Entities are the characters (who_present, with character_aliases),
+objects (devices_and_objects_in_scene) and locations named by state.yaml
+and every recorded scene ledger, plus the lore titles. Each is mapped to
+the (file, line, column) of its mentions in workspace/outputs and
+workspace/scenes, in a SQLite database at workspace/.cache/index.sqlite.
+
+Updates are incremental: a file whose mtime and size are unchanged is
+skipped, one whose content hash is unchanged only has its stats updated,
+and only changed files are re-read, with every entity matched in one pass
+through a MentionCounter. A change to the entity list itself re-indexes
+every file.
+"""
+import hashlib
+import json
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from harness.models import ContinuityLedger
+from harness.ledger import workspace_history
+from harness.lint.cache import file_digest
+from harness.lint.continuity import MentionCounter, location_levels
+from harness.lint.corpus import expand_targets
+from harness.lint.document import DocumentAnalysis
+from harness.lint.manuscript import scene_number
+from harness.lore.ingest import load_lore_entries
+from harness.pipelines.draft import load_continuity_ledger
+
+# Entity kinds, in the order one wins when two sources name the same entity.
+KINDS = ("character", "location", "object", "lore")
+# who_present entries that are pronouns rather than names.
+PRONOUNS = {"he", "she", "they", "i", "you", "we", "him", "her", "them"}
+# "Novo-Ogaryovo — private salon": the whole name and each part count as mentions.
+LOCATION_PARTS = re.compile(r"\s+[—–-]\s+|,\s*")
+# "Water carafe and glass on low table (full)": each noun phrase and its last word count as mentions.
+OBJECT_PARTS = re.compile(r"\s*\(.*?\)\s*|,\s*|\s+(?:and|or|on|in|at|with|by|under|beside|next to)\s+", re.IGNORECASE)
+DETERMINERS = re.compile(r"^(?:a|an|the|his|her|their|its|my|your|our|some)\s+", re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, scene INTEGER,
+    mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entities (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL, kind TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS forms (form TEXT NOT NULL, entity INTEGER NOT NULL, PRIMARY KEY (form, entity));
+CREATE TABLE IF NOT EXISTS postings (entity INTEGER NOT NULL, file INTEGER NOT NULL, line INTEGER NOT NULL, col INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS postings_entity ON postings (entity, file, line);
+CREATE INDEX IF NOT EXISTS postings_file ON postings (file);
+"""
+
+# name -> (kind, other names that count as a mention)
+Entities = Dict[str, Tuple[str, List[str]]]
+
+
+class Posting(NamedTuple):
+    scene: Optional[int]
+    path: str
+    line: int
+    column: int
+
+
+@dataclass
+class IndexStats:
+    """What one update did."""
+
+    indexed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    postings: int = 0
+    entities: int = 0
+    rebuilt: bool = False
+
+
+def ledger_entities(ledger: ContinuityLedger) -> Entities:
+    """The characters, location(s) and objects a ledger names."""
+    entities: Entities = {}
+    for character in ledger.who_present:
+        name = re.sub(r"\s*\(.*?\)", "", character).strip()
+        if name and name.lower() not in PRONOUNS:
+            entities[name] = ("character", list(ledger.character_aliases.get(character, [])))
+    aliases = {place.lower(): names for place, names in ledger.location_aliases.items()}
+    for location in (ledger.location_current, ledger.location_previous):
+        if location and location.strip().lower() != "unknown":
+            parts = [part for part in LOCATION_PARTS.split(location) if part]
+            if location == ledger.location_current:
+                parts += location_levels(ledger)
+            parts += [alias for part in [location, *parts] for alias in aliases.get(part.lower(), ())]
+            entities.setdefault(location, ("location", [part for part in dict.fromkeys(parts) if part != location]))
+    for item in ledger.devices_and_objects_in_scene:
+        entities.setdefault(item, ("object", object_aliases(item)))
+    return entities
+
+
+def object_aliases(item: str) -> List[str]:
+    """The noun phrases in an object description, and the last word of each."""
+    aliases: List[str] = []
+    for part in OBJECT_PARTS.split(item):
+        phrase = DETERMINERS.sub("", part.strip())
+        for alias in (phrase, phrase.split()[-1] if phrase else ""):
+            if alias and alias != item and alias not in aliases:
+                aliases.append(alias)
+    return aliases
+
+
+def merge_entities(sources: Iterable[Entities]) -> Entities:
+    """One entity list, with aliases merged and the kind earliest in KINDS kept for a name."""
+    merged: Entities = {}
+    for entities in sources:
+        for name, (kind, aliases) in entities.items():
+            if name in merged:
+                known_kind, known = merged[name]
+                kind = min(kind, known_kind, key=KINDS.index)
+                aliases = known + [alias for alias in aliases if alias not in known]
+            merged[name] = (kind, aliases)
+    return dict(sorted(merged.items()))
+
+
+def workspace_entities(workspace_root: Path) -> Entities:
+    """Entities from state.yaml, every scene's latest recorded ledger and the lore titles."""
+    root = Path(workspace_root)
+    ledgers = [load_continuity_ledger(root / "state.yaml"), *workspace_history(root).latest().values()]
+    lore = {title.replace("_", " ").replace("-", " "): ("lore", []) for title, _ in load_lore_entries(root / "lore")}
+    return merge_entities([*(ledger_entities(ledger) for ledger in ledgers), lore])
+
+
+def index_targets(workspace_root: Path) -> List[Path]:
+    """The scene texts the index covers: workspace/outputs and workspace/scenes, without lint reports."""
+    root = Path(workspace_root)
+    targets = [str(root / name) for name in ("outputs", "scenes") if (root / name).is_dir()]
+    return [path for path in expand_targets(targets) if not path.stem.endswith("_lint")]
+
+
+def _entities_digest(entities: Entities) -> str:
+    return hashlib.sha256(json.dumps(entities, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class EntityIndex:
+    """The SQLite-backed inverted index of one workspace."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _set_entities(self, entities: Entities):
+        self.db.execute("DELETE FROM postings")
+        self.db.execute("DELETE FROM files")
+        self.db.execute("DELETE FROM forms")
+        self.db.execute("DELETE FROM entities")
+        self.db.executemany("INSERT INTO entities (id, name, kind) VALUES (?, ?, ?)",
+                            [(i, name, kind) for i, (name, (kind, _)) in enumerate(entities.items())])
+        forms = {(form.lower(), i) for i, (name, (_, aliases)) in enumerate(entities.items()) for form in (name, *aliases)}
+        self.db.executemany("INSERT INTO forms (form, entity) VALUES (?, ?)", sorted(forms))
+        self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('entities', ?)", (_entities_digest(entities),))
+
+    def update(self, paths: List[Path], entities: Entities, rebuild: bool = False) -> IndexStats:
+        """Bring the index up to date with paths (dropping files no longer among them) and entities."""
+        stats = IndexStats(entities=len(entities))
+        counter = MentionCounter({name: aliases for name, (_, aliases) in entities.items()})
+        ids = {name: i for i, name in enumerate(entities)}
+        with self.db:
+            known = self.db.execute("SELECT value FROM meta WHERE key = 'entities'").fetchone()
+            if rebuild or known is None or known[0] != _entities_digest(entities):
+                self._set_entities(entities)
+                stats.rebuilt = True
+
+            files = {path: (file_id, mtime_ns, size, digest) for file_id, path, mtime_ns, size, digest
+                     in self.db.execute("SELECT id, path, mtime_ns, size, digest FROM files")}
+            wanted = {str(path.resolve()): path for path in paths}
+            for path in sorted(set(files) - set(wanted)):
+                self.db.execute("DELETE FROM postings WHERE file = ?", (files[path][0],))
+                self.db.execute("DELETE FROM files WHERE id = ?", (files[path][0],))
+                stats.removed += 1
+
+            for key, path in wanted.items():
+                try:
+                    stat = path.stat()
+                    if key in files and files[key][1:3] == (stat.st_mtime_ns, stat.st_size):
+                        stats.unchanged += 1
+                        continue
+                    digest = file_digest(path)
+                    if key in files and files[key][3] == digest:
+                        self.db.execute("UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                                        (stat.st_mtime_ns, stat.st_size, files[key][0]))
+                        stats.unchanged += 1
+                        continue
+                    with open(path, "r") as f:
+                        text = f.read()
+                except (OSError, UnicodeDecodeError):
+                    continue
+                if key in files:
+                    file_id = files[key][0]
+                    self.db.execute("DELETE FROM postings WHERE file = ?", (file_id,))
+                    self.db.execute("UPDATE files SET scene = ?, mtime_ns = ?, size = ?, digest = ? WHERE id = ?",
+                                    (scene_number(path), stat.st_mtime_ns, stat.st_size, digest, file_id))
+                else:
+                    file_id = self.db.execute(
+                        "INSERT INTO files (path, scene, mtime_ns, size, digest) VALUES (?, ?, ?, ?, ?)",
+                        (key, scene_number(path), stat.st_mtime_ns, stat.st_size, digest),
+                    ).lastrowid
+                postings = self._postings(text, counter, ids, file_id)
+                self.db.executemany("INSERT INTO postings (entity, file, line, col) VALUES (?, ?, ?, ?)", postings)
+                stats.indexed += 1
+                stats.postings += len(postings)
+        return stats
+
+    @staticmethod
+    def _postings(text: str, counter: MentionCounter, ids: Dict[str, int], file_id: int) -> List[Tuple[int, int, int, int]]:
+        if counter.regex is None:
+            return []
+        doc = DocumentAnalysis(text)
+        postings = []
+        for match in counter.regex.finditer(doc.lower):
+            # Lowercasing can lengthen the text ("İ"), so map back before locating.
+            line, column = doc.index.position(doc.unlower(*match.span())[0])
+            postings.extend((ids[name], file_id, line, column) for name in counter.credited(match.group()))
+        return postings
+
+    def resolve(self, name: str) -> List[Tuple[str, str]]:
+        """(name, kind) of each entity that name is, or is an alias of."""
+        return self.db.execute(
+            "SELECT entities.name, entities.kind FROM forms JOIN entities ON entities.id = forms.entity "
+            "WHERE form = ? ORDER BY entities.name",
+            (name.lower(),),
+        ).fetchall()
+
+    def lookup(self, name: str) -> List[Posting]:
+        """Every mention of the entities name resolves to, in scene, file and line order."""
+        rows = self.db.execute(
+            "SELECT DISTINCT files.scene, files.path, postings.line, postings.col FROM forms "
+            "JOIN postings ON postings.entity = forms.entity JOIN files ON files.id = postings.file "
+            "WHERE forms.form = ? ORDER BY files.scene IS NULL, files.scene, files.path, postings.line, postings.col",
+            (name.lower(),),
+        )
+        return [Posting(*row) for row in rows]
+
+    def last_scene(self, name: str) -> Optional[int]:
+        """The highest-numbered scene that mentions the entities name resolves to."""
+        row = self.db.execute(
+            "SELECT MAX(files.scene) FROM forms JOIN postings ON postings.entity = forms.entity "
+            "JOIN files ON files.id = postings.file WHERE forms.form = ?",
+            (name.lower(),),
+        ).fetchone()
+        return row[0]
+
+    def counts(self) -> List[Tuple[str, str, int, int]]:
+        """(name, kind, mentions, files) for every entity."""
+        return self.db.execute(
+            "SELECT entities.name, entities.kind, COUNT(postings.entity), COUNT(DISTINCT postings.file) FROM entities "
+            "LEFT JOIN postings ON postings.entity = entities.id GROUP BY entities.id ORDER BY entities.name"
+        ).fetchall()
+
+
+def workspace_index(workspace_root: Path) -> EntityIndex:
+    """The entity index for a workspace, at workspace/.cache/index.sqlite."""
+    return EntityIndex(Path(workspace_root) / ".cache" / "index.sqlite")
+
+
+def update_workspace_index(workspace_root: Path, rebuild: bool = False) -> Tuple[EntityIndex, IndexStats]:
+    """Open the workspace's index and bring it up to date; the caller closes it."""
+    index = workspace_index(workspace_root)
+    stats = index.update(index_targets(workspace_root), workspace_entities(workspace_root), rebuild)
+    return index, stats
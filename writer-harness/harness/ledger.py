@@ -0,0 +1,193 @@
+"""Append-only history of the continuity ledger each scene was written against.
+
+Versions live in workspace/ledger/history.jsonl, one JSON object per line
+and never rewritten. Most entries hold only the top-level fields that
+changed since the entry before them ({"set": {...}, "unset": [...]});
+every SNAPSHOT_EVERY-th entry holds the whole ledger, so any version is
+rebuilt from at most that many entries. index.json maps each entry to its
+byte offset and to the snapshot it replays from. It is rewritten after
+every append and rebuilt from the log when it lags behind it. Appends hold
+an exclusive lock on the log (where fcntl exists), so concurrent recorders
+each see the others' entries.
+"""
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from harness.models import ContinuityLedger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+SNAPSHOT_EVERY = 16
+
+# Index entries: (scene, version, offset, snapshot offset).
+Entry = Tuple[int, int, int, int]
+
+
+def _diff(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    changed = {key: value for key, value in after.items() if key not in before or before[key] != value}
+    return {"set": changed, "unset": sorted(key for key in before if key not in after)}
+
+
+def _apply(state: Dict[str, Any], diff: Dict[str, Any]) -> Dict[str, Any]:
+    state = dict(state)
+    for key in diff.get("unset", []):
+        state.pop(key, None)
+    state.update(diff.get("set", {}))
+    return state
+
+
+class LedgerHistory:
+    """Versioned per-scene ledgers under one directory (workspace/ledger)."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.log_path = self.directory / "history.jsonl"
+        self.index_path = self.directory / "index.json"
+        self._entries: List[Entry] = []
+        self._size = 0
+        # (log size, state of the final entry), so record() need not replay it.
+        self._last: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+            self._entries = [tuple(entry) for entry in data["entries"]]
+            self._size = data["size"]
+        except (OSError, ValueError, KeyError, TypeError):
+            self._entries, self._size = [], 0
+        log_size = self.log_path.stat().st_size if self.log_path.exists() else 0
+        if log_size < self._size:
+            self._entries, self._size = [], 0
+        if log_size != self._size:
+            self._scan_from(self._size)
+            self._write_index()
+
+    def _scan_from(self, offset: int):
+        """Index the entries appended after offset (after a crash between append and index write)."""
+        snapshot = self._entries[-1][3] if self._entries else 0
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            for line in iter(f.readline, b""):
+                if not line.endswith(b"\n"):
+                    break  # a torn final write; the next append starts over it
+                record = json.loads(line)
+                if "snapshot" in record:
+                    snapshot = offset
+                self._entries.append((record["scene"], record["version"], offset, snapshot))
+                offset += len(line)
+        self._size = offset
+
+    def _write_index(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"size": self._size, "entries": self._entries}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _records(self, start: int, stop: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """(offset, record) for the log entries from offset start up to and including offset stop."""
+        with open(self.log_path, "rb") as f:
+            f.seek(start)
+            offset = start
+            while offset <= stop:
+                line = f.readline()
+                if not line:
+                    return
+                yield offset, json.loads(line)
+                offset += len(line)
+
+    def _state_at(self, entry: Entry) -> Dict[str, Any]:
+        state: Dict[str, Any] = {}
+        for _, record in self._records(entry[3], entry[2]):
+            state = record["snapshot"] if "snapshot" in record else _apply(state, record["diff"])
+        return state
+
+    def scenes(self) -> List[int]:
+        """Scene numbers with at least one recorded version, ascending."""
+        return sorted({scene for scene, _, _, _ in self._entries})
+
+    def versions(self, scene: int) -> int:
+        return sum(1 for entry in self._entries if entry[0] == scene)
+
+    def get(self, scene: int, version: Optional[int] = None) -> Optional[ContinuityLedger]:
+        """A scene's ledger at a version (default: its latest), or None if it was never recorded."""
+        matches = [entry for entry in self._entries if entry[0] == scene and (version is None or entry[1] == version)]
+        if not matches:
+            return None
+        return ContinuityLedger(**self._state_at(matches[-1]))
+
+    def latest(self) -> Dict[int, ContinuityLedger]:
+        """Every scene's latest ledger, from one pass over the log."""
+        final = {scene: offset for scene, _, offset, _ in self._entries}
+        wanted = set(final.values())
+        ledgers: Dict[int, ContinuityLedger] = {}
+        if not self._entries:
+            return ledgers
+        state: Dict[str, Any] = {}
+        for offset, record in self._records(0, self._entries[-1][2]):
+            state = record["snapshot"] if "snapshot" in record else _apply(state, record["diff"])
+            if offset in wanted:
+                ledgers[record["scene"]] = ContinuityLedger(**state)
+        return dict(sorted(ledgers.items()))
+
+    def log(self) -> List[Tuple[int, int, str]]:
+        """(scene, version, recorded) for every entry, oldest first."""
+        if not self._entries:
+            return []
+        return [
+            (record["scene"], record["version"], record.get("recorded", ""))
+            for _, record in self._records(0, self._entries[-1][2])
+        ]
+
+    @contextmanager
+    def _locked(self):
+        """The log opened for appending, exclusively locked until the block exits."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield f  # closing the file releases the lock
+
+    def record(self, scene: int, ledger: ContinuityLedger) -> int:
+        """Append ledger as scene's next version and return it; an unchanged ledger is not appended."""
+        state = ledger.model_dump(mode="json")
+        with self._locked() as f:
+            # Another process may have appended since this history was loaded.
+            self._load_index()
+            previous = [entry for entry in self._entries if entry[0] == scene]
+            if previous and self._state_at(previous[-1]) == state:
+                return previous[-1][1]
+
+            last = None
+            if self._entries:
+                last = self._last[1] if self._last and self._last[0] == self._size else self._state_at(self._entries[-1])
+            version = len(previous) + 1
+            record: Dict[str, Any] = {"scene": scene, "version": version, "recorded": datetime.now().isoformat(timespec="seconds")}
+            if last is None or len(self._entries) % SNAPSHOT_EVERY == 0:
+                record["snapshot"] = state
+            else:
+                record["diff"] = _diff(last, state)
+
+            line = (json.dumps(record) + "\n").encode("utf-8")
+            f.truncate(self._size)  # drop a torn final write
+            f.write(line)
+            f.flush()
+            snapshot = self._size if "snapshot" in record else self._entries[-1][3]
+            self._entries.append((scene, version, self._size, snapshot))
+            self._size += len(line)
+            self._last = (self._size, state)
+            self._write_index()
+        return version
+
+
+def workspace_history(workspace_root: Path) -> LedgerHistory:
+    return LedgerHistory(Path(workspace_root) / "ledger")
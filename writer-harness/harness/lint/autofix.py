@@ -0,0 +1,190 @@
+"""Deterministic fixes for banned and warned phrases that carry a fix spec."""
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import List, Match, Optional, Tuple
+
+from harness.lint.document import DocumentAnalysis
+from harness.lint.ruleset import RuleSet
+
+CLAUSE_MARKS = ",;:—–"
+SENTENCE_MARKS = ".!?"
+CLOSING = "\"'”’)]"
+OPENING = "\"'“‘(["
+# Double quotes, which DocumentAnalysis.dialogue pairs; fixes never split a pair.
+QUOTES = "\"“”"
+# Marks a deletion can strand: "Suddenly, he left" must not become ", he left".
+STRANDED_MARKS = ",;:"
+# A sentence start: the beginning of the text or a line, or a sentence end and
+# whitespace, optionally followed by an opening quote or bracket.
+SENTENCE_START = re.compile(r"(?:^|[.!?][\"'”’)\]]*)[^\S\n]*[\"'“‘(\[]?$", re.MULTILINE)
+
+_NO_MARKS = str.maketrans("", "", STRANDED_MARKS)
+
+# (start, end, replacement, capitalize the character after end)
+Edit = Tuple[int, int, str, bool]
+
+
+@dataclass
+class AppliedFix:
+    """One rewrite made by apply_fixes, with the line it was on in the input."""
+
+    rule_id: str
+    line_number: int
+    before: str
+    after: str
+
+
+@dataclass
+class FixResult:
+    text: str
+    applied: List[AppliedFix] = field(default_factory=list)
+
+
+def _at_sentence_start(text: str, offset: int) -> bool:
+    line_start = text.rfind("\n", 0, offset) + 1
+    return bool(SENTENCE_START.search(text, line_start, offset))
+
+
+def _at_clause_start(text: str, offset: int) -> bool:
+    before = text[:offset].rstrip(" \t")
+    return not before or before[-1] in CLAUSE_MARKS + "\n" or _at_sentence_start(text, offset)
+
+
+def _clause_span(text: str, start: int, end: int) -> Optional[Tuple[int, int]]:
+    """Span to remove to drop the clause (or whole sentence) containing text[start:end].
+
+    None when a quote mark bounds the clause: it is speech or a dialogue
+    tag, and dropping it would break the quoting.
+    """
+    stops = CLAUSE_MARKS + SENTENCE_MARKS + QUOTES + "\n"
+    left = start
+    while left > 0 and text[left - 1] not in stops:
+        left -= 1
+    right = end
+    while right < len(text) and text[right] not in stops:
+        right += 1
+    left_mark = text[left - 1] if left > 0 else None
+    right_mark = text[right] if right < len(text) else None
+    if any(mark is not None and mark in QUOTES for mark in (left_mark, right_mark)):
+        return None
+
+    if left_mark is not None and left_mark in CLAUSE_MARKS:
+        # ", and she realizes it" -> drop from the preceding mark; keep what ends the clause.
+        return left - 1, right
+
+    while left < start and text[left] in " \t":
+        left += 1
+    if right_mark is not None and right_mark in CLAUSE_MARKS:
+        # The opening clause of a sentence: drop it with its mark.
+        return left, right + 1
+
+    # The clause is the whole sentence.
+    while right < len(text) and text[right] in SENTENCE_MARKS + CLOSING:
+        right += 1
+    return left, right
+
+
+def _breaks_quotes(doc: DocumentAnalysis, start: int, end: int, replacement: str) -> bool:
+    """Whether replacing text[start:end] would drop a quote mark without its partner or empty a quote."""
+    text = doc.text
+    spans = doc.dialogue
+    # Quoted spans overlapping the edit: those starting before end that end after start.
+    position = bisect_left(spans, (end,)) - 1
+    while position >= 0 and spans[position][1] > start:
+        opening, closing = spans[position]
+        position -= 1
+        if start <= opening and closing <= end:
+            continue  # the whole quote goes
+        closed = closing - 1 > opening and text[closing - 1] in QUOTES
+        if start <= opening < end or (closed and start <= closing - 1 < end):
+            return True
+        inside = text[opening + 1:start] + replacement + text[end:closing - 1 if closed else closing]
+        if not any(char.isalnum() for char in inside):
+            return True
+    return False
+
+
+def _edit(doc: DocumentAnalysis, rule, match: Match) -> Optional[Edit]:
+    text = doc.text
+    fix = rule.fix
+    start, end = match.span()
+    if fix.action == "replace":
+        replacement = match.expand(fix.replacement)
+        if replacement[:1].islower() and match.group(0)[:1].isupper():
+            replacement = replacement[0].upper() + replacement[1:]
+    else:
+        replacement = ""
+        if fix.action == "drop_clause":
+            span = _clause_span(text, start, end)
+            if span is None:
+                return None
+            start, end = span
+
+    if start == end and not replacement:
+        return None
+
+    if replacement:
+        if _breaks_quotes(doc, start, end, replacement):
+            return None
+        return start, end, replacement, False
+
+    # A phrase deleted from the start of a sentence or clause takes its mark with it.
+    if fix.action == "delete" and end < len(text) and text[end] in STRANDED_MARKS and _at_clause_start(text, start):
+        end += 1
+    # Absorb the whitespace the removal would leave doubled or before punctuation.
+    while end < len(text) and text[end] in " \t" and (start == 0 or text[start - 1] in " \t\n" + OPENING):
+        end += 1
+    while start > 0 and text[start - 1] in " \t" and (end == len(text) or text[end] in " \t\n" + CLAUSE_MARKS + SENTENCE_MARKS):
+        start -= 1
+    # A line that is emptied entirely goes with its line break.
+    if (start == 0 or text[start - 1] == "\n") and end < len(text) and text[end] == "\n":
+        end += 1
+    # Leave edits that would break dialogue quoting to the LLM rewrite.
+    if _breaks_quotes(doc, start, end, replacement):
+        return None
+    # Capitalize what now starts the sentence.
+    capitalize = end < len(text) and text[end].islower() and _at_sentence_start(text, start)
+    return start, end, replacement, capitalize
+
+
+def apply_fixes(text: str, ruleset: RuleSet) -> FixResult:
+    """Apply every rule fix to text in one pass.
+
+    All matches of rules with a fix spec are rewritten, not only the first
+    per line. Edits are planned against the input and applied together;
+    where two overlap, the one starting first (then the earlier rule) wins
+    and the other is left for the linter to report. So is any fix that
+    would split a pair of double quotes or leave a quote empty.
+    """
+    doc = DocumentAnalysis(text)
+    edits: List[Tuple[int, int, str, bool, str, int]] = []
+    for order, rule in enumerate(rule for rule in ruleset.rules if rule.fix is not None):
+        for match in rule.regex.finditer(text):
+            edit = _edit(doc, rule, match)
+            if edit is not None:
+                edits.append((*edit, rule.rule_id, order))
+
+    edits.sort(key=lambda edit: (edit[0], edit[5], edit[1]))
+    index = doc.index
+    applied: List[AppliedFix] = []
+    parts: List[str] = []
+    position = 0
+    deleted = False
+    for start, end, replacement, capitalize, rule_id, _ in edits:
+        if start < position:
+            continue
+        gap = text[position:start]
+        if deleted and not replacement and gap and not gap.strip(STRANDED_MARKS + " \t"):
+            # Marks between two deleted phrases ("very, very") go with them.
+            gap = gap.translate(_NO_MARKS)
+        parts.append(gap)
+        parts.append(replacement)
+        applied.append(AppliedFix(rule_id, index.line_of(start), text[start:end], replacement))
+        position = end
+        deleted = not replacement
+        if capitalize:
+            parts.append(text[end].upper())
+            position += 1
+    parts.append(text[position:])
+    return FixResult("".join(parts), applied)
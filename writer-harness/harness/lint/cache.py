@@ -0,0 +1,166 @@
+"""On-disk cache of lint results for unchanged text."""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from harness import __version__
+from harness.config import settings
+from harness.models import ContinuityLedger, LintViolation
+from harness.lint.document import DocumentAnalysis
+from harness.lint.ruleset import RuleSet
+from harness.lint.style import lint_style
+from harness.lint.continuity import lint_continuity
+from harness.lint.schedule import lint_fail_fast
+from harness.lint.profile import active_profiler
+
+Results = Tuple[List[LintViolation], List[LintViolation]]
+
+
+def _sha256(data: str) -> str:
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class LintCache:
+    """Serialized (style, continuity) violation lists, one JSON file per key.
+
+    Entries live under root/<key[:2]>/<key>.json. A hit touches the file's
+    mtime, and when the cache grows past max_bytes the least recently used
+    entries are removed until it is back under 90% of the budget.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None
+
+    @staticmethod
+    def key(text: str, ruleset: RuleSet, ledger: ContinuityLedger) -> str:
+        """Hash of the text, the rule set digest and the ledger (plus harness version)."""
+        return LintCache.key_for_digest(_sha256(text), ruleset, ledger)
+
+    @staticmethod
+    def key_for_digest(text_digest: str, ruleset: RuleSet, ledger: ContinuityLedger) -> str:
+        """key() for a text known only by its sha256 hex digest (see file_digest)."""
+        return _sha256("\0".join([
+            __version__,
+            text_digest,
+            ruleset.digest,
+            _sha256(ledger.model_dump_json()),
+        ]))
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Results]:
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return (
+            [LintViolation(**v) for v in data["style"]],
+            [LintViolation(**v) for v in data["continuity"]],
+        )
+
+    def put(self, key: str, style: List[LintViolation], continuity: List[LintViolation]):
+        path = self._path(key)
+        payload = json.dumps({
+            "style": [v.model_dump() for v in style],
+            "continuity": [v.model_dump() for v in continuity],
+        })
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += len(payload)
+        if self._size > self.max_bytes:
+            self.evict(int(self.max_bytes * 0.9))
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """Total bytes of all entries on disk."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, target_bytes: int):
+        """Remove least recently used entries until the cache is at most target_bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[0])
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= target_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._size = total
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of a file's text as open() decodes it, read line by line."""
+    digest = hashlib.sha256()
+    with open(path, "r") as f:
+        for line in f:
+            digest.update(line.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def workspace_cache(workspace_root: Path) -> LintCache:
+    """The lint cache for a workspace, at workspace/.cache/lint."""
+    return LintCache(Path(workspace_root) / ".cache" / "lint", settings.lint_cache_max_bytes)
+
+
+def lint_text(
+    text: str,
+    ruleset: RuleSet,
+    ledger: ContinuityLedger,
+    cache: Optional[LintCache] = None,
+    fail_fast: bool = False,
+) -> Results:
+    """Style and continuity violations for text, served from cache when unchanged.
+
+    The cache is bypassed while profiling so that every rule is measured.
+    With fail_fast the checks run cheapest first and stop at the first
+    error (see lint_fail_fast); results cut short that way are not cached.
+    """
+    if active_profiler() is not None:
+        cache = None
+    key = None
+    if cache is not None:
+        key = cache.key(text, ruleset, ledger)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    doc = DocumentAnalysis(text)
+    if fail_fast:
+        style, continuity = lint_fail_fast(doc, ruleset, ledger)
+        if any(v.severity == "error" for v in style + continuity):
+            return style, continuity
+    else:
+        style = lint_style(doc, ruleset, scene_location=ledger.location_current)
+        continuity = lint_continuity(doc, ledger, ruleset)
+    if cache is not None:
+        cache.put(key, style, continuity)
+    return style, continuity
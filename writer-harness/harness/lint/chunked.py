@@ -0,0 +1,155 @@
+"""Lint files of any size in bounded memory, paragraph chunk by paragraph chunk."""
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from harness.models import ContinuityLedger, LintViolation
+from harness.lint.document import DocumentAnalysis
+from harness.lint.ruleset import RuleSet
+from harness.lint.style import (
+    DIALOGUE_EXPOSITION,
+    REGEX_GROUPS,
+    DialogueRuns,
+    _assemble,
+    _object_anthropomorphism,
+    _pov_and_address,
+    _scan_groups,
+)
+from harness.lint.continuity import (
+    LOCATION_CHANGE,
+    TIMELINE,
+    WHO_PRESENT,
+    _timeline,
+    character_counter,
+    character_missing,
+    location_counter,
+    location_missing,
+)
+from harness.lint.incremental import _shift
+from harness.lint.profile import record
+from harness.lint.violation import cap_per_rule, to_models
+
+# Target chunk size in characters; chunks end at a blank line once this is reached.
+CHUNK_CHARS = 64 * 1024
+# A paragraph that runs past this many chunk sizes is split at a line break.
+MAX_CHUNK_FACTOR = 16
+
+
+def read_chunks(lines: Iterable[str], chunk_chars: int = CHUNK_CHARS) -> Iterator[str]:
+    """Group lines (with their line endings) into chunks that end after a blank line.
+
+    A chunk only ends mid-paragraph when a single paragraph grows past
+    MAX_CHUNK_FACTOR * chunk_chars, so memory stays bounded even then.
+    """
+    chunk: List[str] = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_chars and (not line.strip() or size >= chunk_chars * MAX_CHUNK_FACTOR):
+            yield "".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield "".join(chunk)
+
+
+def lint_chunks(chunks: Iterable[str], ruleset: RuleSet, ledger: ContinuityLedger) -> Iterator[LintViolation]:
+    """Yield style and continuity violations for text arriving in line-aligned chunks.
+
+    Each chunk is analysed on its own and its violations are shifted to
+    whole-text lines and offsets before they are yielded. State that spans
+    chunks is kept small: the open dialogue run, whether the current
+    location has been mentioned, which present characters have not, and
+    the text length, and a per-rule count when a cap is configured. Those
+    continuity checks are decided, and their violations yielded, once the
+    last chunk is done.
+
+    The results match lint_style and lint_continuity except for matches
+    that span a chunk boundary (a blank line, or a line break inside an
+    oversized paragraph), which are not reported.
+    """
+    dialogue_enabled = ruleset.enabled(DIALOGUE_EXPOSITION)
+    location_enabled = ruleset.enabled(LOCATION_CHANGE, "continuity")
+    timeline_enabled = ruleset.enabled(TIMELINE, "continuity")
+    runs = DialogueRuns()
+    location = location_counter(ledger).regex
+    location_seen = False
+    counter = character_counter(ledger)
+    unmentioned: List[str] = []
+    if ruleset.enabled(WHO_PRESENT, "continuity"):
+        unmentioned = list(counter.names)
+    limit = ruleset.lint_config.max_violations_per_rule
+    counts: Dict[str, int] = {}
+    lines = 0
+    offset = 0
+    ends_with_break = False
+
+    for chunk in chunks:
+        doc = DocumentAnalysis(chunk)
+
+        by_group = {
+            group: cap_per_rule(violations, limit, counts)
+            for group, violations in _scan_groups(doc, ruleset, *REGEX_GROUPS).items()
+        }
+        style = _assemble(
+            by_group,
+            cap_per_rule(_pov_and_address(doc, ruleset), limit, counts),
+            cap_per_rule(_object_anthropomorphism(doc, ruleset), limit, counts),
+            [],
+        )
+        yield from to_models(_shift(style, lines, offset))
+
+        if dialogue_enabled:
+            # The dialogue run may continue from the previous chunk, so it is fed whole-text positions.
+            started = perf_counter()
+            dialogue = []
+            line_start = doc.index.line_start
+            line_end = doc.index.line_end
+            for line_num, line in enumerate(doc.lines, 1):
+                if line_num == len(doc.index) and not line:
+                    # The empty remainder after the chunk's final line break.
+                    break
+                violation = runs.feed(line_num + lines, line, line_start(line_num) + offset, line_end(line_num) + offset)
+                if violation is not None:
+                    dialogue.append(violation)
+            record(DIALOGUE_EXPOSITION, "dialogue blocks over 10 lines", started, len(dialogue))
+            yield from to_models(cap_per_rule(dialogue, limit, counts))
+
+        location_seen = location_seen or location is None or location.search(doc.lower) is not None
+        if unmentioned:
+            mentions = counter.counts(doc.lower)
+            unmentioned = [character for character in unmentioned if not mentions[character]]
+
+        if timeline_enabled:
+            yield from to_models(_shift(_timeline(doc, ledger), lines, offset))
+
+        lines += chunk.count("\n")
+        offset += len(chunk)
+        ends_with_break = chunk.endswith("\n")
+
+    if dialogue_enabled and ends_with_break:
+        # The text's last line is the empty one after its final line break.
+        violation = runs.feed(lines + 1, "", offset, offset)
+        if violation is not None:
+            yield from to_models(cap_per_rule([violation], limit, counts))
+
+    if location_enabled and not location_seen and offset > 100:
+        yield location_missing(ledger).to_model()
+    for character in unmentioned:
+        yield character_missing(character).to_model()
+
+
+def lint_path(path: Path, ruleset: RuleSet, ledger: ContinuityLedger, chunk_chars: int = CHUNK_CHARS) -> Iterator[LintViolation]:
+    """Lint a file through a buffered line reader without holding its whole text."""
+    with open(path, "r") as f:
+        yield from lint_chunks(read_chunks(f, chunk_chars), ruleset, ledger)
+
+
+def split_categories(violations: Iterable[LintViolation]) -> Tuple[List[LintViolation], List[LintViolation]]:
+    """Collect (style, continuity) lists from a violation stream."""
+    style: List[LintViolation] = []
+    continuity: List[LintViolation] = []
+    for v in violations:
+        (continuity if v.category == "continuity" else style).append(v)
+    return style, continuity
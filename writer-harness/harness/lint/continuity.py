@@ -1,98 +1,205 @@
 import re
-from typing import List
+from collections import Counter
+from functools import lru_cache
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 from harness.models import LintViolation, ContinuityLedger
+from harness.lint.document import DocumentAnalysis, analyze
+from harness.lint.durations import durations, parse_duration
+from harness.lint.literals import _trie_pattern
+from harness.lint.ruleset import RuleSet, get_ruleset
+from harness.lint.profile import record
+from harness.lint.violation import Violation, to_models
+
+
+# who_present entries that stand for unnamed roles rather than characters.
+UNNAMED_ROLES = ["aide", "assistant", "staff", "attendant"]
+
+# Rule IDs of the continuity checks.
+LOCATION_CHANGE = "continuity:location_change"
+WHO_PRESENT = "continuity:who_present"
+TIMELINE = "continuity:timeline"
+
+
+def location_missing(ledger: ContinuityLedger) -> Violation:
+    return Violation(
+        LOCATION_CHANGE,
+        "continuity",
+        "warning",
+        f"Current location '{ledger.location_current}' not mentioned in text",
+        context="Confirm scene is still in this location",
+    )
 
 
-def lint_location_change(text: str, ledger: ContinuityLedger) -> List[LintViolation]:
-    """Check for location changes without explicit travel."""
-    violations = []
+def named_present(ledger: ContinuityLedger) -> List[str]:
+    """The who_present entries that are checked for mentions."""
+    return [character for character in ledger.who_present if character.lower() not in UNNAMED_ROLES]
 
-    lines = text.split('\n')
-    location_mentioned = any(
-        ledger.location_current.lower() in line.lower()
-        for line in lines
-    )
 
-    if not location_mentioned and len(text) > 100:
-        violations.append(
-            LintViolation(
-                category="continuity",
-                severity="warning",
-                message=f"Current location '{ledger.location_current}' not mentioned in text",
-                context="Confirm scene is still in this location",
-            )
-        )
+class MentionCounter:
+    """Count whole-word mentions of many names, each with aliases, in one pass over lowercased text.
 
-    return violations
+    Every name and alias is compiled into a single trie-shaped regex, so
+    the text is scanned once however many characters a ledger lists. A
+    match also counts for each name or alias found as a whole word inside
+    it, so "Anna" is still counted within "Anna Karenina", as it would be
+    if each name were searched for on its own.
+    """
 
+    def __init__(self, forms: Dict[str, Iterable[str]]):
+        self.names = list(forms)
+        owners: Dict[str, Set[str]] = {}
+        for name, aliases in forms.items():
+            for form in (name, *aliases):
+                if form.strip():
+                    owners.setdefault(form.lower(), set()).add(name)
+        self._credits: Dict[str, List[str]] = {}
+        for key in owners:
+            credited = set(owners[key])
+            for other in owners:
+                if len(other) < len(key) and other in key and re.search(rf'\b{re.escape(other)}\b', key):
+                    credited |= owners[other]
+            self._credits[key] = [name for name in self.names if name in credited]
+        self.regex = re.compile(rf'\b(?:{_trie_pattern(sorted(owners))})\b') if owners else None
 
-def lint_who_present(text: str, ledger: ContinuityLedger) -> List[LintViolation]:
-    """Check that characters from who_present list appear."""
-    violations = []
+    def counts(self, lower: str) -> Dict[str, int]:
+        """Mentions of each name, through any of its forms, in already lowercased text."""
+        counts = dict.fromkeys(self.names, 0)
+        if self.regex is not None:
+            for key, found in Counter(self.regex.findall(lower)).items():
+                for name in self._credits[key]:
+                    counts[name] += found
+        return counts
 
-    text_lower = text.lower()
+    def credited(self, match: str) -> List[str]:
+        """The names a matched (lowercased) form counts for."""
+        return self._credits.get(match, [])
 
-    for character in ledger.who_present:
-        char_lower = character.lower()
-        if char_lower in ["aide", "assistant", "staff", "attendant"]:
-            continue
 
-        count = len(re.findall(rf'\b{re.escape(char_lower)}\b', text_lower))
+@lru_cache(maxsize=32)
+def _mention_counter(forms: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> MentionCounter:
+    return MentionCounter(dict(forms))
 
-        if count == 0:
-            violations.append(
-                LintViolation(
-                    category="continuity",
-                    severity="warning",
-                    message=f"Character '{character}' supposed present but not mentioned",
-                    context="Check if character should still be in scene",
-                )
-            )
 
-    return violations
+def character_counter(ledger: ContinuityLedger) -> MentionCounter:
+    """The compiled counter for the ledger's named characters and their character_aliases."""
+    aliases = ledger.character_aliases
+    return _mention_counter(tuple((character, tuple(aliases.get(character, ()))) for character in named_present(ledger)))
 
 
-def lint_timeline(text: str, ledger: ContinuityLedger) -> List[LintViolation]:
-    """Check for timeline inconsistencies."""
-    violations = []
+def mention_counts(text: Union[str, DocumentAnalysis], ledger: ContinuityLedger) -> Dict[str, int]:
+    """How often each named who_present character is mentioned, by name or alias."""
+    return character_counter(ledger).counts(analyze(text).lower)
+
+
+# Separators between the levels of a location_current like "Estate — wing > room".
+LOCATION_LEVELS = re.compile(r"\s+[—–>]\s+")
+
+
+def location_levels(ledger: ContinuityLedger) -> List[str]:
+    """The places enclosing the scene, outermost first: location_hierarchy, or location_current split into levels."""
+    if ledger.location_hierarchy:
+        return list(ledger.location_hierarchy)
+    return [level for level in LOCATION_LEVELS.split(ledger.location_current.strip()) if level]
+
+
+def location_counter(ledger: ContinuityLedger) -> MentionCounter:
+    """The compiled matcher for location_current, its innermost level and that level's location_aliases.
+
+    A mention of an enclosing level alone (the estate, for a scene set in
+    one of its rooms) does not count.
+    """
+    levels = location_levels(ledger)
+    aliases = {place.lower(): names for place, names in ledger.location_aliases.items()}
+    places = [ledger.location_current] + levels[-1:]
+    forms = places + [alias for place in places for alias in aliases.get(place.lower(), ())]
+    forms = [form.strip(" \t.,;:!?()[]'\"") for form in forms]
+    return _mention_counter(((ledger.location_current, tuple(dict.fromkeys(form for form in forms if form))),))
+
 
-    elapsed_match = re.search(
-        r'(\d+)\s+(?:minutes?|hours?|days?)',
-        ledger.elapsed_time_since_last_scene,
-        re.IGNORECASE
+def location_mentioned(text: Union[str, DocumentAnalysis], ledger: ContinuityLedger) -> bool:
+    """Whether the text names the scene's location at its own level, by name or alias."""
+    regex = location_counter(ledger).regex
+    return regex is None or regex.search(analyze(text).lower) is not None
+
+
+def character_missing(character: str) -> Violation:
+    return Violation(
+        WHO_PRESENT,
+        "continuity",
+        "warning",
+        f"Character '{character}' supposed present but not mentioned",
+        context="Check if character should still be in scene",
     )
 
-    if elapsed_match:
-        elapsed_value = int(elapsed_match.group(1))
-
-        time_refs = re.findall(
-            r'(\d+)\s+(?:minutes?|hours?|days?)',
-            text,
-            re.IGNORECASE
-        )
-
-        for time_str in time_refs:
-            try:
-                ref_value = int(time_str)
-                if ref_value > elapsed_value * 3:
-                    violations.append(
-                        LintViolation(
-                            category="continuity",
-                            severity="warning",
-                            message=f"Time reference ({time_str}) may exceed elapsed time",
-                            context=f"Elapsed: {ledger.elapsed_time_since_last_scene}",
-                        )
+
+def lint_location_change(text: Union[str, DocumentAnalysis], ledger: ContinuityLedger) -> List[LintViolation]:
+    """Check for location changes without explicit travel."""
+    started = perf_counter()
+    doc = analyze(text)
+    violations = []
+
+    if not location_mentioned(doc, ledger) and len(doc.text) > 100:
+        violations.append(location_missing(ledger))
+
+    record(LOCATION_CHANGE, ledger.location_current, started, len(violations))
+    return to_models(violations)
+
+
+def lint_who_present(text: Union[str, DocumentAnalysis], ledger: ContinuityLedger) -> List[LintViolation]:
+    """Check that characters from who_present list appear."""
+    started = perf_counter()
+    counts = mention_counts(text, ledger)
+    violations = [character_missing(character) for character, count in counts.items() if count == 0]
+    record(WHO_PRESENT, ", ".join(counts), started, len(violations))
+    return to_models(violations)
+
+
+def _timeline(doc: DocumentAnalysis, ledger: ContinuityLedger) -> List[Violation]:
+    started = perf_counter()
+    violations = []
+
+    elapsed = parse_duration(ledger.elapsed_time_since_last_scene)
+    if elapsed is not None:
+        for start, end, seconds in durations(doc.text):
+            if seconds > elapsed * 3:
+                line_num, column = doc.index.position(start)
+                violations.append(
+                    Violation(
+                        TIMELINE,
+                        "continuity",
+                        "warning",
+                        f"Time reference ({doc.text[start:end]}) may exceed elapsed time",
+                        line_num,
+                        f"Elapsed: {ledger.elapsed_time_since_last_scene}",
+                        column,
+                        start,
+                        end,
                     )
-            except ValueError:
-                pass
+                )
 
+    record(TIMELINE, ledger.elapsed_time_since_last_scene, started, len(violations))
     return violations
 
 
-def lint_continuity(text: str, ledger: ContinuityLedger) -> List[LintViolation]:
-    """Run all continuity checks."""
+def lint_timeline(text: Union[str, DocumentAnalysis], ledger: ContinuityLedger) -> List[LintViolation]:
+    """Check for timeline inconsistencies."""
+    return to_models(_timeline(analyze(text), ledger))
+
+
+def lint_continuity(
+    text: Union[str, DocumentAnalysis],
+    ledger: ContinuityLedger,
+    ruleset: Optional[RuleSet] = None,
+) -> List[LintViolation]:
+    """Run all continuity checks (those the rule set's select/ignore lists enable)."""
+    doc = analyze(text)
+    enabled = get_ruleset(ruleset).enabled
     violations = []
-    violations.extend(lint_location_change(text, ledger))
-    violations.extend(lint_who_present(text, ledger))
-    violations.extend(lint_timeline(text, ledger))
+    if enabled(LOCATION_CHANGE, "continuity"):
+        violations.extend(lint_location_change(doc, ledger))
+    if enabled(WHO_PRESENT, "continuity"):
+        violations.extend(lint_who_present(doc, ledger))
+    if enabled(TIMELINE, "continuity"):
+        violations.extend(lint_timeline(doc, ledger))
     return violations
@@ -0,0 +1,160 @@
+"""Lint many files at once, optionally across a pool of worker processes."""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from harness.models import BannedPhrases, ContinuityLedger, LintConfig
+from harness.lint.ruleset import RuleSet, compile_ruleset
+from harness.lint.cache import LintCache, file_digest, lint_text
+from harness.lint.chunked import lint_path, split_categories
+from harness.lint.profile import active_profiler
+from harness.lint.targets import TEXT_SUFFIXES, FileReport, expand_targets
+
+
+def _read_text(path: Path) -> str:
+    with open(path, "r") as f:
+        return f.read()
+
+
+def _cache_key(path: Path, ruleset: RuleSet, ledger: ContinuityLedger, cache: LintCache, stream: bool) -> str:
+    if stream:
+        return cache.key_for_digest(file_digest(path), ruleset, ledger)
+    return cache.key(_read_text(path), ruleset, ledger)
+
+
+def _lint_file_streaming(
+    path: Path,
+    ruleset: RuleSet,
+    ledger: ContinuityLedger,
+    cache: Optional[LintCache],
+) -> FileReport:
+    if active_profiler() is not None:
+        cache = None
+    try:
+        key = None
+        if cache is not None:
+            key = _cache_key(path, ruleset, ledger, cache, stream=True)
+            cached = cache.get(key)
+            if cached is not None:
+                return FileReport(path=path, style=cached[0], continuity=cached[1])
+        style, continuity = split_categories(lint_path(path, ruleset, ledger))
+    except (OSError, UnicodeDecodeError) as e:
+        return FileReport(path=path, error=str(e))
+
+    if cache is not None:
+        cache.put(key, style, continuity)
+    return FileReport(path=path, style=style, continuity=continuity)
+
+
+def lint_file(
+    path: Path,
+    ruleset: RuleSet,
+    ledger: ContinuityLedger,
+    cache: Optional[LintCache] = None,
+    stream: bool = False,
+    fail_fast: bool = False,
+) -> FileReport:
+    """Run style and continuity checks on one file.
+
+    With stream=True the file is read and linted in paragraph chunks (see
+    harness.lint.chunked), so memory does not grow with the file size.
+    With fail_fast=True the checks stop at the first error (see
+    lint_text); the two cannot be combined.
+    """
+    if stream and fail_fast:
+        raise ValueError("fail_fast cannot be combined with stream")
+    if stream:
+        return _lint_file_streaming(path, ruleset, ledger, cache)
+
+    try:
+        text = _read_text(path)
+    except (OSError, UnicodeDecodeError) as e:
+        return FileReport(path=path, error=str(e))
+
+    style, continuity = lint_text(text, ruleset, ledger, cache, fail_fast)
+    return FileReport(path=path, style=style, continuity=continuity)
+
+
+# Per-process state for pool workers, set once by _init_worker.
+_worker: Optional[Tuple[RuleSet, ContinuityLedger, bool]] = None
+
+
+def _init_worker(banned_phrases: BannedPhrases, lint_config: LintConfig, ledger: ContinuityLedger, stream: bool = False):
+    global _worker
+    _worker = (compile_ruleset(banned_phrases, lint_config), ledger, stream)
+
+
+def _lint_in_worker(path: Path) -> FileReport:
+    ruleset, ledger, stream = _worker
+    return lint_file(path, ruleset, ledger, stream=stream)
+
+
+def lint_files(
+    paths: List[Path],
+    ruleset: RuleSet,
+    ledger: ContinuityLedger,
+    jobs: Optional[int] = None,
+    cache: Optional[LintCache] = None,
+    stream: bool = False,
+    fail_fast: bool = False,
+) -> Iterator[FileReport]:
+    """Yield a FileReport per path as each finishes.
+
+    With a cache, files whose results are cached are reported first without
+    linting. The rest are spread over a process pool when more than one
+    job is allowed. Each worker compiles the rule set once at startup from
+    its source definitions, so tasks only carry a path; reports arrive in
+    completion order and are cached by this process. jobs=None uses every
+    CPU. While profiling, files are linted in this process without the
+    cache so the profiler sees every rule. stream is passed on to lint_file.
+
+    With fail_fast, files are linted one at a time in path order in this
+    process, each cheapest check first, and iteration ends after the first
+    report with an error.
+    """
+    if fail_fast:
+        for path in paths:
+            report = lint_file(path, ruleset, ledger, cache, stream, fail_fast)
+            yield report
+            if report.errors:
+                return
+        return
+
+    if active_profiler() is not None:
+        jobs, cache = 1, None
+
+    misses = paths
+    keys: Dict[Path, str] = {}
+    if cache is not None:
+        misses = []
+        for path in paths:
+            try:
+                key = _cache_key(path, ruleset, ledger, cache, stream)
+            except (OSError, UnicodeDecodeError) as e:
+                yield FileReport(path=path, error=str(e))
+                continue
+            cached = cache.get(key)
+            if cached is None:
+                keys[path] = key
+                misses.append(path)
+            else:
+                yield FileReport(path=path, style=cached[0], continuity=cached[1])
+
+    jobs = min(jobs or os.cpu_count() or 1, len(misses))
+    if jobs <= 1:
+        for path in misses:
+            yield lint_file(path, ruleset, ledger, cache, stream)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(ruleset.banned_phrases, ruleset.lint_config, ledger, stream),
+    ) as pool:
+        futures = [pool.submit(_lint_in_worker, path) for path in misses]
+        for future in as_completed(futures):
+            report = future.result()
+            if cache is not None and report.error is None:
+                cache.put(keys[report.path], report.style, report.continuity)
+            yield report
@@ -0,0 +1,196 @@
+"""Offset, line and token bookkeeping for whole-document linting."""
+import re
+from bisect import bisect_right
+from functools import cached_property
+from typing import List, Optional, Tuple, Union
+
+from harness.lint.literals import fold
+
+
+class LineIndex:
+    """Map character offsets in a text to 1-based line and column numbers."""
+
+    def __init__(self, text: str):
+        self.text = text
+        starts = [0]
+        find = text.find
+        pos = find('\n')
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find('\n', pos + 1)
+        self.starts: List[int] = starts
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number containing offset."""
+        return bisect_right(self.starts, offset)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """1-based (line, column) for offset."""
+        line = bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+
+    def line_start(self, line: int) -> int:
+        return self.starts[line - 1]
+
+    def line_end(self, line: int) -> int:
+        """Offset just past the last character of line, excluding the newline."""
+        if line < len(self.starts):
+            return self.starts[line] - 1
+        return len(self.text)
+
+    def line_text(self, line: int) -> str:
+        return self.text[self.line_start(line):self.line_end(line)]
+
+    def lines(self) -> List[str]:
+        return self.text.split('\n')
+
+
+# A line end, or a sentence end once the whitespace after it is present.
+SENTENCE_END = re.compile(r"\n|[.!?][\"'”’)\]]*[^\S\n]")
+# Double quotes, plus paragraph breaks, which close an unterminated quote.
+_QUOTE_OR_BREAK = re.compile(r'["“”]|\n[^\S\n]*\n')
+WORD = re.compile(r"\w+")
+
+Span = Tuple[int, int]
+Token = Tuple[str, int, int, int]
+
+
+class DocumentAnalysis:
+    """Everything the linters derive from a text, computed once and shared.
+
+    Each view is built on first use: the lowercased and case-folded
+    buffers, line offsets (index) and line list, sentence spans,
+    double-quoted dialogue spans and word tokens. Pass one analysis to several linters instead of the raw
+    text so they do not repeat the work.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.index = LineIndex(text)
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def folded(self) -> str:
+        """The text passed through fold(), for case-insensitive matching without IGNORECASE."""
+        return fold(self.text)
+
+    def _origins(self, view: str, transform) -> Optional[List[int]]:
+        # transform (fold or lowercasing) maps every character to one or more
+        # characters, so equal lengths mean offsets line up; otherwise record
+        # each view character's source offset.
+        if len(view) == len(self.text):
+            return None
+        origins = []
+        for offset, char in enumerate(self.text):
+            origins.extend([offset] * len(transform(char)))
+        return origins
+
+    @cached_property
+    def _fold_origins(self) -> Optional[List[int]]:
+        return self._origins(self.folded, fold)
+
+    @cached_property
+    def _lower_origins(self) -> Optional[List[int]]:
+        return self._origins(self.lower, str.lower)
+
+    def _map_back(self, origins: Optional[List[int]], start: int, end: int) -> Span:
+        if origins is None:
+            return start, end
+        original_start = origins[start] if start < len(origins) else len(self.text)
+        if end <= start:
+            return original_start, original_start
+        return original_start, origins[end - 1] + 1
+
+    def unfold(self, start: int, end: int) -> Span:
+        """Map a (start, end) span of folded back to the text."""
+        return self._map_back(self._fold_origins, start, end)
+
+    def unlower(self, start: int, end: int) -> Span:
+        """Map a (start, end) span of lower back to the text ("İ" lowercases to two characters)."""
+        return self._map_back(self._lower_origins, start, end)
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.index.lines()
+
+    @cached_property
+    def sentences(self) -> List[Span]:
+        """(start, end) offsets of each sentence or line, end exclusive."""
+        spans = []
+        start = 0
+        for match in SENTENCE_END.finditer(self.text):
+            spans.append((start, match.end()))
+            start = match.end()
+        if start < len(self.text):
+            spans.append((start, len(self.text)))
+        return spans
+
+    @cached_property
+    def dialogue(self) -> List[Span]:
+        """(start, end) offsets of double-quoted speech, quotes included.
+
+        Quotes are paired across line breaks; a paragraph break ends a quote
+        that was never closed. Single quotes are left alone, since they
+        cannot be told apart from apostrophes reliably.
+        """
+        spans = []
+        opened = None
+        for match in _QUOTE_OR_BREAK.finditer(self.text):
+            mark = match.group(0)
+            if mark[0] == "\n":
+                if opened is not None:
+                    spans.append((opened, match.start()))
+                    opened = None
+            elif mark == "“" or (mark == '"' and opened is None):
+                if opened is None:
+                    opened = match.start()
+            elif opened is not None:
+                spans.append((opened, match.end()))
+                opened = None
+        if opened is not None:
+            spans.append((opened, len(self.text)))
+        return spans
+
+    @cached_property
+    def _dialogue_starts(self) -> List[int]:
+        return [start for start, _ in self.dialogue]
+
+    def in_dialogue(self, offset: int) -> bool:
+        """True if offset falls inside a double-quoted span."""
+        position = bisect_right(self._dialogue_starts, offset) - 1
+        return position >= 0 and offset < self.dialogue[position][1]
+
+    @cached_property
+    def words(self) -> List[Token]:
+        """(lowercased word, chain, start, end) for every word.
+
+        Consecutive words share a chain number while only whitespace with
+        at most one line break separates them; punctuation or a blank line
+        starts a new chain.
+        """
+        text = self.text
+        tokens = []
+        chain = 0
+        prev_end = None
+        for match in WORD.finditer(text):
+            start = match.start()
+            if prev_end is not None:
+                gap = text[prev_end:start]
+                if not gap.isspace() or gap.count('\n') > 1:
+                    chain += 1
+            tokens.append((match.group(0).lower(), chain, start, match.end()))
+            prev_end = match.end()
+        return tokens
+
+
+def analyze(source: Union[str, DocumentAnalysis]) -> DocumentAnalysis:
+    """Resolve a text or an existing DocumentAnalysis to an analysis."""
+    if isinstance(source, DocumentAnalysis):
+        return source
+    return DocumentAnalysis(source)
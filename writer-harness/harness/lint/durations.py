@@ -0,0 +1,59 @@
+"""Durations in prose and ledgers ("25 minutes", "two hours", "an hour", "a 90-minute drive"), in seconds."""
+import re
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+
+UNIT_SECONDS = {"min": MINUTE, "minute": MINUTE, "hr": HOUR, "hour": HOUR, "day": DAY, "week": WEEK}
+
+UNITS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8,
+    "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14, "fifteen": 15,
+    "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19,
+}
+TENS = {"twenty": 20, "thirty": 30, "forty": 40, "fifty": 50, "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90}
+
+
+def _words(values) -> str:
+    return "|".join(sorted(values, key=len, reverse=True))
+
+
+# A number (digits, words up to ninety-nine, "a"/"an" or "half a"/"half an"),
+# then a unit, plural or joined by a hyphen as in "a 90-minute drive".
+DURATION = re.compile(
+    rf"\b(\d+(?:\.\d+)?|(?:{_words(TENS)})(?:[\s-](?:{_words(k for k in UNITS if k != 'zero')}))?|{_words(UNITS)}"
+    rf"|half\s+an?|an?)"
+    rf"[\s-]+({_words(UNIT_SECONDS)})s?\b",
+    re.IGNORECASE,
+)
+
+
+def parse_number(text: str) -> float:
+    """The value of a number as DURATION matches it: "90", "1.5", "twelve", "twenty-five", "an", "half a"."""
+    text = text.lower()
+    if text[0].isdigit():
+        return float(text)
+    words = re.split(r"[\s-]+", text)
+    if words[-1] in ("a", "an"):
+        return 0.5 if words[0] == "half" else 1
+    if words[0] in TENS:
+        return TENS[words[0]] + (UNITS[words[1]] if len(words) > 1 else 0)
+    return UNITS[words[0]]
+
+
+def durations(text: str) -> Iterator[Tuple[int, int, float]]:
+    """(start, end, seconds) for each duration in text, in one pass."""
+    for match in DURATION.finditer(text):
+        yield match.start(), match.end(), parse_number(match.group(1)) * UNIT_SECONDS[match.group(2).lower()]
+
+
+@lru_cache(maxsize=256)
+def parse_duration(text: str) -> Optional[float]:
+    """Seconds in the first duration in text (a ledger's elapsed_time_since_last_scene), or None."""
+    for _, _, seconds in durations(text):
+        return seconds
+    return None
@@ -0,0 +1,261 @@
+"""Single-pass multi-pattern scanning for the regex-based style rules."""
+import logging
+import re
+from time import perf_counter
+from typing import Iterator, List, Match, Optional, Pattern, Tuple, Union
+
+from harness.lint.document import DocumentAnalysis, analyze
+from harness.lint.literals import LEADING_FLAGS, Literals, LiteralSet
+from harness.lint.profile import active_profiler
+from harness.lint.redos import RegexTimeout, TimeBudget
+
+MERGEABLE_FLAGS = set("ims")
+UNMERGEABLE_SYNTAX = re.compile(r"\\[1-9]|\(\?P[<=]|\(\?\(|\\[AZ]")
+
+logger = logging.getLogger(__name__)
+
+
+class FoldedMatch:
+    """A match found in a document's folded buffer, reported against the original text."""
+
+    __slots__ = ("string", "_start", "_end")
+
+    def __init__(self, string: str, start: int, end: int):
+        self.string = string
+        self._start = start
+        self._end = end
+
+    def start(self) -> int:
+        return self._start
+
+    def end(self) -> int:
+        return self._end
+
+    def span(self) -> Tuple[int, int]:
+        return self._start, self._end
+
+    def group(self, index: int = 0) -> str:
+        if index != 0:
+            raise IndexError("only the whole match is available")
+        return self.string[self._start:self._end]
+
+
+Hit = Tuple[int, Union[Match, FoldedMatch]]
+
+
+def first_per_line(regex: Pattern, string: str) -> Iterator[Match]:
+    """The first match starting on each line of string, in order.
+
+    A match may wrap across one line break but not more, so a phrase never
+    joins two paragraphs. After a hit the search resumes at the next line
+    start, so a wrapped match never hides that line's own first hit.
+    """
+    pos = 0
+    end = len(string)
+    while pos <= end:
+        match = regex.search(string, pos)
+        if match is None:
+            return
+        start = match.start()
+        if string.count("\n", start, match.end()) > 1:
+            pos = start + 1
+            continue
+        yield match
+        pos = string.find("\n", start) + 1
+        if pos == 0:
+            return
+
+
+def _merge_body(pattern: str, regex: Pattern) -> Optional[str]:
+    """Rewrite a pattern so it can sit inside an alternation, or None if it cannot."""
+    flags = ""
+    leading = LEADING_FLAGS.match(pattern)
+    if leading:
+        flags = leading.group(1)
+        pattern = pattern[leading.end():]
+
+    if not set(flags) <= MERGEABLE_FLAGS:
+        return None
+    if UNMERGEABLE_SYNTAX.search(pattern):
+        return None
+    if regex.match(""):
+        return None
+
+    body = f"(?{flags}:{pattern})" if flags else f"(?:{pattern})"
+    try:
+        re.compile(body)
+    except re.error:
+        return None
+    return body
+
+
+class Scanner:
+    """Run many rules over a whole document.
+
+    The document is case-folded once and a single LiteralSet pass finds
+    which rule literals (extracted when the rules were compiled) occur in
+    it; rules with none of their literals present are skipped outright.
+    The rest are joined into named-group alternations; if those find
+    nothing, none of them can match and they are skipped as well. Surviving
+    rules search the whole buffer (first_per_line), so phrases that wrap
+    across a line break are found, and match offsets are mapped back to lines.
+    Rules that cannot be merged (backreferences, verbose mode, empty
+    matches, or a backtracking risk) always run.
+
+    Rules with a case-folded form (see casefolded_pattern) match the folded
+    buffer without IGNORECASE, which CPython's re runs much faster, and
+    their offsets are mapped back to the original text.
+
+    Each rule's search runs under time_budget seconds; a rule that
+    overruns is reported and contributes no hits for that text. With
+    max_hits set, a rule stops scanning once it has that many hits.
+    """
+
+    def __init__(self, rules: list, time_budget: Optional[float] = None, max_hits: Optional[int] = None):
+        self.rules = rules
+        self.time_budget = time_budget
+        self.max_hits = max_hits
+        self.routed: List[Tuple[int, Literals]] = []
+        self.merged: List[int] = []
+        self.unmerged: List[int] = []
+
+        # Merged rules are gated separately over the text and the folded buffer.
+        self.merged_folded: List[int] = []
+        bodies = []
+        folded_bodies = []
+        for index, rule in enumerate(rules):
+            if rule.literals:
+                self.routed.append((index, rule.literals))
+                continue
+            body = None
+            if not rule.risk:
+                if rule.folded is not None:
+                    body = _merge_body(rule.folded.pattern, rule.folded)
+                else:
+                    body = _merge_body(rule.pattern, rule.regex)
+            if body is None:
+                self.unmerged.append(index)
+            elif rule.folded is not None:
+                self.merged_folded.append(index)
+                folded_bodies.append(f"(?P<r{index}>{body})")
+            else:
+                self.merged.append(index)
+                bodies.append(f"(?P<r{index}>{body})")
+
+        self.literal_set = LiteralSet(literal for _, literals in self.routed for literal in literals)
+
+        self.combined = self._combine(bodies, self.merged)
+        self.combined_folded = self._combine(folded_bodies, self.merged_folded)
+
+    def _combine(self, bodies: List[str], merged: List[int]) -> Optional[Pattern]:
+        if not bodies:
+            return None
+        try:
+            return re.compile("|".join(bodies), re.MULTILINE)
+        except re.error:
+            self.unmerged = sorted(self.unmerged + merged)
+            merged.clear()
+            return None
+
+    def active(self, text: Union[str, DocumentAnalysis]) -> List[int]:
+        """Indexes of the rules that can possibly match text, in rule order."""
+        doc = analyze(text)
+        active = list(self.unmerged)
+        if self.routed:
+            present = self.literal_set.present(doc.folded)
+            active.extend(
+                index for index, literals in self.routed
+                if not literals.isdisjoint(present)
+            )
+        if self.combined is not None and self.combined.search(doc.text):
+            active.extend(self.merged)
+        if self.combined_folded is not None and self.combined_folded.search(doc.folded):
+            active.extend(self.merged_folded)
+        return sorted(active)
+
+    def scan(self, doc: DocumentAnalysis, active: Optional[List[int]] = None) -> List[List[Hit]]:
+        """Return (line_number, match) hits per rule: the first match starting on each line.
+
+        active limits the scan to those rule indexes, typically a subset of
+        what active() returned; by default the prefilter picks them.
+        """
+        hits: List[List[Hit]] = [[] for _ in self.rules]
+        line_of = doc.index.line_of
+        profiler = active_profiler()
+        max_hits = self.max_hits
+
+        if active is None:
+            started = perf_counter()
+            active = self.active(doc)
+            if profiler is not None:
+                profiler.add("scanner:prefilter", "literal prefilter and merged gate", perf_counter() - started, len(active))
+
+        with TimeBudget(self.time_budget) as budget:
+            for rule_index in active:
+                rule = self.rules[rule_index]
+                rule_hits = hits[rule_index]
+                started = perf_counter()
+                try:
+                    budget.arm()
+                    if rule.folded is None:
+                        for match in first_per_line(rule.regex, doc.text):
+                            rule_hits.append((line_of(match.start()), match))
+                            if len(rule_hits) == max_hits:
+                                break
+                    else:
+                        # Folding keeps every line break, so lines match up.
+                        for match in first_per_line(rule.folded, doc.folded):
+                            start, end = doc.unfold(match.start(), match.end())
+                            rule_hits.append((line_of(start), FoldedMatch(doc.text, start, end)))
+                            if len(rule_hits) == max_hits:
+                                break
+                    budget.disarm()
+                except RegexTimeout:
+                    rule_hits.clear()
+                    logger.warning(
+                        "Regex pattern '%s' exceeded its %ss time budget and was skipped", rule.pattern, self.time_budget
+                    )
+                finally:
+                    budget.disarm()
+                if profiler is not None:
+                    profiler.add(rule.rule_id, rule.pattern, perf_counter() - started, len(rule_hits))
+
+        return hits
+
+
+class TokenWindowDetector:
+    """Find noun/verb pairs where the verb follows the noun within a word window.
+
+    Words only chain together when separated by whitespace, so punctuation
+    and blank lines end a window while a single line break does not. It
+    reads the document's shared word tokens and every noun looks ahead at
+    most `window` words, which keeps the check linear in the document
+    length.
+    """
+
+    def __init__(self, nouns: List[str], verbs: List[str], window: int):
+        self.nouns = {noun.lower(): rank for rank, noun in reversed(list(enumerate(nouns)))}
+        self.verbs = {verb.lower(): rank for rank, verb in reversed(list(enumerate(verbs)))}
+        self.window = window
+
+    def find(self, doc: DocumentAnalysis) -> List[Tuple[int, str, str, int, int]]:
+        """Return (line, noun, verb, start, end) once per pair per line, in line then list order."""
+        tokens = doc.words
+        line_of = doc.index.line_of
+        nouns = self.nouns
+        verbs = self.verbs
+        found = {}
+        for i, (word, word_chain, start, _) in enumerate(tokens):
+            if word not in nouns:
+                continue
+            line = line_of(start)
+            for verb, verb_chain, _, end in tokens[i + 1:i + 1 + self.window]:
+                if verb_chain != word_chain:
+                    break
+                if verb in verbs:
+                    found.setdefault((line, word, verb), (start, end))
+
+        return sorted(
+            ((line, noun, verb, start, end) for (line, noun, verb), (start, end) in found.items()),
+            key=lambda hit: (hit[0], nouns[hit[1]], verbs[hit[2]]),
+        )
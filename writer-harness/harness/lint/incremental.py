@@ -0,0 +1,149 @@
+"""Paragraph-granular incremental linting for documents that are edited in place."""
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from harness.models import ContinuityLedger, LintViolation
+from harness.lint.document import DocumentAnalysis
+from harness.lint.ruleset import RuleSet
+from harness.lint.style import (
+    REGEX_GROUPS,
+    _assemble,
+    _dialogue_exposition,
+    _object_anthropomorphism,
+    _pov_and_address,
+    _scan_rules,
+)
+from harness.lint.continuity import (
+    LOCATION_CHANGE,
+    TIMELINE,
+    WHO_PRESENT,
+    _timeline,
+    lint_location_change,
+    lint_who_present,
+)
+from harness.lint.violation import Violation, cap_per_rule, to_models
+
+# A block ends after a run of one or more blank (or whitespace-only) lines.
+BLOCK_BREAK = re.compile(r"\n(?:[^\S\n]*\n)+")
+
+
+def split_blocks(text: str) -> List[str]:
+    """Split text into paragraph blocks that concatenate back to text exactly.
+
+    Each block is a paragraph plus the blank lines that follow it, so every
+    block starts at the beginning of a line.
+    """
+    blocks = []
+    start = 0
+    for match in BLOCK_BREAK.finditer(text):
+        blocks.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text) or not blocks:
+        blocks.append(text[start:])
+    return blocks
+
+
+@dataclass
+class _BlockResult:
+    """Violations for one block alone, with lines and offsets relative to the block."""
+
+    rule_hits: Dict[int, List[Violation]]  # only rules with hits in the block
+    pov_and_address: List[Violation]
+    anthropomorphism: List[Violation]
+    timeline: List[Violation]
+
+
+def _shift(violations: List[Violation], lines: int, offset: int) -> List[Violation]:
+    if not lines and not offset:
+        return violations
+    return [v.shifted(lines, offset) for v in violations]
+
+
+class IncrementalLinter:
+    """Lint successive versions of a document, re-scanning only changed paragraphs.
+
+    Regex rules, second-person narration, object anthropomorphism and
+    timeline references are line- or paragraph-local, so they are computed
+    per block and cached by block text; results for an unchanged block are
+    reused and only shifted to its new line and offset. The checks that
+    look across blocks (dialogue runs, location and character mentions)
+    are cheap single passes and always run over the whole document.
+
+    Output matches lint_style and lint_continuity except for a match that
+    spans a blank line, such as a banned phrase split across two
+    paragraphs, which is not reported.
+    """
+
+    def __init__(self, ruleset: RuleSet, ledger: ContinuityLedger):
+        self.ruleset = ruleset
+        self.ledger = ledger
+        self._blocks: Dict[str, _BlockResult] = {}
+        self.scanned = 0
+
+    def _lint_block(self, block: str) -> _BlockResult:
+        doc = DocumentAnalysis(block)
+        return _BlockResult(
+            rule_hits={index: hits for index, hits in enumerate(_scan_rules(doc, self.ruleset, *REGEX_GROUPS)) if hits},
+            pov_and_address=_pov_and_address(doc, self.ruleset),
+            anthropomorphism=_object_anthropomorphism(doc, self.ruleset),
+            timeline=_timeline(doc, self.ledger) if self.ruleset.enabled(TIMELINE, "continuity") else [],
+        )
+
+    def lint(self, text: str) -> Tuple[List[LintViolation], List[LintViolation]]:
+        """Return (style, continuity) violations for the current text."""
+        blocks = split_blocks(text)
+        previous = self._blocks
+        current: Dict[str, _BlockResult] = {}
+        self.scanned = 0
+
+        placed: List[Tuple[_BlockResult, int, int]] = []
+        lines = 0
+        offset = 0
+        for block in blocks:
+            result = current.get(block) or previous.get(block)
+            if result is None:
+                result = self._lint_block(block)
+                self.scanned += 1
+            current[block] = result
+            placed.append((result, lines, offset))
+            lines += block.count("\n")
+            offset += len(block)
+        self._blocks = current
+
+        # Blocks are capped on their own, so the per-rule cap is applied again to the whole.
+        limit = self.ruleset.lint_config.max_violations_per_rule
+        rules = self.ruleset.scanner(*REGEX_GROUPS).rules
+        rule_hits: List[List[Violation]] = [[] for _ in rules]
+        for result, lines, offset in placed:
+            for rule_index, hits in result.rule_hits.items():
+                rule_hits[rule_index].extend(_shift(hits, lines, offset))
+        by_group: Dict[str, List[Violation]] = {group: [] for group in REGEX_GROUPS}
+        for rule, hits in zip(rules, rule_hits):
+            by_group[rule.group].extend(cap_per_rule(hits, limit))
+
+        pov_and_address: List[Violation] = []
+        anthropomorphism: List[Violation] = []
+        timeline: List[Violation] = []
+        for result, lines, offset in placed:
+            if result.pov_and_address:
+                pov_and_address.extend(_shift(result.pov_and_address, lines, offset))
+            if result.anthropomorphism:
+                anthropomorphism.extend(_shift(result.anthropomorphism, lines, offset))
+            if result.timeline:
+                timeline.extend(_shift(result.timeline, lines, offset))
+
+        doc = DocumentAnalysis(text)
+        style = _assemble(
+            by_group,
+            cap_per_rule(pov_and_address, limit),
+            cap_per_rule(anthropomorphism, limit),
+            _dialogue_exposition(doc, self.ruleset),
+        )
+        continuity: List[LintViolation] = []
+        if self.ruleset.enabled(LOCATION_CHANGE, "continuity"):
+            continuity.extend(lint_location_change(doc, self.ledger))
+        if self.ruleset.enabled(WHO_PRESENT, "continuity"):
+            continuity.extend(lint_who_present(doc, self.ledger))
+        continuity.extend(to_models(timeline))
+        return to_models(style), continuity
@@ -0,0 +1,211 @@
+"""Required-literal extraction for regex prefiltering."""
+import re
+from re import _parser as sre_parse
+from re import _constants as sre
+from typing import FrozenSet, Iterable, List, Optional, Pattern, Set
+
+MIN_LITERAL_LENGTH = 3
+
+# Inline flags at the very start of a pattern, such as (?i) or (?im).
+LEADING_FLAGS = re.compile(r"^\(\?([a-zA-Z]+)\)")
+
+# Characters that re.IGNORECASE treats as equal to an ASCII letter but that
+# str.casefold() leaves alone or expands.
+_EXTRA_FOLDS = str.maketrans({"ı": "i", "İ": "i"})
+
+Literals = FrozenSet[str]
+
+
+def fold(text: str) -> str:
+    """Case-fold text the same way literal sets are folded."""
+    return text.translate(_EXTRA_FOLDS).casefold()
+
+
+def _better(a: Optional[Literals], b: Optional[Literals]) -> Optional[Literals]:
+    """Pick the more selective of two literal sets (longer shortest literal, then fewer)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    key_a = (min(len(s) for s in a), -len(a))
+    key_b = (min(len(s) for s in b), -len(b))
+    return b if key_b > key_a else a
+
+
+def _run_literals(run: List[str]) -> Optional[Literals]:
+    text = "".join(run)
+    if len(text) < MIN_LITERAL_LENGTH or not text.isascii():
+        return None
+    return frozenset([fold(text)])
+
+
+def _required(items) -> Optional[Literals]:
+    """Best any-of literal set for a parsed sequence, or None if nothing is required."""
+    best: Optional[Literals] = None
+    run: List[str] = []
+
+    def flush():
+        nonlocal best, run
+        if run:
+            best = _better(best, _run_literals(run))
+            run = []
+
+    for op, av in items:
+        if op is sre.LITERAL:
+            run.append(chr(av))
+        elif op is sre.AT:
+            # Zero-width anchors do not break a literal run.
+            continue
+        elif op is sre.SUBPATTERN:
+            flush()
+            best = _better(best, _required(av[-1]))
+        elif op is sre.BRANCH:
+            flush()
+            best = _better(best, _branch(av[1]))
+        elif op in (sre.MAX_REPEAT, sre.MIN_REPEAT, sre.POSSESSIVE_REPEAT):
+            flush()
+            low, _high, sub = av
+            if low >= 1:
+                best = _better(best, _required(sub))
+        elif op is sre.ATOMIC_GROUP:
+            flush()
+            best = _better(best, _required(av))
+        else:
+            flush()
+
+    flush()
+    return best
+
+
+def _branch(alternatives) -> Optional[Literals]:
+    combined = set()
+    for alternative in alternatives:
+        literals = _required(alternative)
+        if literals is None:
+            return None
+        combined |= literals
+    return frozenset(combined)
+
+
+def required_literals(pattern: str) -> Optional[Literals]:
+    """Return case-folded strings, one of which appears in every match of pattern.
+
+    Returns None when no useful literal can be proven, in which case the
+    pattern must be run without a prefilter.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+    try:
+        return _required(list(parsed))
+    except Exception:
+        return None
+
+
+def _fold_invariant(code: int) -> bool:
+    char = chr(code)
+    return fold(char) == char
+
+
+def _foldable(items) -> bool:
+    """True if every character the items name is already case-folded and nothing depends on case."""
+    for op, av in items:
+        if op in (sre.LITERAL, sre.NOT_LITERAL):
+            if not _fold_invariant(av):
+                return False
+        elif op is sre.IN:
+            if not _foldable(av):
+                return False
+        elif op is sre.RANGE:
+            if not (_fold_invariant(av[0]) and _fold_invariant(av[1])):
+                return False
+        elif op is sre.SUBPATTERN:
+            if (av[1] | av[2]) & re.IGNORECASE or not _foldable(av[-1]):
+                return False
+        elif op is sre.BRANCH:
+            if not all(_foldable(branch) for branch in av[1]):
+                return False
+        elif op in (sre.MAX_REPEAT, sre.MIN_REPEAT, sre.POSSESSIVE_REPEAT):
+            if not _foldable(av[2]):
+                return False
+        elif op is sre.ATOMIC_GROUP:
+            if not _foldable(av):
+                return False
+        elif op in (sre.ASSERT, sre.ASSERT_NOT):
+            if not _foldable(av[1]):
+                return False
+        elif op in (sre.GROUPREF, sre.GROUPREF_EXISTS):
+            return False
+    return True
+
+
+def casefolded_pattern(pattern: str) -> Optional[str]:
+    """Rewrite a leading-(?i) pattern to run case-sensitively over fold()ed text.
+
+    Returns the pattern with IGNORECASE dropped from its leading flags when
+    that is equivalent: every literal, set member and range bound is already
+    in folded form and there are no backreferences or inline case flags.
+    Returns None for anything else, and the pattern must run as written.
+    """
+    leading = LEADING_FLAGS.match(pattern)
+    if leading is None or "i" not in leading.group(1):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+    if not _foldable(list(parsed)):
+        return None
+
+    flags = leading.group(1).replace("i", "")
+    body = pattern[leading.end():]
+    return f"(?{flags}){body}" if flags else body
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """Build a regex that matches the longest of `words` starting at a position."""
+    root: dict = {}
+    for word in words:
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        children = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not children:
+            return ""
+        body = children[0] if len(children) == 1 else "(?:" + "|".join(children) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(root)
+
+
+class LiteralSet:
+    """Find which of many literals occur in a case-folded text with one scan.
+
+    All literals are compiled into a single trie-shaped lookahead, so the
+    text is walked once no matter how many literals there are. At each
+    position the longest literal is captured; any shorter literal matching
+    at the same position is a prefix of it, so prefixes are added back.
+    """
+
+    def __init__(self, literals: Iterable[str]):
+        self.literals: Set[str] = set(literals)
+        self.regex: Optional[Pattern] = None
+        if self.literals:
+            self.regex = re.compile("(?=(" + _trie_pattern(sorted(self.literals)) + "))")
+
+    def present(self, folded: str) -> Set[str]:
+        """Return the literals that occur in an already case-folded text."""
+        if self.regex is None:
+            return set()
+        longest = {match.group(1) for match in self.regex.finditer(folded)}
+        present = set()
+        for found in longest:
+            for length in range(MIN_LITERAL_LENGTH, len(found) + 1):
+                prefix = found[:length]
+                if prefix in self.literals:
+                    present.add(prefix)
+        return present
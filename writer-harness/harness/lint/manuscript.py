@@ -0,0 +1,253 @@
+"""Continuity across a whole manuscript, from each scene's recorded ledger.
+
+Each scene is checked against its own ledger (the lint_continuity checks)
+and against the scene before it: a change of location needs travel or a
+transition, a character who was not present at the end of the previous
+scene needs to enter, and story time must not run backwards. Every
+scene, paired with its predecessor, is checked independently, so a run
+is O(scenes) and the pairs are spread over a process pool like
+lint_files.
+"""
+import os
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from harness.models import BannedPhrases, ContinuityLedger, LintConfig, LintViolation
+from harness.lint.document import DocumentAnalysis
+from harness.lint.ruleset import RuleSet, compile_ruleset, get_ruleset
+from harness.lint.durations import DAY, parse_duration
+from harness.lint.continuity import character_counter, lint_continuity, named_present
+from harness.lint.violation import Violation, to_models
+
+# Rule IDs of the checks between consecutive scenes.
+LOCATION_JUMP = "continuity:location_jump"
+ENTRANCE = "continuity:entrance"
+TIME_ORDER = "continuity:time_order"
+
+# Scene files in outputs, most final first.
+SCENE_TEXT_KINDS = ("scene_out", "scene_draft")
+
+TRAVEL_CUE = re.compile(
+    r"\b(?:arriv\w*|drove|driv\w*|flew|fly\w*|flight|landed|rode|walked|travel\w*|journey\w*|"
+    r"headed|returned|left\s+(?:the|for)|back\s+(?:at|to|in)|car|helicopter|train|taxi|boat)\b"
+)
+ENTRANCE_CUE = re.compile(
+    r"\b(?:enter\w*|arriv\w*|came\s+in|comes\s+in|walk(?:s|ed)?\s+in|step(?:s|ped)?\s+(?:in|inside)|"
+    r"join\w*|return\w*|appear\w*|let\s+(?:him|her|them)\s+in|show(?:s|ed)?\s+(?:him|her|them)\s+in|door\s+opened)\b"
+)
+DAY_NUMBER = re.compile(r"\bday\s*(\d+)", re.IGNORECASE)
+# Times of day in story order; the longest phrase found in time_of_day wins.
+TIME_OF_DAY_ORDER = {
+    "dawn": 0, "early morning": 1, "morning": 2, "late morning": 3, "noon": 4, "midday": 4,
+    "early afternoon": 5, "afternoon": 6, "late afternoon": 7, "dusk": 8, "early evening": 8,
+    "evening": 9, "late evening": 10, "night": 11, "late night": 12, "midnight": 12,
+}
+
+
+def scene_number(path: Path) -> Optional[int]:
+    """The number a scene file's name starts with (0003_scene_out.md -> 3), if any."""
+    head = Path(path).stem.split("_")[0]
+    return int(head) if head.isdigit() else None
+
+
+def scene_texts(paths: Iterable[Path]) -> Dict[int, Path]:
+    """The text to check for each scene number among paths, preferring revised output over drafts."""
+    best: Dict[int, Tuple[int, Path]] = {}
+    for path in paths:
+        number = scene_number(path)
+        if number is None or path.stem.endswith("_lint"):
+            continue
+        kind = path.stem.split("_", 1)[1] if "_" in path.stem else ""
+        rank = SCENE_TEXT_KINDS.index(kind) if kind in SCENE_TEXT_KINDS else len(SCENE_TEXT_KINDS)
+        if number not in best or rank < best[number][0]:
+            best[number] = (rank, path)
+    return {number: path for number, (_, path) in sorted(best.items())}
+
+
+def day_number(ledger: ContinuityLedger) -> Optional[int]:
+    match = DAY_NUMBER.search(ledger.date_or_day_count)
+    return int(match.group(1)) if match else None
+
+
+def time_of_day_rank(ledger: ContinuityLedger) -> Optional[int]:
+    text = ledger.time_of_day.lower()
+    found = [phrase for phrase in TIME_OF_DAY_ORDER if re.search(rf"\b{phrase}\b", text)]
+    return TIME_OF_DAY_ORDER[max(found, key=len)] if found else None
+
+
+def _same_place(a: str, b: str) -> bool:
+    return a.strip().casefold() == b.strip().casefold()
+
+
+def _location_jump(previous: ContinuityLedger, current: ContinuityLedger, doc: Optional[DocumentAnalysis]) -> List[Violation]:
+    if _same_place(previous.location_current, current.location_current):
+        return []
+    if current.location_previous and not _same_place(current.location_previous, previous.location_current):
+        return [Violation(
+            LOCATION_JUMP, "continuity", "warning",
+            f"Ledger says the scene follows '{current.location_previous}', "
+            f"but the previous scene ended at '{previous.location_current}'",
+            context=f"Moved to '{current.location_current}'",
+        )]
+    declared = bool(current.transport_last_leg) and current.transport_last_leg != previous.transport_last_leg
+    if declared or (doc is not None and TRAVEL_CUE.search(doc.lower)):
+        return []
+    return [Violation(
+        LOCATION_JUMP, "continuity", "warning",
+        f"Location changes from '{previous.location_current}' to '{current.location_current}' without travel or transition",
+        context="Add the journey or a transition, or a transport_last_leg to the ledger",
+    )]
+
+
+def _entrances(previous: ContinuityLedger, current: ContinuityLedger, doc: DocumentAnalysis) -> List[Violation]:
+    before = {name.casefold() for name in previous.who_present}
+    arrivals = [name for name in named_present(current) if name.casefold() not in before]
+    if not arrivals:
+        return []
+    counter = character_counter(current)
+    if counter.regex is None:
+        return []
+    first: Dict[str, Tuple[int, int]] = {}
+    entered = set()
+    sentences = doc.sentences
+    starts = [start for start, _ in sentences]
+    for match in counter.regex.finditer(doc.lower):
+        names = [name for name in counter.credited(match.group()) if name in arrivals]
+        if not names:
+            continue
+        # The sentence holding the mention, in the original text ("İ" lowercases to two characters).
+        span = doc.unlower(*match.span())
+        offset = span[0]
+        index = max(0, bisect_right(starts, offset) - 1)
+        start, end = sentences[index] if sentences else (0, len(doc.text))
+        cued = ENTRANCE_CUE.search(doc.text[start:end].lower()) is not None
+        for name in names:
+            first.setdefault(name, span)
+            if cued:
+                entered.add(name)
+    violations = []
+    for name in arrivals:
+        if name in first and name not in entered:
+            start, end = first[name]
+            line, column = doc.index.position(start)
+            violations.append(Violation(
+                ENTRANCE, "continuity", "warning",
+                f"Character '{name}' was not present in the previous scene and appears without entering",
+                line, doc.index.line_text(line).strip(), column, start, end,
+            ))
+    return violations
+
+
+def _time_order(previous: ContinuityLedger, current: ContinuityLedger) -> List[Violation]:
+    before, after = day_number(previous), day_number(current)
+    elapsed = parse_duration(current.elapsed_time_since_last_scene)
+    if before is not None and after is not None:
+        if after < before:
+            return [Violation(
+                TIME_ORDER, "continuity", "error",
+                f"Story time runs backwards: {current.date_or_day_count} follows {previous.date_or_day_count}",
+            )]
+        if after == before:
+            earlier, later = time_of_day_rank(previous), time_of_day_rank(current)
+            if earlier is not None and later is not None and later < earlier:
+                return [Violation(
+                    TIME_ORDER, "continuity", "warning",
+                    f"Same day, but '{current.time_of_day}' follows '{previous.time_of_day}'",
+                )]
+            if elapsed is not None and elapsed >= DAY:
+                return [Violation(
+                    TIME_ORDER, "continuity", "warning",
+                    f"Elapsed time '{current.elapsed_time_since_last_scene}' but the day count has not changed",
+                )]
+        elif elapsed is not None and elapsed < (after - before - 1) * DAY:
+            return [Violation(
+                TIME_ORDER, "continuity", "warning",
+                f"Elapsed time '{current.elapsed_time_since_last_scene}' is too short "
+                f"for {previous.date_or_day_count} to {current.date_or_day_count}",
+            )]
+    return []
+
+
+@dataclass
+class SceneReport:
+    """Continuity results for one scene; path is None when only its ledger was recorded."""
+
+    scene: int
+    path: Optional[Path]
+    violations: List[LintViolation] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def check_scene(
+    scene: int,
+    path: Optional[Path],
+    ledger: ContinuityLedger,
+    previous: Optional[ContinuityLedger] = None,
+    ruleset: Optional[RuleSet] = None,
+) -> SceneReport:
+    """Check one scene against its ledger and, when given, the previous scene's ledger."""
+    enabled = get_ruleset(ruleset).enabled
+    report = SceneReport(scene, path)
+    doc = None
+    if path is not None:
+        try:
+            with open(path, "r") as f:
+                doc = DocumentAnalysis(f.read())
+        except (OSError, UnicodeDecodeError) as e:
+            report.error = str(e)
+            return report
+        report.violations.extend(lint_continuity(doc, ledger, ruleset))
+    if previous is not None:
+        violations: List[Violation] = []
+        if enabled(LOCATION_JUMP, "continuity"):
+            violations.extend(_location_jump(previous, ledger, doc))
+        if doc is not None and enabled(ENTRANCE, "continuity"):
+            violations.extend(_entrances(previous, ledger, doc))
+        if enabled(TIME_ORDER, "continuity"):
+            violations.extend(_time_order(previous, ledger))
+        report.violations.extend(to_models(violations))
+    return report
+
+
+# Per-process rule set for pool workers, set once by _init_worker.
+_worker_ruleset: Optional[RuleSet] = None
+
+
+def _init_worker(banned_phrases: Optional[BannedPhrases], lint_config: Optional[LintConfig]):
+    # Rebuilt from its inputs, like corpus._init_worker: cheaper to send than compiled patterns.
+    global _worker_ruleset
+    _worker_ruleset = compile_ruleset(banned_phrases, lint_config) if banned_phrases is not None else None
+
+
+def _check_in_worker(task) -> SceneReport:
+    return check_scene(*task, ruleset=_worker_ruleset)
+
+
+def check_manuscript(
+    ledgers: Dict[int, ContinuityLedger],
+    texts: Dict[int, Path],
+    ruleset: Optional[RuleSet] = None,
+    jobs: Optional[int] = 1,
+) -> List[SceneReport]:
+    """Check every scene with a recorded ledger, each against the one before it, in scene order.
+
+    ledgers maps scene numbers to their ledgers (LedgerHistory.latest());
+    texts maps them to scene files (scene_texts()). Scenes with a ledger
+    but no text get only the checks that need no text. jobs=None uses
+    every CPU.
+    """
+    scenes = sorted(ledgers)
+    tasks = [
+        (scene, texts.get(scene), ledgers[scene], ledgers[scenes[i - 1]] if i else None)
+        for i, scene in enumerate(scenes)
+    ]
+    jobs = min(jobs or os.cpu_count() or 1, len(tasks))
+    if jobs <= 1:
+        return [check_scene(*task, ruleset=ruleset) for task in tasks]
+    initargs = (ruleset.banned_phrases, ruleset.lint_config) if ruleset is not None else (None, None)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=initargs) as pool:
+        return list(pool.map(_check_in_worker, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
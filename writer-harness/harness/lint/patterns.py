@@ -0,0 +1,57 @@
+"""Built-in style patterns shared by the style linters."""
+
+SCENE_CONTAINMENT_PATTERNS = [
+    (r"(?i)\bflashback\b", "Flashback (breaks scene containment)"),
+    (r"(?i)(?:in\s+)?(?:a\s+)?(?:flashback|reverie|memory)", "Flashback insertion (breaks containment)"),
+    (r"(?i)(?:she\s+)?(?:had\s+)?been\s+(?:the\s+)?(?:type\s+)?(?:years?|months?)\s+(?:ago|before|earlier)", "Historical exposition (stay in present moment)"),
+    (r"(?i)(?:this\s+)?(?:wasn't\s+)?(?:the\s+)?(?:first|second|only)\\s+time\\s+(?:he|she|they)", "Referencing past event (only if actively discussed)"),
+    (r"(?i)(?:once|when),?\s+(?:years?|months?|weeks?|days?)\s+(?:ago|earlier|before)", "Backstory exposition (only if dialogue-relevant)"),
+    (r"(?i)(?:he|she|they)\s+(?:had\s+)?(?:once|used\s+to|always)\s+been", "Character history insertion (keep to present moment)"),
+    (r"(?i)(?:back\s+)?(?:when|then),?\s+(?:she|he|they)\s+(?:had|was|were|did)", "Past event summary mid-scene (avoid unless dialogue-driven)"),
+]
+
+META_NARRATIVE_PATTERNS = [
+    (r"(?i)\b(?:the\s+)?reader\b", "Meta-narrative: direct reference to reader"),
+    (r"(?i)\bthe\s+(?:story|narrative)\b", "Meta-narrative: story self-reference"),
+    (r"(?i)\bauthorial\s+(?:intent|voice)", "Meta-narrative: author commentary"),
+    (r"(?i)\bas\s+the\s+author\b", "Meta-narrative: author intrusion"),
+    (r"(?i)(?:to\s+)?(?:build|escalate|heighten|deepen)\s+(?:the\s+)?tension", "Narrative explanation: don't explain tension mechanics"),
+    (r"(?i)(?:the\s+)?(?:mood|atmosphere)\s+(?:shifts|changes|deepens|grows)", "Narrative explanation: mood shift labeling"),
+    (r"(?i)(?:this|that|it)\s+(?:would|could|should)\s+(?:reveal|show|prove|demonstrate)", "Narrative explanation: explaining what action means"),
+]
+
+EDITORIALIZING_PATTERNS = [
+    (r"(?i)\bwon\b.*(?:over|her|him|the\s+day|control|the\s+upper\s+hand)", "Relational outcome named: 'won...'"),
+    (r"(?i)\b(victory|triumph|surrender|submission|dominance|submission|defeat|conquest)\b", "Abstract state named (show behavior instead)"),
+    (r"(?i)he\s+had\s+(won|conquered|captured|claimed)", "Relational outcome named"),
+    (r"(?i)(?:was|is)\s+(?:victorious|triumphant|defeated|conquered)", "State named (avoid diagnosis)"),
+    (r"(?i)this\s+(?:revealed|showed|proved|demonstrated)\s+(?:that|her|his|the)", "Narrative explanation: explaining meaning"),
+    (r"(?i)(?:in\s+)?(?:this\s+moment|that\s+instant),?\s+(?:she|he|they)\s+(?:understood|realized|knew)", "Diagnosis line: realizing/understanding"),
+]
+
+POV_CONSISTENCY_PATTERNS = [
+    (r"(?i)(?:she|he)\s+(?:was\s+)?(?:the\s+type\s+)?(?:of|to)", "Character summary/typing (breaks POV)"),
+    (r"(?i)(?:in\s+)?(?:her|his)\s+(?:nature|character|way)", "Character summary (breaks POV)"),
+    (r"(?i)(?:like|as)\s+(?:she|he)\s+(?:always|usually|often)\s+(?:did|was)", "Habitual summary (breaks POV)"),
+    (r"(?i)she\s+(?:had\s+)?(?:never|always)\s+(?:been\s+)?(?:one\s+)?to", "Character typing (breaks POV)"),
+]
+
+SECOND_PERSON_PATTERN = r"(?i)\byou\b"
+
+INANIMATE_SUBJECTS = [
+    "silence", "room", "light", "table", "chair", "desk",
+    "painting", "photo", "box", "door", "window",
+    "ventilation", "shoes", "clock", "mirror",
+    "wall", "floor", "ceiling", "air", "space", "shadows",
+    "fabric", "glass", "marble", "stone", "wood",
+]
+
+EMOTIONAL_VERBS = [
+    "watches", "listens", "hears", "sees", "knows",
+    "remembers", "judges", "accuses", "demands",
+    "mirrors", "reflects", "echoes", "whispers",
+    "breathes", "holds", "embraces", "waits",
+]
+
+# Number of words after an inanimate noun that are searched for an emotional verb.
+ANTHROPOMORPHISM_WINDOW = 8
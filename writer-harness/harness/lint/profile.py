@@ -0,0 +1,75 @@
+"""Per-rule timing and hit counts for the linters."""
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional
+
+
+@dataclass
+class RuleStats:
+    """Accumulated cost of one rule: wall time, times it ran and violations or matches found."""
+
+    rule_id: str
+    label: str
+    seconds: float = 0.0
+    calls: int = 0
+    hits: int = 0
+
+
+class LintProfiler:
+    """Collects RuleStats while active; see profiling()."""
+
+    def __init__(self):
+        self.stats: Dict[str, RuleStats] = {}
+
+    def add(self, rule_id: str, label: str, seconds: float, hits: int):
+        stats = self.stats.get(rule_id)
+        if stats is None:
+            stats = self.stats[rule_id] = RuleStats(rule_id, label)
+        stats.seconds += seconds
+        stats.calls += 1
+        stats.hits += hits
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(stats.seconds for stats in self.stats.values())
+
+    def rows(self) -> List[RuleStats]:
+        """Stats sorted by time, most expensive first."""
+        return sorted(self.stats.values(), key=lambda stats: (-stats.seconds, stats.rule_id))
+
+    def write_json(self, path: Path):
+        with open(path, "w") as f:
+            json.dump(
+                {"total_seconds": self.total_seconds, "rules": [asdict(stats) for stats in self.rows()]},
+                f,
+                indent=2,
+            )
+
+
+_active: ContextVar[Optional[LintProfiler]] = ContextVar("lint_profiler", default=None)
+
+
+def active_profiler() -> Optional[LintProfiler]:
+    return _active.get()
+
+
+@contextmanager
+def profiling(profiler: Optional[LintProfiler] = None) -> Iterator[LintProfiler]:
+    """Record rule timings for lint calls made inside the block."""
+    profiler = profiler or LintProfiler()
+    token = _active.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _active.reset(token)
+
+
+def record(rule_id: str, label: str, started: float, hits: int):
+    """Add the time since started (a perf_counter value) to rule_id when profiling."""
+    profiler = _active.get()
+    if profiler is not None:
+        profiler.add(rule_id, label, perf_counter() - started, hits)
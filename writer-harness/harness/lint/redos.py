@@ -0,0 +1,325 @@
+"""Catastrophic-backtracking detection and time budgets for regex rules."""
+import logging
+import re
+import signal
+import string
+import threading
+from re import _parser as sre_parse
+from re import _constants as sre
+from typing import FrozenSet, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Repeats with a larger upper bound are treated as unbounded.
+UNBOUNDED = 64
+
+# Characters used to decide whether two pieces of a pattern can consume the same text.
+ALPHABET = frozenset(string.printable + "\xa0’“”—éßİıÅж中")
+
+_CATEGORIES = {
+    sre.CATEGORY_DIGIT: re.compile(r"\d"),
+    sre.CATEGORY_NOT_DIGIT: re.compile(r"\D"),
+    sre.CATEGORY_SPACE: re.compile(r"\s"),
+    sre.CATEGORY_NOT_SPACE: re.compile(r"\S"),
+    sre.CATEGORY_WORD: re.compile(r"\w"),
+    sre.CATEGORY_NOT_WORD: re.compile(r"\W"),
+    sre.CATEGORY_LINEBREAK: re.compile(r"\n"),
+    sre.CATEGORY_NOT_LINEBREAK: re.compile(r"[^\n]"),
+}
+_REPEATS = (sre.MAX_REPEAT, sre.MIN_REPEAT, sre.POSSESSIVE_REPEAT)
+
+Chars = FrozenSet[str]
+
+
+def _variants(char: str, flags: int) -> Chars:
+    if flags & re.IGNORECASE:
+        return frozenset((char, char.lower(), char.upper()))
+    return frozenset((char,))
+
+
+def _in_set(items, char: str, flags: int) -> bool:
+    negate = False
+    matched = False
+    candidates = _variants(char, flags)
+    for op, av in items:
+        if op is sre.NEGATE:
+            negate = True
+        elif op is sre.LITERAL:
+            matched |= chr(av) in candidates
+        elif op is sre.RANGE:
+            matched |= any(av[0] <= ord(c) <= av[1] for c in candidates)
+        elif op is sre.CATEGORY:
+            matched |= bool(_CATEGORIES[av].match(char)) if av in _CATEGORIES else True
+    return matched != negate
+
+
+def _chars(items, flags: int) -> Chars:
+    """Characters (from ALPHABET) that any part of the parsed items can consume."""
+    chars = set()
+    for op, av in items:
+        if op is sre.LITERAL:
+            chars |= _variants(chr(av), flags) & ALPHABET
+        elif op is sre.NOT_LITERAL:
+            chars |= ALPHABET - _variants(chr(av), flags)
+        elif op is sre.ANY:
+            chars |= ALPHABET if flags & re.DOTALL else ALPHABET - {"\n"}
+        elif op is sre.IN:
+            chars |= {c for c in ALPHABET if _in_set(av, c, flags)}
+        elif op is sre.CATEGORY:
+            chars |= {c for c in ALPHABET if _CATEGORIES[av].match(c)} if av in _CATEGORIES else ALPHABET
+        elif op is sre.SUBPATTERN:
+            chars |= _chars(av[-1], (flags | av[1]) & ~av[2])
+        elif op is sre.BRANCH:
+            for branch in av[1]:
+                chars |= _chars(branch, flags)
+        elif op in _REPEATS:
+            chars |= _chars(av[2], flags)
+        elif op is sre.ATOMIC_GROUP:
+            chars |= _chars(av, flags)
+        elif op is sre.GROUPREF_EXISTS:
+            chars |= _chars(av[1], flags)
+            if av[2] is not None:
+                chars |= _chars(av[2], flags)
+        elif op is sre.GROUPREF:
+            chars |= ALPHABET
+    return frozenset(chars)
+
+
+def _min_width(state, item) -> int:
+    return sre_parse.SubPattern(state, [item]).getwidth()[0]
+
+
+def _first(state, items, flags: int) -> Chars:
+    """Characters the parsed items can start a match with."""
+    chars = set()
+    for item in items:
+        op, av = item
+        if op is sre.SUBPATTERN:
+            chars |= _first(state, av[-1], (flags | av[1]) & ~av[2])
+        elif op is sre.BRANCH:
+            for branch in av[1]:
+                chars |= _first(state, branch, flags)
+        elif op in _REPEATS:
+            chars |= _first(state, av[2], flags)
+        elif op is sre.ATOMIC_GROUP:
+            chars |= _first(state, av, flags)
+        elif op in (sre.AT, sre.ASSERT, sre.ASSERT_NOT):
+            continue
+        else:
+            chars |= _chars([item], flags)
+        if _min_width(state, item) > 0:
+            break
+    return frozenset(chars)
+
+
+def _is_loop(op, av) -> bool:
+    return op in (sre.MAX_REPEAT, sre.MIN_REPEAT) and av[1] >= UNBOUNDED
+
+
+def _has_loop(items) -> bool:
+    """True if the items contain an unbounded, backtracking repeat at any depth."""
+    for op, av in items:
+        if op in (sre.MAX_REPEAT, sre.MIN_REPEAT):
+            if av[1] >= UNBOUNDED or _has_loop(av[2]):
+                return True
+        elif op is sre.SUBPATTERN and _has_loop(av[-1]):
+            return True
+        elif op is sre.BRANCH and any(_has_loop(branch) for branch in av[1]):
+            return True
+        elif op is sre.GROUPREF_EXISTS and (_has_loop(av[1]) or (av[2] is not None and _has_loop(av[2]))):
+            return True
+    return False
+
+
+def _leads_with_loop(state, items) -> bool:
+    """True if an unbounded repeat can consume the first characters of the items."""
+    for item in items:
+        op, av = item
+        if _is_loop(op, av):
+            return True
+        if op is sre.SUBPATTERN and _leads_with_loop(state, av[-1]):
+            return True
+        if op is sre.BRANCH and any(_leads_with_loop(state, branch) for branch in av[1]):
+            return True
+        if op in _REPEATS and _leads_with_loop(state, av[2]):
+            return True
+        if op not in (sre.AT, sre.ASSERT, sre.ASSERT_NOT) and _min_width(state, item) > 0:
+            return False
+    return False
+
+
+def _units(items, flags: int) -> List[tuple]:
+    """Flatten plain groups so a sequence can be walked item by item, keeping each item's flags."""
+    units = []
+    for op, av in items:
+        if op is sre.SUBPATTERN:
+            units.extend(_units(av[-1], (flags | av[1]) & ~av[2]))
+        else:
+            units.append(((op, av), flags))
+    return units
+
+
+def _overlapping_successor(state, units, position: int, chars: Chars, cyclic: bool) -> Optional[tuple]:
+    """The first later unit that can start on one of chars before a mandatory disjoint unit, if any.
+
+    With cyclic=True the walk wraps around, as the next iteration of an
+    enclosing loop would, and may come back to the unit itself.
+    """
+    count = len(units)
+    steps = range(1, count + 1) if cyclic else range(1, count - position)
+    for step in steps:
+        unit, flags = units[(position + step) % count]
+        if _first(state, [unit], flags) & chars:
+            return unit
+        if _min_width(state, unit) > 0:
+            return None
+    return None
+
+
+def _following(state, units, position: int) -> Chars:
+    """Characters that can come right after a unit of a repeated body, wrapping to the body's start."""
+    chars = set()
+    count = len(units)
+    for step in range(1, count):
+        unit, flags = units[(position + step) % count]
+        chars |= _first(state, [unit], flags)
+        if _min_width(state, unit) > 0:
+            break
+    return frozenset(chars)
+
+
+def _alternative_starts(state, alternatives, body, position: int, flags: int) -> List[Chars]:
+    """What each alternative of the branch at body[position] can start with.
+
+    The parser factors a shared prefix out of alternatives, so (a|aa)
+    arrives as a followed by (|a); an alternative that can match nothing
+    starts with whatever follows the branch instead.
+    """
+    following = None
+    starts = []
+    for branch in alternatives:
+        chars = _first(state, branch, flags)
+        if sre_parse.SubPattern(state, branch).getwidth()[0] == 0:
+            if following is None:
+                following = _following(state, body, position)
+            chars |= following
+        starts.append(chars)
+    return starts
+
+
+def _analyze(state, items, flags: int) -> Optional[str]:
+    units = _units(items, flags)
+    for position, (unit, unit_flags) in enumerate(units):
+        op, av = unit
+        if _is_loop(op, av):
+            body = _units(av[2], unit_flags)
+            for inner_position, (inner, inner_flags) in enumerate(body):
+                inner_op, inner_av = inner
+                if inner_op is sre.BRANCH:
+                    starts = _alternative_starts(state, inner_av[1], body, inner_position, inner_flags)
+                    if any(a & b for i, a in enumerate(starts) for b in starts[i + 1:]):
+                        return "overlapping alternatives inside a repeated group can backtrack exponentially"
+                if not _has_loop([inner]):
+                    continue
+                inner_chars = _chars([inner], inner_flags)
+                if _overlapping_successor(state, body, inner_position, inner_chars, cyclic=True) is not None:
+                    return "nested quantifiers can backtrack exponentially"
+
+            follower = _overlapping_successor(state, units, position, _chars([unit], unit_flags), cyclic=False)
+            if follower is not None and _leads_with_loop(state, [follower]):
+                return "adjacent quantifiers over overlapping characters can backtrack polynomially"
+
+        nested = []
+        if op is sre.SUBPATTERN:
+            nested = [av[-1]]
+        elif op is sre.BRANCH:
+            nested = av[1]
+        elif op in _REPEATS:
+            nested = [av[2]]
+        elif op is sre.ATOMIC_GROUP:
+            nested = [av]
+        elif op in (sre.ASSERT, sre.ASSERT_NOT):
+            nested = [av[1]]
+        for sub in nested:
+            risk = _analyze(state, sub, unit_flags)
+            if risk:
+                return risk
+    return None
+
+
+def backtracking_risk(pattern: str) -> Optional[str]:
+    """Describe a catastrophic-backtracking shape in pattern, or None if none is found.
+
+    This is a static check over the parsed pattern. It flags an unbounded
+    repeat whose body can split the same text in more than one way (nested
+    quantifiers such as (\\w+\\s*)*, or overlapping alternatives such as
+    (a|aa)*), and adjacent unbounded repeats that compete for the same
+    characters (such as .*\\s+.*). Possessive repeats and atomic groups do
+    not backtrack and are not flagged.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+    return _analyze(parsed.state, parsed.data, parsed.state.flags)
+
+
+class RegexTimeout(Exception):
+    """A regex ran past its time budget."""
+
+
+def _expired(signum, frame):
+    raise RegexTimeout()
+
+
+def _alarm_available() -> bool:
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+# Reasons a time budget could not be enforced that have already been logged.
+_unenforced: set = set()
+
+
+def _log_unenforced(seconds: float):
+    reason = "SIGALRM is not available on this platform" if not hasattr(signal, "setitimer") else \
+        "lint is running outside the main thread"
+    if reason not in _unenforced:
+        _unenforced.add(reason)
+        logger.warning("pattern_time_budget of %ss is not enforced: %s", seconds, reason)
+
+
+class TimeBudget:
+    """Per-call wall-clock limit for regex work, enforced with SIGALRM.
+
+    CPython's regex engine checks for signals while it matches, so the
+    alarm interrupts even a single long match. Used as a context manager
+    that installs the handler; arm() starts the clock for one call and
+    disarm() stops it. Where SIGALRM is unavailable (Windows, or outside
+    the main thread) the budget is not enforced, which is logged once per
+    process and reason.
+    """
+
+    def __init__(self, seconds: Optional[float]):
+        if seconds and not _alarm_available():
+            _log_unenforced(seconds)
+        self.seconds = seconds if seconds and _alarm_available() else None
+        self._previous = None
+
+    def __enter__(self) -> "TimeBudget":
+        if self.seconds:
+            self._previous = signal.signal(signal.SIGALRM, _expired)
+        return self
+
+    def __exit__(self, *exc):
+        if self.seconds:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous)
+        return False
+
+    def arm(self):
+        if self.seconds:
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+
+    def disarm(self):
+        if self.seconds:
+            signal.setitimer(signal.ITIMER_REAL, 0)
@@ -1,6 +1,7 @@
 import yaml
 from pathlib import Path
-from harness.models import StyleRules, BannedPhrases
+from typing import Dict, List
+from harness.models import StyleRules, BannedPhrases, PhraseFix
 
 
 def load_style_rules(path: Path) -> StyleRules:
@@ -15,18 +16,48 @@ def load_style_rules(path: Path) -> StyleRules:
         hard_rules=data.get("hard_rules", {}),
         soft_preferences=data.get("soft_preferences", {}),
         output_targets=data.get("output_targets", None),
+        lint=data.get("lint") or {},
     )
 
 
+def _parse_fix(spec) -> PhraseFix:
+    """Read a fix given as an action name, {replace: text} or {action: ..., replacement: ...}."""
+    if isinstance(spec, str):
+        return PhraseFix(action=spec)
+    if isinstance(spec, dict) and set(spec) == {"replace"}:
+        return PhraseFix(action="replace", replacement=spec["replace"])
+    return PhraseFix(**spec)
+
+
+def _split_entries(entries, fixes: Dict[str, PhraseFix]) -> List[str]:
+    """Patterns from a list of plain patterns or {pattern, fix} mappings, collecting fixes."""
+    patterns = []
+    for entry in entries or []:
+        if isinstance(entry, dict):
+            pattern = entry["pattern"]
+            if entry.get("fix") is not None:
+                fixes[pattern] = _parse_fix(entry["fix"])
+        else:
+            pattern = entry
+        patterns.append(pattern)
+    return patterns
+
+
 def load_banned_phrases(path: Path) -> BannedPhrases:
-    """Load banned phrases from YAML file."""
+    """Load banned phrases from YAML file.
+
+    Entries are regex strings or mappings with a `pattern` and a `fix`
+    (delete, drop_clause, or {replace: text}) used by `harness fix`.
+    """
     if not path.exists():
         return BannedPhrases(banned_regex=[], warn_regex=[])
 
     with open(path, "r") as f:
         data = yaml.safe_load(f) or {}
 
+    fixes: Dict[str, PhraseFix] = {}
     return BannedPhrases(
-        banned_regex=data.get("banned_regex", []),
-        warn_regex=data.get("warn_regex", []),
+        banned_regex=_split_entries(data.get("banned_regex", []), fixes),
+        warn_regex=_split_entries(data.get("warn_regex", []), fixes),
+        fixes=fixes,
     )
@@ -0,0 +1,268 @@
+"""Compiled rule sets shared across lint calls, files and CLI commands."""
+import hashlib
+import json
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Pattern, Tuple, Union
+
+from harness.models import BannedPhrases, LintConfig, PhraseFix
+from harness.lint import patterns
+from harness.lint.engine import Scanner, TokenWindowDetector
+from harness.lint.literals import casefolded_pattern, required_literals
+from harness.lint.redos import backtracking_risk
+from harness.lint.rules import load_banned_phrases, load_style_rules
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A single compiled regex rule."""
+    rule_id: str
+    group: str
+    severity: str
+    message: str
+    pattern: str
+    regex: Pattern
+    echo_match: bool = False
+    literals: Optional[FrozenSet[str]] = None
+    risk: Optional[str] = None
+    folded: Optional[Pattern] = None
+    fix: Optional[PhraseFix] = None
+
+    def describe(self, match) -> str:
+        """Build the violation message for a match."""
+        if self.echo_match:
+            # A match that wraps a line break is echoed on one line.
+            return f"{self.message}: {' '.join(match.group(0).split())}"
+        return self.message
+
+
+BUILTIN_GROUPS = [
+    ("scene_containment", "error", patterns.SCENE_CONTAINMENT_PATTERNS),
+    ("meta_narrative", "error", patterns.META_NARRATIVE_PATTERNS),
+    ("editorializing", "error", patterns.EDITORIALIZING_PATTERNS),
+    ("pov_consistency", "warning", patterns.POV_CONSISTENCY_PATTERNS),
+]
+
+
+def _compile_rules(
+    group: str,
+    severity: str,
+    entries,
+    echo_match: bool = False,
+    fixes: Optional[Dict[str, PhraseFix]] = None,
+) -> List[Rule]:
+    """Compile (pattern, message) entries, skipping malformed patterns and flagging risky ones."""
+    rules = []
+    for index, (pattern, message) in enumerate(entries):
+        try:
+            regex = re.compile(pattern, re.MULTILINE)
+        except re.error as e:
+            logger.warning("Malformed regex pattern '%s': %s", pattern, e)
+            continue
+        risk = backtracking_risk(pattern)
+        if risk:
+            logger.warning("Regex pattern '%s' may be slow: %s", pattern, risk)
+        folded_source = casefolded_pattern(pattern)
+        folded = re.compile(folded_source, re.MULTILINE) if folded_source is not None else None
+        rules.append(
+            Rule(
+                rule_id=f"{group}:{index}",
+                group=group,
+                severity=severity,
+                message=message,
+                pattern=pattern,
+                regex=regex,
+                echo_match=echo_match,
+                literals=required_literals(pattern),
+                risk=risk,
+                folded=folded,
+                fix=(fixes or {}).get(pattern),
+            )
+        )
+    return rules
+
+
+def _compile_builtins() -> List[Rule]:
+    rules = []
+    for group, severity, entries in BUILTIN_GROUPS:
+        rules.extend(_compile_rules(group, severity, entries))
+    return rules
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+BUILTIN_RULES = _compile_builtins()
+SECOND_PERSON_REGEX = re.compile(patterns.SECOND_PERSON_PATTERN)
+BUILTIN_DIGEST = _sha256(
+    json.dumps(
+        [[group, severity, entries] for group, severity, entries in BUILTIN_GROUPS]
+        + [patterns.SECOND_PERSON_PATTERN]
+    ).encode("utf-8")
+)
+
+
+def selects(selector: str, rule_id: str, category: str) -> bool:
+    """Whether a select/ignore entry names rule_id: as its category, an ID prefix, or the ID itself."""
+    return selector in (category, rule_id) or rule_id.startswith(selector + ":")
+
+
+class RuleSet:
+    """Banned phrases plus built-in patterns, compiled once and reused."""
+
+    def __init__(self, banned_phrases: BannedPhrases, digest: str, lint_config: Optional[LintConfig] = None):
+        self.banned_phrases = banned_phrases
+        self.lint_config = lint_config or LintConfig()
+        self.digest = digest
+        self.rules = (
+            _compile_rules(
+                "banned", "error", [(p, "Banned") for p in banned_phrases.banned_regex],
+                echo_match=True, fixes=banned_phrases.fixes,
+            )
+            + _compile_rules(
+                "warn", "warning", [(p, "Caution") for p in banned_phrases.warn_regex],
+                echo_match=True, fixes=banned_phrases.fixes,
+            )
+            + BUILTIN_RULES
+        )
+        self.second_person = SECOND_PERSON_REGEX
+        anthropomorphism = self.lint_config.object_anthropomorphism
+        self.anthropomorphism = TokenWindowDetector(
+            anthropomorphism.nouns, anthropomorphism.verbs, anthropomorphism.window
+        )
+
+        self._groups: Dict[str, List[Rule]] = {}
+        for rule in self.rules:
+            self._groups.setdefault(rule.group, []).append(rule)
+        self._scanners: Dict[Tuple[str, ...], Scanner] = {}
+        self._enabled: Dict[str, bool] = {}
+
+    def enabled(self, rule_id: str, category: str = "style") -> bool:
+        """Whether the lint config's select and ignore lists let this rule or check run."""
+        enabled = self._enabled.get(rule_id)
+        if enabled is None:
+            select = self.lint_config.select
+            ignore = self.lint_config.ignore
+            enabled = (
+                (not select or any(selects(selector, rule_id, category) for selector in select))
+                and not any(selects(selector, rule_id, category) for selector in ignore)
+            )
+            self._enabled[rule_id] = enabled
+        return enabled
+
+    def group(self, *names: str) -> List[Rule]:
+        """Return the compiled rules for the given groups, in order."""
+        return [rule for name in names for rule in self._groups.get(name, [])]
+
+    def scanner(self, *names: str) -> Scanner:
+        """Return the cached single-pass scanner for the enabled rules of the given groups."""
+        scanner = self._scanners.get(names)
+        if scanner is None:
+            scanner = Scanner(
+                [rule for rule in self.group(*names) if self.enabled(rule.rule_id)],
+                self.lint_config.pattern_time_budget,
+                self.lint_config.max_violations_per_rule,
+            )
+            self._scanners[names] = scanner
+        return scanner
+
+
+# Rule sets (and file digests) kept by least recent use; edited rule files
+# and select/ignore combinations would otherwise pile up in a long-running
+# process such as the daemon or --watch.
+MAX_CACHED_RULESETS = 16
+
+_RULESETS: "OrderedDict[str, RuleSet]" = OrderedDict()
+_FILE_DIGESTS: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _cached(cache: OrderedDict, key: str):
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache(cache: OrderedDict, key: str, value):
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > MAX_CACHED_RULESETS:
+        cache.popitem(last=False)
+
+
+def ruleset_digest(banned_phrases: BannedPhrases, lint_config: Optional[LintConfig] = None) -> str:
+    """Content hash of the banned phrases and lint config combined with the built-in patterns."""
+    lint_config = lint_config or LintConfig()
+    payload = json.dumps(
+        [
+            BUILTIN_DIGEST,
+            banned_phrases.banned_regex,
+            banned_phrases.warn_regex,
+            {pattern: fix.model_dump() for pattern, fix in sorted(banned_phrases.fixes.items())},
+            lint_config.model_dump(mode="json"),
+        ]
+    )
+    return _sha256(payload.encode("utf-8"))
+
+
+def compile_ruleset(banned_phrases: BannedPhrases, lint_config: Optional[LintConfig] = None) -> RuleSet:
+    """Return the cached rule set for these banned phrases, compiling on first use."""
+    digest = ruleset_digest(banned_phrases, lint_config)
+    ruleset = _cached(_RULESETS, digest)
+    if ruleset is None:
+        ruleset = RuleSet(banned_phrases, digest, lint_config)
+        _cache(_RULESETS, digest, ruleset)
+    return ruleset
+
+
+def select_rules(ruleset: RuleSet, select: Optional[List[str]] = None, ignore: Optional[List[str]] = None) -> RuleSet:
+    """The rule set with its lint config's select and/or ignore lists replaced."""
+    update = {}
+    if select is not None:
+        update["select"] = select
+    if ignore is not None:
+        update["ignore"] = ignore
+    if not update:
+        return ruleset
+    return compile_ruleset(ruleset.banned_phrases, ruleset.lint_config.model_copy(update=update))
+
+
+def _read_bytes(path: Optional[Path]) -> bytes:
+    return path.read_bytes() if path is not None and path.exists() else b""
+
+
+def load_ruleset(path: Path, style_rules_path: Optional[Path] = None) -> RuleSet:
+    """Load the rule set for a banned_phrases.yaml (and optional style_rules.yaml).
+
+    Keyed by the content hash of the files, so unchanged files are never re-parsed.
+    """
+    file_digest = _sha256(_sha256(_read_bytes(path)).encode() + _sha256(_read_bytes(style_rules_path)).encode())
+
+    digest = _cached(_FILE_DIGESTS, file_digest)
+    ruleset = _cached(_RULESETS, digest) if digest is not None else None
+    if ruleset is not None:
+        return ruleset
+
+    lint_config = load_style_rules(style_rules_path).lint if style_rules_path is not None else None
+    ruleset = compile_ruleset(load_banned_phrases(path), lint_config)
+    _cache(_FILE_DIGESTS, file_digest, ruleset.digest)
+    return ruleset
+
+
+def get_ruleset(source: Optional[Union[RuleSet, BannedPhrases]] = None) -> RuleSet:
+    """Resolve a RuleSet, BannedPhrases or None (built-ins only) to a compiled rule set."""
+    if isinstance(source, RuleSet):
+        return source
+    return compile_ruleset(source or BannedPhrases())
+
+
+def clear_ruleset_cache():
+    """Drop all cached rule sets."""
+    _RULESETS.clear()
+    _FILE_DIGESTS.clear()
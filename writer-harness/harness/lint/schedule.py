@@ -0,0 +1,127 @@
+"""Cost-ordered linting that stops at the first error, for fail-fast gates."""
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from harness.models import ContinuityLedger, LintViolation
+from harness.lint.document import analyze
+from harness.lint.ruleset import RuleSet
+from harness.lint.profile import record
+from harness.lint.style import (
+    DIALOGUE_EXPOSITION,
+    OBJECT_ANTHROPOMORPHISM,
+    POV_AND_ADDRESS,
+    REGEX_GROUPS,
+    Text,
+    _assemble,
+    _dialogue_exposition,
+    _object_anthropomorphism,
+    _pov_and_address,
+    _rule_violations,
+)
+from harness.lint.continuity import (
+    LOCATION_CHANGE,
+    TIMELINE,
+    WHO_PRESENT,
+    lint_location_change,
+    lint_timeline,
+    lint_who_present,
+)
+from harness.lint.violation import to_models
+
+# Rough cost of each check in ms per 100k words, from `lint --profile` on
+# benchmarks/bench_lint_style.py.
+CHECK_COSTS = {
+    LOCATION_CHANGE: 1,
+    DIALOGUE_EXPOSITION: 2,
+    TIMELINE: 10,
+    WHO_PRESENT: 13,
+    POV_AND_ADDRESS: 26,
+    OBJECT_ANTHROPOMORPHISM: 125,
+}
+# Regex rules, by how the scanner can skip them: literal-gated rules only
+# run on drafts containing their literals, merged rules are gated by one
+# combined search, and the rest (and risky patterns most of all) always run.
+RULE_COST_ROUTED = 5
+RULE_COST_MERGED = 10
+RULE_COST_UNMERGED = 20
+RULE_COST_RISK = 100
+
+Step = Tuple[float, str, Callable[[], list]]
+
+
+def _rule_cost(scanner, index: int) -> float:
+    rule = scanner.rules[index]
+    if rule.risk:
+        return RULE_COST_RISK
+    if rule.literals:
+        return RULE_COST_ROUTED
+    if index in scanner.unmerged:
+        return RULE_COST_UNMERGED
+    return RULE_COST_MERGED
+
+
+def lint_fail_fast(text: Text, ruleset: RuleSet, ledger: ContinuityLedger) -> Tuple[List[LintViolation], List[LintViolation]]:
+    """Run the enabled checks cheapest first and stop after the first one that reports an error.
+
+    Returns (style, continuity) in the order lint_style and lint_continuity
+    report them, holding what the checks that ran found. When no check
+    reports an error, every check has run and the result equals the full
+    lint.
+    """
+    doc = analyze(text)
+    scanner = ruleset.scanner(*REGEX_GROUPS)
+    rule_hits: Dict[int, list] = {}
+    found: Dict[str, list] = {}
+    active: Optional[Set[int]] = None
+
+    def scan_rule(index: int) -> list:
+        nonlocal active
+        if active is None:
+            # The prefilter runs once, before the first regex rule.
+            started = perf_counter()
+            active = set(scanner.active(doc))
+            record("scanner:prefilter", "literal prefilter and merged gate", started, len(active))
+        if index not in active:
+            return []
+        hits = scanner.scan(doc, [index])[index]
+        rule_hits[index] = _rule_violations(doc, scanner.rules[index], hits)
+        return rule_hits[index]
+
+    def check(name: str, run: Callable[[], list]) -> Callable[[], list]:
+        def step() -> list:
+            found[name] = run()
+            return found[name]
+        return step
+
+    steps: List[Step] = [
+        (_rule_cost(scanner, index), rule.rule_id, lambda index=index: scan_rule(index))
+        for index, rule in enumerate(scanner.rules)
+    ]
+    checks = [
+        (POV_AND_ADDRESS, "style", lambda: _pov_and_address(doc, ruleset)),
+        (OBJECT_ANTHROPOMORPHISM, "style", lambda: _object_anthropomorphism(doc, ruleset)),
+        (DIALOGUE_EXPOSITION, "style", lambda: _dialogue_exposition(doc, ruleset)),
+        (LOCATION_CHANGE, "continuity", lambda: lint_location_change(doc, ledger)),
+        (WHO_PRESENT, "continuity", lambda: lint_who_present(doc, ledger)),
+        (TIMELINE, "continuity", lambda: lint_timeline(doc, ledger)),
+    ]
+    for name, category, run in checks:
+        if ruleset.enabled(name, category):
+            steps.append((CHECK_COSTS[name], name, check(name, run)))
+
+    # sorted() is stable, so equal costs keep lint_style's order.
+    for _, _, step in sorted(steps, key=lambda step: step[0]):
+        if any(v.severity == "error" for v in step()):
+            break
+
+    by_group: Dict[str, list] = {group: [] for group in REGEX_GROUPS}
+    for index, rule in enumerate(scanner.rules):
+        by_group[rule.group].extend(rule_hits.get(index, []))
+    style = _assemble(
+        by_group,
+        found.get(POV_AND_ADDRESS, []),
+        found.get(OBJECT_ANTHROPOMORPHISM, []),
+        found.get(DIALOGUE_EXPOSITION, []),
+    )
+    continuity = found.get(LOCATION_CHANGE, []) + found.get(WHO_PRESENT, []) + found.get(TIMELINE, [])
+    return to_models(style), continuity
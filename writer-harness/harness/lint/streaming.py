@@ -0,0 +1,84 @@
+"""Lint text while it is still being generated."""
+from itertools import islice
+from typing import Iterator, List, Optional
+
+from harness.models import ContinuityLedger, LintViolation, StreamAbortConfig
+from harness.lint.document import SENTENCE_END, WORD
+from harness.lint.incremental import IncrementalLinter
+from harness.lint.ruleset import RuleSet
+
+
+class StreamingLinter:
+    """Lint a growing text at line and sentence boundaries.
+
+    Only the completed part of the buffer, up to the last line or sentence
+    end, is linted, through an IncrementalLinter so earlier paragraphs are
+    not re-scanned. Only style violations are tracked: the continuity
+    checks judge the whole scene and wait for the finished text.
+
+    With an abort config whose max_errors is set, feed() returns True once
+    more than max_errors errors start within the first within_words words.
+    When that window has been linted without tripping the limit, linting
+    stops and the rest of the stream is only buffered.
+    """
+
+    def __init__(self, ruleset: RuleSet, ledger: ContinuityLedger, abort: Optional[StreamAbortConfig] = None):
+        self._linter = IncrementalLinter(ruleset, ledger)
+        self.abort = abort if abort is not None and abort.max_errors is not None else None
+        self.text = ""
+        self.completed = 0
+        self.violations: List[LintViolation] = []
+        self.aborted = False
+        self._window_end: Optional[int] = None
+        self._settled = False
+
+    @property
+    def errors(self) -> List[LintViolation]:
+        return [v for v in self.violations if v.severity == "error"]
+
+    def feed(self, chunk: str) -> bool:
+        """Add a chunk of generated text; return True if generation should stop."""
+        self.text += chunk
+        if self._settled or self.aborted:
+            return self.aborted
+
+        end = self.completed
+        for match in SENTENCE_END.finditer(self.text, self.completed):
+            end = match.end()
+        if end == self.completed:
+            return False
+
+        self.completed = end
+        self.violations, _ = self._linter.lint(self.text[:end])
+        if self.abort is not None:
+            self._check_abort()
+        return self.aborted
+
+    def _check_abort(self):
+        within_words = self.abort.within_words
+        if within_words is not None and self._window_end is None:
+            words = list(islice(WORD.finditer(self.text, 0, self.completed), within_words))
+            if len(words) == within_words:
+                self._window_end = words[-1].end()
+
+        errors = self.errors
+        if self._window_end is not None:
+            errors = [v for v in errors if v.start < self._window_end]
+
+        if len(errors) > self.abort.max_errors:
+            self.aborted = True
+        elif self._window_end is not None:
+            self._settled = True
+
+
+def consume_stream(chunks: Iterator[str], linter: StreamingLinter) -> str:
+    """Feed a provider stream through the linter, closing it early on abort; return the text received."""
+    try:
+        for chunk in chunks:
+            if linter.feed(chunk):
+                break
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+    return linter.text
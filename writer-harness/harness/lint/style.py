@@ -1,300 +1,279 @@
-import re
-from typing import List
+from time import perf_counter
+from typing import Dict, List, Optional, Union
 from harness.models import LintViolation, BannedPhrases
+from harness.lint.document import DocumentAnalysis, analyze
+from harness.lint.ruleset import RuleSet, get_ruleset
+from harness.lint.profile import record
+from harness.lint.violation import Violation, to_models
+
+REGEX_GROUPS = (
+    "banned",
+    "warn",
+    "scene_containment",
+    "meta_narrative",
+    "editorializing",
+    "pov_consistency",
+)
+
+
+Text = Union[str, DocumentAnalysis]
+
+# Rule IDs of the checks that are not regex rules.
+POV_AND_ADDRESS = "style:pov_and_address"
+OBJECT_ANTHROPOMORPHISM = "style:object_anthropomorphism"
+DIALOGUE_EXPOSITION = "style:dialogue_exposition"
+
+
+def _context(doc: DocumentAnalysis, line_num: int) -> str:
+    return doc.lines[line_num - 1].strip()[:120]
+
+
+def _rule_violations(doc: DocumentAnalysis, rule, hits) -> List[Violation]:
+    line_start = doc.index.line_start
+    return [
+        Violation(
+            rule.rule_id,
+            "style",
+            rule.severity,
+            rule.describe(match),
+            line_num,
+            _context(doc, line_num),
+            match.start() - line_start(line_num) + 1,
+            match.start(),
+            match.end(),
+        )
+        for line_num, match in hits
+    ]
 
 
-def lint_banned_phrases(text: str, banned_phrases: BannedPhrases) -> List[LintViolation]:
-    """Check for banned phrases using regex patterns."""
-    violations = []
-    lines = text.split('\n')
-
-    for pattern in banned_phrases.banned_regex:
-        try:
-            regex = re.compile(pattern)
-            for line_num, line in enumerate(lines, 1):
-                match = regex.search(line)
-                if match:
-                    violations.append(
-                        LintViolation(
-                            category="style",
-                            severity="error",
-                            message=f"Banned: {match.group(0)}",
-                            line_number=line_num,
-                            context=line.strip()[:120],
-                        )
-                    )
-        except re.error as e:
-            print(f"Warning: malformed regex pattern '{pattern}': {e}")
-
-    for pattern in banned_phrases.warn_regex:
-        try:
-            regex = re.compile(pattern)
-            for line_num, line in enumerate(lines, 1):
-                match = regex.search(line)
-                if match:
-                    violations.append(
-                        LintViolation(
-                            category="style",
-                            severity="warning",
-                            message=f"Caution: {match.group(0)}",
-                            line_number=line_num,
-                            context=line.strip()[:120],
-                        )
-                    )
-        except re.error as e:
-            print(f"Warning: malformed regex pattern '{pattern}': {e}")
+def _scan_rules(doc: DocumentAnalysis, ruleset: RuleSet, *groups: str) -> List[List[Violation]]:
+    """Violations per rule of the given groups (in scanner rule order), one per rule per line."""
+    scanner = ruleset.scanner(*groups)
+    return [_rule_violations(doc, rule, hits) for rule, hits in zip(scanner.rules, scanner.scan(doc))]
 
-    return violations
 
+def _scan_groups(doc: DocumentAnalysis, ruleset: RuleSet, *groups: str) -> Dict[str, List[Violation]]:
+    """Run the regex rules of the given groups over the whole text, one violation per rule per line."""
+    rules = ruleset.scanner(*groups).rules
+    by_group: Dict[str, List[Violation]] = {group: [] for group in groups}
+    for rule, violations in zip(rules, _scan_rules(doc, ruleset, *groups)):
+        by_group[rule.group].extend(violations)
+    return by_group
 
-def lint_scene_containment(text: str, scene_location: str = None) -> List[LintViolation]:
-    """Detect scene containment violations."""
-    violations = []
-    lines = text.split('\n')
-
-    exposition_patterns = [
-        (r"(?i)\bflashback\b", "Flashback (breaks scene containment)"),
-        (r"(?i)(?:in\s+)?(?:a\s+)?(?:flashback|reverie|memory)", "Flashback insertion (breaks containment)"),
-        (r"(?i)(?:she\s+)?(?:had\s+)?been\s+(?:the\s+)?(?:type\s+)?(?:years?|months?)\s+(?:ago|before|earlier)", "Historical exposition (stay in present moment)"),
-        (r"(?i)(?:this\s+)?(?:wasn't\s+)?(?:the\s+)?(?:first|second|only)\\s+time\\s+(?:he|she|they)", "Referencing past event (only if actively discussed)"),
-        (r"(?i)(?:once|when),?\s+(?:years?|months?|weeks?|days?)\s+(?:ago|earlier|before)", "Backstory exposition (only if dialogue-relevant)"),
-        (r"(?i)(?:he|she|they)\s+(?:had\s+)?(?:once|used\s+to|always)\s+been", "Character history insertion (keep to present moment)"),
-        (r"(?i)(?:back\s+)?(?:when|then),?\s+(?:she|he|they)\s+(?:had|was|were|did)", "Past event summary mid-scene (avoid unless dialogue-driven)"),
-    ]
 
-    for pattern, msg in exposition_patterns:
-        try:
-            regex = re.compile(pattern)
-            for line_num, line in enumerate(lines, 1):
-                if regex.search(line):
-                    violations.append(
-                        LintViolation(
-                            category="style",
-                            severity="error",
-                            message=msg,
-                            line_number=line_num,
-                            context=line.strip()[:120],
-                        )
-                    )
-        except re.error:
-            pass
+def _lint_groups(text: Text, ruleset: RuleSet, *groups: str) -> List[LintViolation]:
+    by_group = _scan_groups(analyze(text), ruleset, *groups)
+    return to_models(v for group in groups for v in by_group[group])
 
-    return violations
+
+def lint_banned_phrases(text: Text, banned_phrases: Union[BannedPhrases, RuleSet]) -> List[LintViolation]:
+    """Check for banned phrases using regex patterns."""
+    return _lint_groups(text, get_ruleset(banned_phrases), "banned", "warn")
 
 
-def lint_meta_narrative(text: str) -> List[LintViolation]:
+def lint_scene_containment(text: Text, scene_location: str = None, ruleset: Optional[RuleSet] = None) -> List[LintViolation]:
+    """Detect scene containment violations."""
+    return _lint_groups(text, get_ruleset(ruleset), "scene_containment")
+
+
+def lint_meta_narrative(text: Text, ruleset: Optional[RuleSet] = None) -> List[LintViolation]:
     """Detect meta-narrative intrusions."""
-    violations = []
-    lines = text.split('\n')
-
-    meta_patterns = [
-        (r"(?i)\b(?:the\s+)?reader\b", "Meta-narrative: direct reference to reader"),
-        (r"(?i)\bthe\s+(?:story|narrative)\b", "Meta-narrative: story self-reference"),
-        (r"(?i)\bauthorial\s+(?:intent|voice)", "Meta-narrative: author commentary"),
-        (r"(?i)\bas\s+the\s+author\b", "Meta-narrative: author intrusion"),
-        (r"(?i)(?:to\s+)?(?:build|escalate|heighten|deepen)\s+(?:the\s+)?tension", "Narrative explanation: don't explain tension mechanics"),
-        (r"(?i)(?:the\s+)?(?:mood|atmosphere)\s+(?:shifts|changes|deepens|grows)", "Narrative explanation: mood shift labeling"),
-        (r"(?i)(?:this|that|it)\s+(?:would|could|should)\s+(?:reveal|show|prove|demonstrate)", "Narrative explanation: explaining what action means"),
-    ]
+    return _lint_groups(text, get_ruleset(ruleset), "meta_narrative")
 
-    for pattern, msg in meta_patterns:
-        try:
-            regex = re.compile(pattern)
-            for line_num, line in enumerate(lines, 1):
-                if regex.search(line):
-                    violations.append(
-                        LintViolation(
-                            category="style",
-                            severity="error",
-                            message=msg,
-                            line_number=line_num,
-                            context=line.strip()[:120],
-                        )
-                    )
-        except re.error:
-            pass
 
-    return violations
+def _likely_dialogue(line: str) -> bool:
+    double_quotes = line.count('"')
+    single_quotes = line.count("'")
+    return (double_quotes >= 2) or (single_quotes >= 2 and "'" not in line[:3])
 
 
-def lint_pov_and_address(text: str) -> List[LintViolation]:
-    """Check for second-person narration outside dialogue."""
+def _pov_and_address(doc: DocumentAnalysis, ruleset: RuleSet) -> List[Violation]:
+    if not ruleset.enabled(POV_AND_ADDRESS):
+        return []
+    started = perf_counter()
     violations = []
-    lines = text.split('\n')
-
-    for line_num, line in enumerate(lines, 1):
-        double_quotes = line.count('"')
-        single_quotes = line.count("'")
-        likely_dialogue = (double_quotes >= 2) or (single_quotes >= 2 and "'" not in line[:3])
-
-        if not likely_dialogue:
-            if re.search(r'\byou\b', line, re.IGNORECASE):
-                violations.append(
-                    LintViolation(
-                        category="style",
-                        severity="error",
-                        message="Second-person pronoun 'you' in narration",
-                        line_number=line_num,
-                        context=line.strip()[:120],
-                    )
-                )
-
+    limit = ruleset.lint_config.max_violations_per_rule
+    lines = doc.lines
+    done_line = 0
+
+    for match in ruleset.second_person.finditer(doc.text):
+        line_num, column = doc.index.position(match.start())
+        if line_num == done_line:
+            continue
+        if _likely_dialogue(lines[line_num - 1]):
+            done_line = line_num
+            continue
+        if doc.in_dialogue(match.start()):
+            continue
+        done_line = line_num
+
+        violations.append(
+            Violation(
+                POV_AND_ADDRESS,
+                "style",
+                "error",
+                "Second-person pronoun 'you' in narration",
+                line_num,
+                _context(doc, line_num),
+                column,
+                match.start(),
+                match.end(),
+            )
+        )
+        if len(violations) == limit:
+            break
+
+    record(POV_AND_ADDRESS, ruleset.second_person.pattern, started, len(violations))
     return violations
 
 
-def lint_editorializing(text: str) -> List[LintViolation]:
+def lint_pov_and_address(text: Text, ruleset: Optional[RuleSet] = None) -> List[LintViolation]:
+    """Check for second-person narration outside dialogue."""
+    return to_models(_pov_and_address(analyze(text), get_ruleset(ruleset)))
+
+
+def lint_editorializing(text: Text, ruleset: Optional[RuleSet] = None) -> List[LintViolation]:
     """Detect editorializing and naming relational states."""
-    violations = []
-    lines = text.split('\n')
-
-    editorializing_patterns = [
-        (r"(?i)\bwon\b.*(?:over|her|him|the\s+day|control|the\s+upper\s+hand)", "Relational outcome named: 'won...'"),
-        (r"(?i)\b(victory|triumph|surrender|submission|dominance|submission|defeat|conquest)\b", "Abstract state named (show behavior instead)"),
-        (r"(?i)he\s+had\s+(won|conquered|captured|claimed)", "Relational outcome named"),
-        (r"(?i)(?:was|is)\s+(?:victorious|triumphant|defeated|conquered)", "State named (avoid diagnosis)"),
-        (r"(?i)this\s+(?:revealed|showed|proved|demonstrated)\s+(?:that|her|his|the)", "Narrative explanation: explaining meaning"),
-        (r"(?i)(?:in\s+)?(?:this\s+moment|that\s+instant),?\s+(?:she|he|they)\s+(?:understood|realized|knew)", "Diagnosis line: realizing/understanding"),
-    ]
+    return _lint_groups(text, get_ruleset(ruleset), "editorializing")
 
-    for pattern, msg in editorializing_patterns:
-        try:
-            regex = re.compile(pattern)
-            for line_num, line in enumerate(lines, 1):
-                if regex.search(line):
-                    violations.append(
-                        LintViolation(
-                            category="style",
-                            severity="error",
-                            message=msg,
-                            line_number=line_num,
-                            context=line.strip()[:120],
-                        )
-                    )
-        except re.error:
-            pass
 
+def _object_anthropomorphism(doc: DocumentAnalysis, ruleset: RuleSet) -> List[Violation]:
+    if not ruleset.enabled(OBJECT_ANTHROPOMORPHISM):
+        return []
+    started = perf_counter()
+    violations = []
+    limit = ruleset.lint_config.max_violations_per_rule
+
+    line_start = doc.index.line_start
+    for line_num, noun, verb, start, end in ruleset.anthropomorphism.find(doc):
+        violations.append(
+            Violation(
+                OBJECT_ANTHROPOMORPHISM,
+                "style",
+                "warning",
+                f"Object anthropomorphism: '{noun}' + '{verb}'",
+                line_num,
+                _context(doc, line_num),
+                start - line_start(line_num) + 1,
+                start,
+                end,
+            )
+        )
+        if len(violations) == limit:
+            break
+
+    record(OBJECT_ANTHROPOMORPHISM, "noun/verb token window", started, len(violations))
     return violations
 
 
-def lint_object_anthropomorphism(text: str) -> List[LintViolation]:
+def lint_object_anthropomorphism(text: Text, ruleset: Optional[RuleSet] = None) -> List[LintViolation]:
     """Detect inanimate objects emoting or symbolizing."""
+    return to_models(_object_anthropomorphism(analyze(text), get_ruleset(ruleset)))
+
+
+class DialogueRuns:
+    """Track runs of consecutive lines containing a double quote, line by line.
+
+    The only state is the open run, so lines can be fed from a document or
+    from a file read piece by piece. A run longer than 10 lines is reported
+    when the first line without a quote ends it.
+    """
+
+    def __init__(self):
+        self.first_line = 0
+        self.first_start = 0
+        self.lines = 0
+        self.last_end = 0
+
+    def feed(self, line_num: int, line: str, start: int, end: int) -> Optional[Violation]:
+        """Add line line_num spanning text offsets start to end; return a violation if a long run just ended."""
+        if '"' in line:
+            if not self.lines:
+                self.first_line = line_num
+                self.first_start = start
+            self.lines += 1
+            self.last_end = end
+            return None
+
+        violation = None
+        if self.lines > 10:
+            violation = Violation(
+                DIALOGUE_EXPOSITION,
+                "style",
+                "warning",
+                f"Long dialogue block ({self.lines} lines): consider breaking up",
+                self.first_line,
+                f"Lines {self.first_line}–{line_num-1}",
+                1,
+                self.first_start,
+                self.last_end,
+            )
+        self.lines = 0
+        return violation
+
+
+def _dialogue_exposition(doc: DocumentAnalysis, ruleset: RuleSet) -> List[Violation]:
+    if not ruleset.enabled(DIALOGUE_EXPOSITION):
+        return []
+    started = perf_counter()
     violations = []
-    lines = text.split('\n')
-
-    inanimate_subjects = [
-        "silence", "room", "light", "table", "chair", "desk",
-        "painting", "photo", "box", "door", "window",
-        "ventilation", "shoes", "clock", "mirror",
-        "wall", "floor", "ceiling", "air", "space", "shadows",
-        "fabric", "glass", "marble", "stone", "wood",
-    ]
-
-    emotional_verbs = [
-        "watches", "listens", "hears", "sees", "knows",
-        "remembers", "judges", "accuses", "demands",
-        "mirrors", "reflects", "echoes", "whispers",
-        "breathes", "holds", "embraces", "waits",
-    ]
-
-    for line_num, line in enumerate(lines, 1):
-        lower_line = line.lower()
-
-        for noun in inanimate_subjects:
-            for verb in emotional_verbs:
-                pattern = rf'\b{re.escape(noun)}\b\s+(?:\w+\s+)*{re.escape(verb)}\b'
-                if re.search(pattern, lower_line):
-                    violations.append(
-                        LintViolation(
-                            category="style",
-                            severity="warning",
-                            message=f"Object anthropomorphism: '{noun}' + '{verb}'",
-                            line_number=line_num,
-                            context=line.strip()[:120],
-                        )
-                    )
-
+    limit = ruleset.lint_config.max_violations_per_rule
+
+    runs = DialogueRuns()
+    line_start = doc.index.line_start
+    line_end = doc.index.line_end
+    for line_num, line in enumerate(doc.lines, 1):
+        violation = runs.feed(line_num, line, line_start(line_num), line_end(line_num))
+        if violation is not None:
+            violations.append(violation)
+            if len(violations) == limit:
+                break
+
+    record(DIALOGUE_EXPOSITION, "dialogue blocks over 10 lines", started, len(violations))
     return violations
 
 
-def lint_dialogue_exposition(text: str) -> List[LintViolation]:
+def lint_dialogue_exposition(text: Text, ruleset: Optional[RuleSet] = None) -> List[LintViolation]:
     """Detect monologues and over-explanation."""
-    violations = []
-    lines = text.split('\n')
-
-    in_dialogue = False
-    dialogue_start = 0
-    dialogue_lines = 0
-
-    for line_num, line in enumerate(lines, 1):
-        has_quote = '"' in line
-
-        if has_quote:
-            if not in_dialogue:
-                in_dialogue = True
-                dialogue_start = line_num
-                dialogue_lines = 1
-            else:
-                dialogue_lines += 1
-        else:
-            if in_dialogue and dialogue_lines > 10:
-                violations.append(
-                    LintViolation(
-                        category="style",
-                        severity="warning",
-                        message=f"Long dialogue block ({dialogue_lines} lines): consider breaking up",
-                        line_number=dialogue_start,
-                        context=f"Lines {dialogue_start}–{line_num-1}",
-                    )
-                )
-            in_dialogue = False
-            dialogue_lines = 0
-
-    return violations
+    return to_models(_dialogue_exposition(analyze(text), get_ruleset(ruleset)))
 
 
-def lint_pov_consistency(text: str) -> List[LintViolation]:
+def lint_pov_consistency(text: Text, ruleset: Optional[RuleSet] = None) -> List[LintViolation]:
     """Detect character summary/typing."""
-    violations = []
-    lines = text.split('\n')
-
-    pov_violations = [
-        (r"(?i)(?:she|he)\s+(?:was\s+)?(?:the\s+type\s+)?(?:of|to)", "Character summary/typing (breaks POV)"),
-        (r"(?i)(?:in\s+)?(?:her|his)\s+(?:nature|character|way)", "Character summary (breaks POV)"),
-        (r"(?i)(?:like|as)\s+(?:she|he)\s+(?:always|usually|often)\s+(?:did|was)", "Habitual summary (breaks POV)"),
-        (r"(?i)she\s+(?:had\s+)?(?:never|always)\s+(?:been\s+)?(?:one\s+)?to", "Character typing (breaks POV)"),
-    ]
-
-    for pattern, msg in pov_violations:
-        try:
-            regex = re.compile(pattern)
-            for line_num, line in enumerate(lines, 1):
-                if regex.search(line):
-                    violations.append(
-                        LintViolation(
-                            category="style",
-                            severity="warning",
-                            message=msg,
-                            line_number=line_num,
-                            context=line.strip()[:120],
-                        )
-                    )
-        except re.error:
-            pass
-
-    return violations
+    return _lint_groups(text, get_ruleset(ruleset), "pov_consistency")
 
 
-def lint_style(text: str, banned_phrases: BannedPhrases, scene_location: str = None) -> List[LintViolation]:
+def lint_style(text: Text, banned_phrases: Union[BannedPhrases, RuleSet], scene_location: str = None) -> List[LintViolation]:
     """Run all style checks."""
+    ruleset = get_ruleset(banned_phrases)
+    doc = analyze(text)
+    by_group = _scan_groups(doc, ruleset, *REGEX_GROUPS)
+
+    return to_models(_assemble(
+        by_group,
+        _pov_and_address(doc, ruleset),
+        _object_anthropomorphism(doc, ruleset),
+        _dialogue_exposition(doc, ruleset),
+    ))
+
+
+def _assemble(
+    by_group: Dict[str, List[Violation]],
+    pov_and_address: List[Violation],
+    anthropomorphism: List[Violation],
+    dialogue: List[Violation],
+) -> List[Violation]:
+    """Order the checks' violations as lint_style reports them, dropping repeats of a message on a line."""
     violations = []
-    violations.extend(lint_banned_phrases(text, banned_phrases))
-    violations.extend(lint_scene_containment(text, scene_location))
-    violations.extend(lint_meta_narrative(text))
-    violations.extend(lint_pov_and_address(text))
-    violations.extend(lint_editorializing(text))
-    violations.extend(lint_object_anthropomorphism(text))
-    violations.extend(lint_dialogue_exposition(text))
-    violations.extend(lint_pov_consistency(text))
+    violations.extend(by_group["banned"])
+    violations.extend(by_group["warn"])
+    violations.extend(by_group["scene_containment"])
+    violations.extend(by_group["meta_narrative"])
+    violations.extend(pov_and_address)
+    violations.extend(by_group["editorializing"])
+    violations.extend(anthropomorphism)
+    violations.extend(dialogue)
+    violations.extend(by_group["pov_consistency"])
 
     seen = set()
     unique_violations = []
@@ -0,0 +1,60 @@
+"""Lint targets and per-file reports, with no heavy imports, so the CLI can use them before it loads the linters."""
+import glob
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from harness.models import LintViolation
+
+TEXT_SUFFIXES = (".md", ".txt")
+
+
+@dataclass
+class FileReport:
+    """Lint results for one file; error is set instead when it could not be read."""
+
+    path: Path
+    style: List["LintViolation"] = field(default_factory=list)
+    continuity: List["LintViolation"] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def total(self) -> int:
+        return len(self.style) + len(self.continuity)
+
+    @property
+    def errors(self) -> int:
+        return sum(v.severity == "error" for v in self.style + self.continuity)
+
+
+def expand_targets(targets: Iterable[str]) -> List[Path]:
+    """Resolve files, directories (searched recursively for .md/.txt) and glob patterns.
+
+    Order follows the targets, sorted within each directory or glob, and a
+    file named more than once is only linted once.
+    """
+    paths: List[Path] = []
+    seen = set()
+
+    def add(path: Path):
+        key = os.path.realpath(path)
+        if key not in seen:
+            seen.add(key)
+            paths.append(path)
+
+    for target in targets:
+        path = Path(target)
+        if path.is_file():
+            add(path)
+        elif path.is_dir():
+            for child in sorted(path.rglob("*")):
+                if child.is_file() and child.suffix in TEXT_SUFFIXES:
+                    add(child)
+        else:
+            for match in sorted(glob.glob(target, recursive=True)):
+                if Path(match).is_file():
+                    add(Path(match))
+
+    return paths
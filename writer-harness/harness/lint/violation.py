@@ -0,0 +1,85 @@
+"""Compact violation records used inside the linters."""
+from typing import Dict, Iterable, List, Optional
+
+from pydantic import TypeAdapter
+
+from harness.models import LintViolation
+
+
+class Violation:
+    """A lint finding as the checks build it: plain slots, no validation.
+
+    The linters create these on their hot paths and convert them with
+    to_model() only when results leave harness.lint, so hits that are
+    deduplicated or capped away never become models, and the ones that
+    survive are validated once instead of being copied on every shift.
+    """
+
+    __slots__ = ("rule_id", "category", "severity", "message", "line_number", "context", "column", "start", "end")
+
+    def __init__(
+        self,
+        rule_id: str,
+        category: str,
+        severity: str,
+        message: str,
+        line_number: Optional[int] = None,
+        context: str = "",
+        column: Optional[int] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ):
+        self.rule_id = rule_id
+        self.category = category
+        self.severity = severity
+        self.message = message
+        self.line_number = line_number
+        self.context = context
+        self.column = column
+        self.start = start
+        self.end = end
+
+    def shifted(self, lines: int, offset: int) -> "Violation":
+        """A copy moved down by lines and offset, for results computed on part of a text."""
+        return Violation(
+            self.rule_id, self.category, self.severity, self.message,
+            self.line_number + lines if self.line_number is not None else None,
+            self.context,
+            self.column,
+            self.start + offset if self.start is not None else None,
+            self.end + offset if self.end is not None else None,
+        )
+
+    def to_model(self) -> LintViolation:
+        return LintViolation.model_validate(self, from_attributes=True)
+
+
+# One validator call for a whole list is quicker than a model per record,
+# and much quicker than model_construct, which runs in Python.
+_MODELS = TypeAdapter(List[LintViolation])
+
+
+def to_models(violations: Iterable[Violation]) -> List[LintViolation]:
+    return _MODELS.validate_python(list(violations), from_attributes=True)
+
+
+def cap_per_rule(
+    violations: Iterable[Violation],
+    limit: Optional[int],
+    counts: Optional[Dict[str, int]] = None,
+) -> List[Violation]:
+    """Keep at most limit violations per rule_id, in order.
+
+    Pass the same counts dict across calls to cap a result built in pieces.
+    """
+    violations = list(violations)
+    if limit is None:
+        return violations
+    counts = {} if counts is None else counts
+    kept = []
+    for v in violations:
+        seen = counts.get(v.rule_id, 0)
+        if seen < limit:
+            counts[v.rule_id] = seen + 1
+            kept.append(v)
+    return kept
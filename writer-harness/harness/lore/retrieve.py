@@ -1,6 +1,6 @@
 import re
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 from rapidfuzz import fuzz
 from harness.lore.ingest import load_lore_entries
 
@@ -16,9 +16,14 @@ def retrieve_lore(
     lore_dir: Path,
     top_k: int = 8,
     max_chars_per_snippet: int = 600,
+    entries: Optional[List[Tuple[str, str]]] = None,
 ) -> List[str]:
-    """Retrieve top-K lore snippets matching keywords."""
-    entries = load_lore_entries(lore_dir)
+    """Retrieve top-K lore snippets matching keywords.
+
+    entries, if given, are used instead of loading lore_dir (see load_lore_entries).
+    """
+    if entries is None:
+        entries = load_lore_entries(lore_dir)
 
     if not entries:
         return []
@@ -0,0 +1,369 @@
+"""Language Server Protocol frontend that publishes lint diagnostics while a writer types.
+
+The server speaks LSP over a pair of byte streams (stdin and stdout for
+`harness lsp`), using only the standard library. Documents are synced
+incrementally; each open document keeps an IncrementalLinter, so a
+re-lint only re-scans the paragraphs that changed. Edits are debounced:
+a document is re-linted once no change has arrived for `debounce`
+seconds, or at once when it is opened or saved.
+
+A background thread only reads and parses messages; handling and linting
+happen on the calling thread, so regex time budgets stay enforced and
+changes that arrive during a lint are applied together before the next
+one instead of each triggering its own. Warnings logged by harness while
+the server runs (malformed or slow rules, for example) are sent to the
+client as window/logMessage notifications.
+"""
+import bisect
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from harness import __version__
+from harness.daemon import WorkspaceState
+from harness.models import LintViolation
+from harness.lint.incremental import IncrementalLinter
+
+# JSON-RPC and LSP error codes.
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+SERVER_NOT_INITIALIZED = -32002
+
+# LSP enums.
+SYNC_INCREMENTAL = 2
+SEVERITY = {"error": 1, "warning": 2, "info": 3}
+MESSAGE_ERROR = 1
+MESSAGE_WARNING = 2
+MESSAGE_INFO = 3
+MESSAGE_LOG = 4
+
+DEFAULT_DEBOUNCE = 0.3
+
+
+def read_message(stream: BinaryIO) -> Optional[dict]:
+    """Read one Content-Length framed message; None at end of stream."""
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value.strip())
+    if length is None:
+        raise ValueError("message without a Content-Length header")
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    return json.loads(body)
+
+
+def write_message(stream: BinaryIO, message: dict):
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stream.flush()
+
+
+def _utf16_index(line: str, character: int) -> int:
+    """The index into line of an LSP character offset, which counts UTF-16 code units."""
+    if line.isascii():
+        return min(character, len(line))
+    units = 0
+    for index, char in enumerate(line):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def _utf16_length(text: str) -> int:
+    if text.isascii():
+        return len(text)
+    return len(text) + sum(ord(char) > 0xFFFF for char in text)
+
+
+def line_starts(text: str) -> List[int]:
+    starts = [0]
+    index = text.find("\n")
+    while index != -1:
+        starts.append(index + 1)
+        index = text.find("\n", index + 1)
+    return starts
+
+
+def to_offset(text: str, starts: List[int], position: dict) -> int:
+    """The index into text of an LSP position; positions past a line or the text clamp to its end."""
+    line = position["line"]
+    if line >= len(starts):
+        return len(text)
+    start = starts[line]
+    end = starts[line + 1] - 1 if line + 1 < len(starts) else len(text)
+    return start + _utf16_index(text[start:end], position["character"])
+
+
+def to_position(text: str, starts: List[int], offset: int) -> dict:
+    line = bisect.bisect_right(starts, offset) - 1
+    return {"line": line, "character": _utf16_length(text[starts[line]:offset])}
+
+
+def apply_change(text: str, change: dict) -> str:
+    """Apply one textDocument/didChange content change: a ranged edit or a full replacement."""
+    if "range" not in change:
+        return change["text"]
+    starts = line_starts(text)
+    start = to_offset(text, starts, change["range"]["start"])
+    end = to_offset(text, starts, change["range"]["end"])
+    return text[:start] + change["text"] + text[end:]
+
+
+def diagnostic(text: str, starts: List[int], violation: LintViolation) -> dict:
+    """An LSP diagnostic for a violation, spanning its match or else its line (or the first line)."""
+    if violation.start is not None and violation.end is not None:
+        start = to_position(text, starts, violation.start)
+        end = to_position(text, starts, violation.end)
+    else:
+        line = violation.line_number - 1 if violation.line_number else 0
+        line = min(line, len(starts) - 1)
+        end_offset = starts[line + 1] - 1 if line + 1 < len(starts) else len(text)
+        start = {"line": line, "character": 0}
+        end = {"line": line, "character": _utf16_length(text[starts[line]:end_offset])}
+    result = {
+        "range": {"start": start, "end": end},
+        "severity": SEVERITY.get(violation.severity, SEVERITY["info"]),
+        "source": "harness",
+        "message": violation.message,
+    }
+    if violation.rule_id:
+        result["code"] = violation.rule_id
+    return result
+
+
+@dataclass
+class Document:
+    """An open document: its text, the client's version and its linter."""
+
+    uri: str
+    text: str
+    version: Optional[int] = None
+    linter: Optional[IncrementalLinter] = field(default=None, repr=False)
+
+
+class _ClientLogHandler(logging.Handler):
+    """Forward log records to the client as window/logMessage notifications."""
+
+    def __init__(self, server: "LintLanguageServer"):
+        super().__init__(logging.INFO)
+        self.server = server
+
+    def emit(self, record: logging.LogRecord):
+        if record.levelno >= logging.ERROR:
+            kind = MESSAGE_ERROR
+        elif record.levelno >= logging.WARNING:
+            kind = MESSAGE_WARNING
+        else:
+            kind = MESSAGE_INFO
+        try:
+            self.server.notify("window/logMessage", {"type": kind, "message": self.format(record)})
+        except (OSError, ValueError):
+            pass
+
+
+class LintLanguageServer:
+    """Serve lint diagnostics for one workspace over LSP."""
+
+    def __init__(self, workspace_root: Path, reader: BinaryIO, writer: BinaryIO, debounce: float = DEFAULT_DEBOUNCE):
+        self.state = WorkspaceState(Path(workspace_root).resolve())
+        self.reader = reader
+        self.writer = writer
+        self.debounce = debounce
+        self.documents: Dict[str, Document] = {}
+        self.initialized = False
+        self.shut_down = False
+        self.exited = False
+        # When each document with unlinted changes is next due for a lint.
+        self._due: Dict[str, float] = {}
+        self._incoming: "queue.Queue[Optional[dict]]" = queue.Queue()
+        self._write_lock = threading.Lock()
+        self._handlers = {
+            "initialize": self._initialize,
+            "shutdown": self._shutdown,
+            "exit": self._exit,
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didSave": self._did_save,
+            "textDocument/didClose": self._did_close,
+        }
+
+    # ── transport ──────────────────────────────────────────────────────
+    def _read(self):
+        try:
+            while True:
+                message = read_message(self.reader)
+                self._incoming.put(message)
+                if message is None:
+                    return
+        except (OSError, ValueError):
+            self._incoming.put(None)
+
+    def _send(self, message: dict):
+        message["jsonrpc"] = "2.0"
+        with self._write_lock:
+            write_message(self.writer, message)
+
+    def notify(self, method: str, params: Any):
+        self._send({"method": method, "params": params})
+
+    def serve(self) -> int:
+        """Handle messages until exit or end of input; return the exit code LSP asks for."""
+        handler = _ClientLogHandler(self)
+        logger = logging.getLogger("harness")
+        logger.addHandler(handler)
+        try:
+            return self._serve()
+        finally:
+            logger.removeHandler(handler)
+
+    def _serve(self) -> int:
+        threading.Thread(target=self._read, name="lsp-reader", daemon=True).start()
+        while not self.exited:
+            timeout = None
+            if self._due:
+                timeout = max(0.0, min(self._due.values()) - time.monotonic())
+            try:
+                message = self._incoming.get(timeout=timeout)
+            except queue.Empty:
+                self._lint_due()
+                continue
+            if message is None:
+                break
+            self._handle(message)
+            # Apply everything that is already queued before linting anything.
+            while not self.exited:
+                try:
+                    message = self._incoming.get_nowait()
+                except queue.Empty:
+                    break
+                if message is None:
+                    self.exited = True
+                    break
+                self._handle(message)
+            self._lint_due()
+        return 0 if self.shut_down else 1
+
+    def _handle(self, message: dict):
+        method = message.get("method")
+        request_id = message.get("id")
+        if method is None:
+            return  # a response to a request this server never sends
+        handler = self._handlers.get(method)
+        try:
+            if handler is None:
+                if request_id is not None:
+                    self._send({"id": request_id, "error": {"code": METHOD_NOT_FOUND, "message": f"unknown method: {method}"}})
+                return
+            if not self.initialized and method not in ("initialize", "exit"):
+                if request_id is not None:
+                    self._send({"id": request_id, "error": {"code": SERVER_NOT_INITIALIZED, "message": "not initialized"}})
+                return
+            if self.shut_down and method != "exit":
+                if request_id is not None:
+                    self._send({"id": request_id, "error": {"code": INVALID_REQUEST, "message": "server is shutting down"}})
+                return
+            result = handler(message.get("params") or {})
+        except Exception as e:
+            if request_id is not None:
+                self._send({"id": request_id, "error": {"code": INTERNAL_ERROR, "message": f"{type(e).__name__}: {e}"}})
+            else:
+                self.notify("window/logMessage", {"type": MESSAGE_ERROR, "message": f"{method}: {type(e).__name__}: {e}"})
+            return
+        if request_id is not None:
+            self._send({"id": request_id, "result": result})
+
+    # ── lifecycle ──────────────────────────────────────────────────────
+    def _initialize(self, params: dict) -> dict:
+        self.initialized = True
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": SYNC_INCREMENTAL,
+                    "save": {"includeText": False},
+                },
+            },
+            "serverInfo": {"name": "harness", "version": __version__},
+        }
+
+    def _shutdown(self, params: dict):
+        self.shut_down = True
+        return None
+
+    def _exit(self, params: dict):
+        self.exited = True
+
+    # ── documents ──────────────────────────────────────────────────────
+    def _did_open(self, params: dict):
+        item = params["textDocument"]
+        self.documents[item["uri"]] = Document(item["uri"], item["text"], item.get("version"))
+        self._due[item["uri"]] = time.monotonic()
+
+    def _did_change(self, params: dict):
+        identifier = params["textDocument"]
+        document = self.documents[identifier["uri"]]
+        for change in params["contentChanges"]:
+            document.text = apply_change(document.text, change)
+        document.version = identifier.get("version")
+        self._due[document.uri] = time.monotonic() + self.debounce
+
+    def _did_save(self, params: dict):
+        uri = params["textDocument"]["uri"]
+        if uri in self.documents:
+            self._due[uri] = time.monotonic()
+
+    def _did_close(self, params: dict):
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self._due.pop(uri, None)
+        self.notify("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+    # ── linting ────────────────────────────────────────────────────────
+    def _linter(self, document: Document) -> IncrementalLinter:
+        ruleset = self.state.ruleset()
+        ledger = self.state.ledger()
+        linter = document.linter
+        if linter is None or linter.ruleset is not ruleset or linter.ledger is not ledger:
+            linter = document.linter = IncrementalLinter(ruleset, ledger)
+        return linter
+
+    def lint(self, document: Document) -> List[dict]:
+        """Re-lint a document and return its diagnostics."""
+        style, continuity = self._linter(document).lint(document.text)
+        starts = line_starts(document.text)
+        return [diagnostic(document.text, starts, v) for v in style + continuity]
+
+    def _lint_due(self):
+        now = time.monotonic()
+        for uri, due in list(self._due.items()):
+            if due > now:
+                continue
+            del self._due[uri]
+            document = self.documents.get(uri)
+            if document is None:
+                continue
+            try:
+                diagnostics = self.lint(document)
+            except Exception as e:
+                self.notify("window/logMessage", {"type": MESSAGE_ERROR, "message": f"lint {uri}: {type(e).__name__}: {e}"})
+                continue
+            params: Dict[str, Any] = {"uri": uri, "diagnostics": diagnostics}
+            if document.version is not None:
+                params["version"] = document.version
+            self.notify("textDocument/publishDiagnostics", params)
@@ -1,16 +1,25 @@
-from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Literal, Union
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
+from harness.lint.patterns import INANIMATE_SUBJECTS, EMOTIONAL_VERBS, ANTHROPOMORPHISM_WINDOW
 
 
 class ContinuityLedger(BaseModel):
     """The persistent story state."""
     location_current: str
     location_previous: Optional[str] = None
+    # The places enclosing location_current, outermost first, e.g.
+    # ["Novo-Ogaryovo", "bathing wing", "private salon"]; when empty,
+    # location_current split at " — " or " > ".
+    location_hierarchy: List[str] = Field(default_factory=list)
+    # Other names a place goes by, e.g. {"private salon": ["the salon"]}.
+    location_aliases: Dict[str, List[str]] = Field(default_factory=dict)
     time_of_day: str
     date_or_day_count: str
     elapsed_time_since_last_scene: str
     who_present: List[str] = Field(default_factory=list)
+    # Other names a who_present character goes by, e.g. {"Phoenix": ["Nix"]}.
+    character_aliases: Dict[str, List[str]] = Field(default_factory=dict)
     transport_last_leg: Optional[Dict[str, Any]] = None
     relationship_elapsed_time: Optional[str] = None
     relationship_last_contact: Optional[str] = None
@@ -20,24 +29,81 @@ class ContinuityLedger(BaseModel):
     scene_goal: str = ""
     tone_profile: str = ""
 
+    @field_validator("character_aliases", "location_aliases", mode="before")
+    @classmethod
+    def _alias_lists(cls, value):
+        # A single alias may be written as a plain string.
+        if isinstance(value, dict):
+            return {name: [aliases] if isinstance(aliases, str) else aliases for name, aliases in value.items()}
+        return value
+
+
+class AnthropomorphismConfig(BaseModel):
+    """Nouns and verbs for the object anthropomorphism check."""
+    nouns: List[str] = Field(default_factory=lambda: list(INANIMATE_SUBJECTS))
+    verbs: List[str] = Field(default_factory=lambda: list(EMOTIONAL_VERBS))
+    window: int = Field(default=ANTHROPOMORPHISM_WINDOW, ge=1)
+
+
+class StreamAbortConfig(BaseModel):
+    """When to cancel a streamed draft: more than max_errors errors in the first within_words words."""
+    max_errors: Optional[int] = Field(default=None, ge=0)
+    within_words: Optional[int] = Field(default=200, ge=1)
+
+
+class LintConfig(BaseModel):
+    """Linter settings from the `lint` section of style_rules.yaml.
+
+    `select` and `ignore` name rules by category ("style", "continuity"),
+    group or check ("banned", "style:pov_and_address") or rule ID
+    ("banned:3"); an empty `select` runs every rule.
+    """
+    object_anthropomorphism: AnthropomorphismConfig = Field(default_factory=AnthropomorphismConfig)
+    stream_abort: StreamAbortConfig = Field(default_factory=StreamAbortConfig)
+    pattern_time_budget: Optional[float] = Field(default=1.0, gt=0)
+    max_violations_per_rule: Optional[int] = Field(default=None, ge=1)
+    select: List[str] = Field(default_factory=list)
+    ignore: List[str] = Field(default_factory=list)
+
 
 class StyleRules(BaseModel):
     """Collection of writing rules with categorical structure."""
     hard_rules: Dict[str, Union[List[str], str]] = Field(default_factory=dict)
     soft_preferences: Dict[str, Union[List[str], str]] = Field(default_factory=dict)
     output_targets: Optional[Dict[str, Any]] = None
+    lint: LintConfig = Field(default_factory=LintConfig)
+
+
+class PhraseFix(BaseModel):
+    """Deterministic rewrite for a matched phrase: delete it, replace it, or drop its clause.
+
+    `replacement` is a match.expand() template, so it may refer to groups
+    as \\1 or \\g<name>.
+    """
+    action: Literal["delete", "replace", "drop_clause"]
+    replacement: str = ""
 
 
 class BannedPhrases(BaseModel):
-    """Regex patterns to flag as violations."""
+    """Regex patterns to flag as violations, with optional autofixes keyed by pattern."""
     banned_regex: List[str] = Field(default_factory=list)
     warn_regex: List[str] = Field(default_factory=list)
+    fixes: Dict[str, PhraseFix] = Field(default_factory=dict)
 
 
 class LintViolation(BaseModel):
-    """A single lint violation."""
+    """A single lint violation.
+
+    `column` is 1-based like `line_number`; `start` and `end` are character
+    offsets into the linted text (end exclusive). `rule_id` names the rule
+    or check that reported it, such as "banned:0" or "style:pov_and_address".
+    """
     category: str
     severity: str
     message: str
     line_number: Optional[int] = None
     context: str = ""
+    column: Optional[int] = None
+    start: Optional[int] = None
+    end: Optional[int] = None
+    rule_id: Optional[str] = None
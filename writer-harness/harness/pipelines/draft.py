@@ -1,14 +1,16 @@
 from pathlib import Path
+from typing import List, Optional, Tuple
 import yaml
 
 from harness.config import settings
-from harness.models import ContinuityLedger
+from harness.models import ContinuityLedger, StyleRules
 from harness.prompt_builder import build_draft_prompt
 from harness.providers import get_provider
 from harness.lore.retrieve import retrieve_lore, extract_keywords
-from harness.lint.rules import load_style_rules, load_banned_phrases
-from harness.lint.style import lint_style
-from harness.lint.continuity import lint_continuity
+from harness.lint.rules import load_style_rules
+from harness.lint.ruleset import load_ruleset
+from harness.lint.cache import lint_text, workspace_cache
+from harness.lint.streaming import StreamingLinter, consume_stream
 
 
 def load_continuity_ledger(state_path: Path) -> ContinuityLedger:
@@ -50,13 +52,39 @@ def extract_seed_text(scene_content: str) -> str:
     return '\n'.join(lines[seed_start:]).strip()
 
 
+def build_scene_prompt(
+    seed_text: str,
+    ledger: ContinuityLedger,
+    rules: StyleRules,
+    lore_dir: Path,
+    lore_k: int = 8,
+    use_lore: bool = True,
+    lore_entries: Optional[List[Tuple[str, str]]] = None,
+) -> str:
+    """The draft prompt for a seed, with the lore snippets its keywords retrieve."""
+    lore_snippets = []
+    if use_lore:
+        keywords = extract_keywords(seed_text + " " + ledger.location_current)
+        lore_snippets = retrieve_lore(keywords, lore_dir, top_k=lore_k, entries=lore_entries)
+
+    return build_draft_prompt(ledger, rules, seed_text, lore_snippets)
+
+
 def draft_scene(
     scene_path: Path,
     workspace_root: Path = settings.workspace_root,
     lore_k: int = 8,
     use_lore: bool = True,
+    stream: bool = False,
+    max_errors: Optional[int] = None,
 ) -> dict:
-    """Generate a draft of a scene."""
+    """Generate a draft of a scene.
+
+    With stream=True the draft is linted as it arrives and generation is
+    cancelled once the lint.stream_abort threshold is passed (max_errors
+    overrides its max_errors); the partial text is returned with
+    aborted=True.
+    """
     with open(scene_path, "r") as f:
         scene_content = f.read()
 
@@ -69,15 +97,10 @@ def draft_scene(
     rules = load_style_rules(rules_path)
 
     banned_path = workspace_root / "banned_phrases.yaml"
-    banned = load_banned_phrases(banned_path)
+    ruleset = load_ruleset(banned_path, rules_path)
+    cache = workspace_cache(workspace_root)
 
-    lore_snippets = []
-    if use_lore:
-        keywords = extract_keywords(seed_text + " " + ledger.location_current)
-        lore_dir = workspace_root / "lore"
-        lore_snippets = retrieve_lore(keywords, lore_dir, top_k=lore_k)
-
-    prompt = build_draft_prompt(ledger, rules, seed_text, lore_snippets)
+    prompt = build_scene_prompt(seed_text, ledger, rules, workspace_root / "lore", lore_k, use_lore)
 
     settings.validate_provider()
     provider = get_provider(
@@ -85,13 +108,23 @@ def draft_scene(
         settings.anthropic_api_key or settings.openai_api_key,
         settings.model_name,
     )
-    draft_text = provider.generate(prompt, max_tokens=settings.max_tokens)
-
-    style_violations = lint_style(draft_text, banned, scene_location=ledger.location_current)
-    continuity_violations = lint_continuity(draft_text, ledger)
+    aborted = False
+    if stream:
+        abort = rules.lint.stream_abort
+        if max_errors is not None:
+            abort = abort.model_copy(update={"max_errors": max_errors})
+        streamer = StreamingLinter(ruleset, ledger, abort)
+        draft_text = consume_stream(provider.stream(prompt, max_tokens=settings.max_tokens), streamer)
+        aborted = streamer.aborted
+    else:
+        draft_text = provider.generate(prompt, max_tokens=settings.max_tokens)
+
+    style_violations, continuity_violations = lint_text(draft_text, ruleset, ledger, cache)
 
     return {
         "draft_text": draft_text,
         "style_violations": style_violations,
         "continuity_violations": continuity_violations,
+        "aborted": aborted,
+        "ledger": ledger,
     }
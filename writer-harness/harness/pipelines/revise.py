@@ -3,17 +3,24 @@ from pathlib import Path
 from harness.config import settings
 from harness.prompt_builder import build_revise_prompt
 from harness.providers import get_provider
-from harness.lint.rules import load_style_rules, load_banned_phrases
-from harness.lint.style import lint_style
-from harness.lint.continuity import lint_continuity
+from harness.lint.rules import load_style_rules
+from harness.lint.ruleset import load_ruleset
+from harness.lint.cache import lint_text, workspace_cache
+from harness.lint.autofix import apply_fixes
 from harness.pipelines.draft import load_continuity_ledger
 
 
 def revise_draft(
     draft_text: str,
     workspace_root: Path = settings.workspace_root,
+    autofix_first: bool = False,
 ) -> dict:
-    """Revise a draft to fix violations."""
+    """Revise a draft to fix violations.
+
+    With autofix_first, the fixes defined in banned_phrases.yaml are applied
+    before anything else, and the provider is only called if violations
+    remain afterwards.
+    """
     state_path = workspace_root / "state.yaml"
     ledger = load_continuity_ledger(state_path)
 
@@ -21,10 +28,24 @@ def revise_draft(
     rules = load_style_rules(rules_path)
 
     banned_path = workspace_root / "banned_phrases.yaml"
-    banned = load_banned_phrases(banned_path)
+    ruleset = load_ruleset(banned_path, rules_path)
+    cache = workspace_cache(workspace_root)
+
+    autofixes = []
+    if autofix_first:
+        fixed = apply_fixes(draft_text, ruleset)
+        draft_text = fixed.text
+        autofixes = fixed.applied
 
-    style_violations = lint_style(draft_text, banned, scene_location=ledger.location_current)
-    continuity_violations = lint_continuity(draft_text, ledger)
+    style_violations, continuity_violations = lint_text(draft_text, ruleset, ledger, cache)
+    if autofix_first and not style_violations and not continuity_violations:
+        return {
+            "revised_text": draft_text,
+            "style_violations": [],
+            "continuity_violations": [],
+            "autofixes": autofixes,
+            "provider_called": False,
+        }
 
     style_msgs = [v.message for v in style_violations]
     continuity_msgs = [v.message for v in continuity_violations]
@@ -39,11 +60,12 @@ def revise_draft(
     )
     revised_text = provider.generate(prompt, max_tokens=settings.max_tokens)
 
-    style_violations_after = lint_style(revised_text, banned, scene_location=ledger.location_current)
-    continuity_violations_after = lint_continuity(revised_text, ledger)
+    style_violations_after, continuity_violations_after = lint_text(revised_text, ruleset, ledger, cache)
 
     return {
         "revised_text": revised_text,
         "style_violations": style_violations_after,
         "continuity_violations": continuity_violations_after,
+        "autofixes": autofixes,
+        "provider_called": True,
     }
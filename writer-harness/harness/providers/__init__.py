@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 
 class LLMProvider(ABC):
@@ -9,6 +10,14 @@ class LLMProvider(ABC):
         """Generate text from prompt."""
         pass
 
+    def stream(self, prompt: str, max_tokens: int) -> Iterator[str]:
+        """Yield text chunks as they are generated.
+
+        Closing the iterator early cancels the request. Providers without
+        streaming support yield the whole response at once.
+        """
+        yield self.generate(prompt, max_tokens)
+
 
 def get_provider(provider_name: str, api_key: str, model_name: str):
     """Factory function to get a provider instance."""
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 import anthropic
 from harness.providers import LLMProvider
 
@@ -19,3 +21,15 @@ class AnthropicProvider(LLMProvider):
             ],
         )
         return message.content[0].text
+
+    def stream(self, prompt: str, max_tokens: int = 4000) -> Iterator[str]:
+        """Stream text from Claude; closing the iterator closes the connection."""
+        with self.client.messages.stream(
+            model=self.model_name,
+            max_tokens=max_tokens,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
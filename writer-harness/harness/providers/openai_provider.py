@@ -1,3 +1,5 @@
+from typing import Iterator
+
 import openai
 from harness.providers import LLMProvider
 
@@ -19,3 +21,20 @@ class OpenAIProvider(LLMProvider):
             ],
         )
         return response.choices[0].message.content
+
+    def stream(self, prompt: str, max_tokens: int = 4000) -> Iterator[str]:
+        """Stream text from GPT; closing the iterator closes the connection."""
+        response = self.client.chat.completions.create(
+            model=self.model_name,
+            max_tokens=max_tokens,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            stream=True,
+        )
+        try:
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            response.close()
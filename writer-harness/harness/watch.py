@@ -0,0 +1,270 @@
+"""Watch mode for `harness lint --watch`: re-lint only the files that change.
+
+Changes are read from inotify on Linux (through ctypes, so no extra
+dependency) and found by polling file stats elsewhere, in-process either
+way. Bursts of events are debounced into one batch. The compiled rules
+and ledger stay loaded between batches and are reloaded when
+banned_phrases.yaml, style_rules.yaml or state.yaml change, which
+re-lints every watched file.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from harness.daemon import WorkspaceState
+from harness.models import ContinuityLedger
+from harness.lint.corpus import TEXT_SUFFIXES, FileReport, expand_targets, lint_files
+from harness.lint.ruleset import RuleSet, select_rules
+
+CONFIG_FILES = ("banned_phrases.yaml", "style_rules.yaml", "state.yaml")
+DEFAULT_DEBOUNCE = 0.2
+POLL_INTERVAL = 0.5
+
+# inotify(7) event bits.
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Directory watches read from an inotify file descriptor."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # watch descriptor -> (directory, recursive)
+        self._watches: Dict[int, Tuple[Path, bool]] = {}
+
+    def add(self, directory: Path, recursive: bool = True):
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+        self._watches[wd] = (directory, recursive)
+        if recursive:
+            for child in sorted(directory.iterdir()):
+                if child.is_dir() and not child.is_symlink():
+                    self.add(child)
+
+    def changes(self, timeout: Optional[float]) -> Set[Path]:
+        """Paths created, written, moved or deleted, waiting up to timeout seconds (None: until any)."""
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        changed: Set[Path] = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT.unpack_from(data, offset)
+            name = data[offset + EVENT.size:offset + EVENT.size + length].rstrip(b"\0")
+            offset += EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost; report every watched directory so callers rescan them.
+                changed.update(directory for directory, _ in self._watches.values())
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if wd not in self._watches:
+                continue
+            directory, recursive = self._watches[wd]
+            if not name:
+                continue
+            path = directory / os.fsdecode(name)
+            changed.add(path)
+            if recursive and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and path.is_dir():
+                self.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """The same interface as InotifyWatcher, by comparing file stats every interval."""
+
+    def __init__(self, interval: float = POLL_INTERVAL):
+        self.interval = interval
+        self._dirs: List[Tuple[Path, bool]] = []
+        self._snapshot: Dict[Path, Tuple[int, int]] = {}
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for directory, recursive in self._dirs:
+            children = directory.rglob("*") if recursive else directory.iterdir()
+            for path in children:
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def add(self, directory: Path, recursive: bool = True):
+        self._dirs.append((directory, recursive))
+        self._snapshot = self._scan()
+
+    def changes(self, timeout: Optional[float]) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(wait)
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self._snapshot.keys() if snapshot.get(path) != self._snapshot.get(path)}
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def open_watcher():
+    """An InotifyWatcher where the platform has inotify, else a PollingWatcher."""
+    try:
+        return InotifyWatcher()
+    except (OSError, AttributeError, TypeError):
+        return PollingWatcher()
+
+
+def debounced(watcher, debounce: float = DEFAULT_DEBOUNCE) -> Iterator[Set[Path]]:
+    """Yield the paths changed in each burst, once no event has arrived for debounce seconds."""
+    while True:
+        changed = watcher.changes(None)
+        while changed:
+            more = watcher.changes(debounce)
+            if not more:
+                break
+            changed |= more
+        if changed:
+            yield changed
+
+
+@dataclass
+class Batch:
+    """What one debounced burst of changes led to."""
+
+    reports: List[FileReport] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    reloaded: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+class LintWatch:
+    """Keep rules and ledger loaded and re-lint the watched files that change.
+
+    Directory targets are watched recursively for .md/.txt files, including
+    ones created later; file and glob targets are watched as the files they
+    name when the watch starts.
+    """
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        targets: Iterable[str],
+        jobs: Optional[int] = None,
+        no_cache: bool = False,
+        select: Optional[List[str]] = None,
+        ignore: Optional[List[str]] = None,
+        stream: bool = False,
+    ):
+        self.state = WorkspaceState(Path(workspace_root).resolve())
+        self.jobs = jobs
+        self.cache = None if no_cache else self.state.cache
+        self.select = select
+        self.ignore = ignore
+        self.stream = stream
+        self.dirs: List[Path] = []
+        self.files: Dict[str, Path] = {}
+        for target in targets:
+            if Path(target).is_dir():
+                self.dirs.append(Path(target))
+            else:
+                for path in expand_targets([target]):
+                    self.files[os.path.realpath(path)] = path
+        self.config = {self.state.root / name: name for name in CONFIG_FILES}
+        self.ruleset, self.ledger = self._load()
+
+    def _load(self) -> Tuple[RuleSet, ContinuityLedger]:
+        return select_rules(self.state.ruleset(), self.select, self.ignore), self.state.ledger()
+
+    def paths(self) -> List[Path]:
+        """Every file currently being watched, in lint order."""
+        return expand_targets([str(directory) for directory in self.dirs] + [str(path) for path in self.files.values()])
+
+    def start(self, watcher) -> List[Path]:
+        """Register the watches this session needs with watcher; return the directories watched."""
+        watched = [(self.state.root, False)]
+        watched += [(directory, True) for directory in self.dirs]
+        watched += [(path.parent, False) for path in self.files.values()]
+        added = []
+        seen = set()
+        for directory, recursive in watched:
+            key = (os.path.realpath(directory), recursive)
+            if key not in seen and directory.is_dir():
+                seen.add(key)
+                watcher.add(directory, recursive)
+                added.append(directory)
+        return added
+
+    def lint(self, paths: List[Path]) -> List[FileReport]:
+        return list(lint_files(paths, self.ruleset, self.ledger, jobs=self.jobs, cache=self.cache, stream=self.stream))
+
+    def _watched(self, path: Path) -> bool:
+        if os.path.realpath(path) in self.files:
+            return True
+        return path.suffix in TEXT_SUFFIXES and any(directory in path.parents for directory in self.dirs)
+
+    def handle(self, changed: Set[Path]) -> Batch:
+        """Re-lint what a set of changed paths affects."""
+        batch = Batch()
+        reloaded = sorted(self.config[path] for path in changed if path in self.config)
+        if reloaded:
+            try:
+                ruleset, ledger = self._load()
+            except Exception as e:
+                batch.error = f"Keeping the previous rules: {e}"
+            else:
+                if ruleset is not self.ruleset or ledger is not self.ledger:
+                    self.ruleset, self.ledger = ruleset, ledger
+                    batch.reloaded = reloaded
+                    batch.reports = self.lint(self.paths())
+                    return batch
+
+        to_lint: List[Path] = []
+        for path in sorted(changed):
+            if path.is_dir() and any(path == directory or directory in path.parents for directory in self.dirs):
+                to_lint.extend(expand_targets([str(path)]))
+            elif self._watched(path):
+                if path.is_file():
+                    to_lint.append(path)
+                else:
+                    batch.removed.append(path)
+        if to_lint:
+            batch.reports = self.lint(list(dict.fromkeys(to_lint)))
+        return batch
+
+    def batches(self, watcher, debounce: float = DEFAULT_DEBOUNCE) -> Iterator[Batch]:
+        for changed in debounced(watcher, debounce):
+            batch = self.handle(changed)
+            if batch.reports or batch.removed or batch.reloaded or batch.error:
+                yield batch
@@ -0,0 +1,23 @@
+"""Fixtures shared by the lint tests: a scene's ledger and a small rule set."""
+import pytest
+from harness.models import BannedPhrases, ContinuityLedger
+from harness.lint.ruleset import compile_ruleset
+
+
+@pytest.fixture
+def ledger():
+    return ContinuityLedger(
+        location_current="Salon",
+        time_of_day="evening",
+        date_or_day_count="Day 1",
+        elapsed_time_since_last_scene="10 minutes",
+        who_present=["Phoenix"],
+    )
+
+
+@pytest.fixture
+def ruleset():
+    return compile_ruleset(BannedPhrases(
+        banned_regex=[r"(?i)breath\s+hitch"],
+        warn_regex=[r"(?i)cufflinks\b", r"(?i)\bperfectly\b"],
+    ))
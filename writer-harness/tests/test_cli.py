@@ -1,4 +1,7 @@
 """Tests for harness.cli — Click CLI commands."""
+import json
+import subprocess
+import sys
 import pytest
 import yaml
 from pathlib import Path
@@ -6,6 +9,7 @@ from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
 from harness.cli import cli, create_workspace
 from harness.models import LintViolation
+from harness.pipelines.draft import load_continuity_ledger
 
 
 # ── create_workspace ────────────────────────────────────────────────
@@ -119,6 +123,112 @@ class TestCLILint:
         assert result.exit_code == 0
         assert "violation" in result.output.lower() or "ERROR" in result.output or "Banned" in result.output
 
+    @patch("harness.cli.settings")
+    def test_lint_stream(self, mock_settings, tmp_path):
+        ws = tmp_path / "workspace"
+        create_workspace(ws)
+        mock_settings.workspace_root = ws
+
+        text_file = tmp_path / "book.md"
+        text_file.write_text("Her breath hitched.\n\nThe reader noticed.\n" * 50)
+
+        runner = CliRunner()
+        streamed = runner.invoke(cli, ["lint", "--stream", "--no-cache", str(text_file)])
+        whole = runner.invoke(cli, ["lint", "--no-cache", str(text_file)])
+        assert streamed.exit_code == 0
+        assert "Banned" in streamed.output
+        assert streamed.output.splitlines()[-1] == whole.output.splitlines()[-1]
+
+    @patch("harness.cli.settings")
+    def test_lint_directory_and_glob(self, mock_settings, tmp_path):
+        ws = tmp_path / "workspace"
+        create_workspace(ws)
+        mock_settings.workspace_root = ws
+
+        book = tmp_path / "book"
+        book.mkdir()
+        (book / "a.md").write_text("Her breath hitched.")
+        (book / "b.md").write_text("He waited.")
+        (tmp_path / "c.md").write_text("The reader noticed.")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["lint", str(book), str(tmp_path / "*.md"), "--jobs", "2"])
+        assert result.exit_code == 0
+        assert "Linted 3 files" in result.output
+        assert "a.md" in result.output and "c.md" in result.output
+
+    @patch("harness.cli.settings")
+    def test_lint_profile(self, mock_settings, tmp_path):
+        ws = tmp_path / "workspace"
+        create_workspace(ws)
+        mock_settings.workspace_root = ws
+
+        text_file = tmp_path / "bad.txt"
+        text_file.write_text("Her breath hitched. The reader noticed.")
+        profile_path = tmp_path / "profile.json"
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["lint", str(text_file), "--profile", "--profile-json", str(profile_path)])
+        assert result.exit_code == 0
+        assert "Lint rule profile" in result.output
+        rule_ids = [r["rule_id"] for r in json.loads(profile_path.read_text())["rules"]]
+        assert "banned:0" in rule_ids and "continuity:timeline" in rule_ids
+
+    @patch("harness.cli.settings")
+    def test_lint_select_and_ignore(self, mock_settings, tmp_path):
+        ws = tmp_path / "workspace"
+        create_workspace(ws)
+        mock_settings.workspace_root = ws
+
+        text_file = tmp_path / "bad.txt"
+        text_file.write_text("Her breath hitched. You wait. The reader noticed.")
+
+        runner = CliRunner()
+        selected = runner.invoke(cli, ["lint", "--no-cache", "--select", "banned,style:pov_and_address", str(text_file)])
+        assert selected.exit_code == 0
+        assert "Banned" in selected.output and "Second-person" in selected.output
+        assert "Continuity" not in selected.output
+        assert "Total violations: 3" in selected.output
+
+        ignored = runner.invoke(cli, ["lint", "--no-cache", "--ignore", "banned", "--ignore", "continuity", str(text_file)])
+        assert "Banned" not in ignored.output and "Continuity" not in ignored.output
+        assert "Second-person" in ignored.output
+
+    @patch("harness.cli.settings")
+    def test_lint_fail_fast(self, mock_settings, tmp_path):
+        ws = tmp_path / "workspace"
+        create_workspace(ws)
+        mock_settings.workspace_root = ws
+
+        book = tmp_path / "book"
+        book.mkdir()
+        (book / "a.md").write_text("He waited.")
+        (book / "b.md").write_text("Her breath hitched.")
+        (book / "c.md").write_text("Her breath hitched.")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["lint", "--fail-fast", str(book)])
+        assert result.exit_code == 1
+        assert "Linted 2 files" in result.output
+        assert "Stopped at the first error" in result.output and "c.md" not in result.output
+
+        clean = runner.invoke(cli, ["lint", "--fail-fast", str(book / "a.md")])
+        assert clean.exit_code == 0
+
+    @patch("harness.cli.settings")
+    def test_lint_fail_fast_with_stream(self, mock_settings, tmp_path):
+        mock_settings.workspace_root = tmp_path
+        result = CliRunner().invoke(cli, ["lint", "--fail-fast", "--stream", str(tmp_path)])
+        assert result.exit_code == 2
+
+    @patch("harness.cli.settings")
+    def test_lint_no_matches(self, mock_settings, tmp_path):
+        mock_settings.workspace_root = tmp_path
+        runner = CliRunner()
+        result = runner.invoke(cli, ["lint", str(tmp_path / "*.md")])
+        assert result.exit_code != 0
+        assert "No files matched" in result.output
+
 
 # ── helpers ─────────────────────────────────────────────────────────
 def _setup_workspace(tmp_path):
@@ -134,7 +244,7 @@ def _setup_workspace(tmp_path):
 
 # ── CLI draft command ───────────────────────────────────────────────
 class TestCLIDraft:
-    @patch("harness.cli.draft_scene")
+    @patch("harness.pipelines.draft.draft_scene")
     @patch("harness.cli.settings")
     def test_draft_clean(self, mock_settings, mock_draft_scene, tmp_path):
         ws, scene_path = _setup_workspace(tmp_path)
@@ -166,7 +276,7 @@ class TestCLIDraft:
         continuity_report = (ws / "outputs" / "0001_continuity_lint.md").read_text()
         assert "No continuity violations" in continuity_report
 
-    @patch("harness.cli.draft_scene")
+    @patch("harness.pipelines.draft.draft_scene")
     @patch("harness.cli.settings")
     def test_draft_with_violations(self, mock_settings, mock_draft_scene, tmp_path):
         ws, scene_path = _setup_workspace(tmp_path)
@@ -203,7 +313,28 @@ class TestCLIDraft:
         continuity_report = (ws / "outputs" / "0001_continuity_lint.md").read_text()
         assert "Phoenix" in continuity_report
 
-    @patch("harness.cli.draft_scene")
+    @patch("harness.pipelines.draft.draft_scene")
+    @patch("harness.cli.settings")
+    def test_draft_stream_aborted(self, mock_settings, mock_draft_scene, tmp_path):
+        ws, scene_path = _setup_workspace(tmp_path)
+        mock_settings.workspace_root = ws
+
+        mock_draft_scene.return_value = {
+            "draft_text": "Her breath hitched.",
+            "style_violations": [],
+            "continuity_violations": [],
+            "aborted": True,
+        }
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["draft", str(scene_path), "--stream", "--abort-after", "2"])
+        assert result.exit_code == 0
+        assert "stopped early" in result.output
+        assert mock_draft_scene.call_args.kwargs["stream"] is True
+        assert mock_draft_scene.call_args.kwargs["max_errors"] == 2
+        assert (ws / "outputs" / "0001_scene_draft.md").exists()
+
+    @patch("harness.pipelines.draft.draft_scene")
     @patch("harness.cli.settings")
     def test_draft_error_handling(self, mock_settings, mock_draft_scene, tmp_path):
         ws, scene_path = _setup_workspace(tmp_path)
@@ -217,7 +348,7 @@ class TestCLIDraft:
 
 # ── CLI revise command ──────────────────────────────────────────────
 class TestCLIRevise:
-    @patch("harness.cli.revise_draft")
+    @patch("harness.pipelines.revise.revise_draft")
     @patch("harness.cli.settings")
     def test_revise_clean(self, mock_settings, mock_revise, tmp_path):
         ws, _ = _setup_workspace(tmp_path)
@@ -247,7 +378,7 @@ class TestCLIRevise:
         report = (ws / "outputs" / "0001_revise_lint.md").read_text()
         assert "None." in report
 
-    @patch("harness.cli.revise_draft")
+    @patch("harness.pipelines.revise.revise_draft")
     @patch("harness.cli.settings")
     def test_revise_with_remaining_violations(self, mock_settings, mock_revise, tmp_path):
         ws, _ = _setup_workspace(tmp_path)
@@ -276,7 +407,7 @@ class TestCLIRevise:
         report = (ws / "outputs" / "0001_revise_lint.md").read_text()
         assert "you" in report.lower()
 
-    @patch("harness.cli.revise_draft")
+    @patch("harness.pipelines.revise.revise_draft")
     @patch("harness.cli.settings")
     def test_revise_with_continuity_violations(self, mock_settings, mock_revise, tmp_path):
         ws, _ = _setup_workspace(tmp_path)
@@ -305,7 +436,7 @@ class TestCLIRevise:
         report = (ws / "outputs" / "0001_revise_lint.md").read_text()
         assert "Phoenix" in report
 
-    @patch("harness.cli.revise_draft")
+    @patch("harness.pipelines.revise.revise_draft")
     @patch("harness.cli.settings")
     def test_revise_strict_fails_on_violations(self, mock_settings, mock_revise, tmp_path):
         ws, _ = _setup_workspace(tmp_path)
@@ -331,7 +462,7 @@ class TestCLIRevise:
         assert result.exit_code == 1
         assert "Strict mode" in result.output
 
-    @patch("harness.cli.revise_draft")
+    @patch("harness.pipelines.revise.revise_draft")
     @patch("harness.cli.settings")
     def test_revise_strict_passes_when_clean(self, mock_settings, mock_revise, tmp_path):
         ws, _ = _setup_workspace(tmp_path)
@@ -350,7 +481,7 @@ class TestCLIRevise:
         result = runner.invoke(cli, ["revise", "--strict", str(draft_path)])
         assert result.exit_code == 0
 
-    @patch("harness.cli.revise_draft")
+    @patch("harness.pipelines.revise.revise_draft")
     @patch("harness.cli.settings")
     def test_revise_error_handling(self, mock_settings, mock_revise, tmp_path):
         ws, _ = _setup_workspace(tmp_path)
@@ -365,6 +496,138 @@ class TestCLIRevise:
         assert result.exit_code == 1
 
 
+    @patch("harness.pipelines.revise.revise_draft")
+    @patch("harness.cli.settings")
+    def test_revise_autofix_first(self, mock_settings, mock_revise, tmp_path):
+        ws, _ = _setup_workspace(tmp_path)
+        mock_settings.workspace_root = ws
+
+        draft_path = ws / "outputs" / "0001_scene_draft.md"
+        draft_path.write_text("The spilled ink dried.")
+
+        mock_revise.return_value = {
+            "revised_text": "The ink dried.",
+            "style_violations": [],
+            "continuity_violations": [],
+            "autofixes": [MagicMock()],
+            "provider_called": False,
+        }
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["revise", "--autofix-first", str(draft_path)])
+        assert result.exit_code == 0
+        assert mock_revise.call_args.kwargs["autofix_first"] is True
+        assert "Applied 1 autofixes" in result.output
+        assert "skipped the LLM" in result.output
+
+
+# ── CLI fix command ─────────────────────────────────────────────────
+class TestCLIFix:
+    @patch("harness.cli.settings")
+    def test_fix_rewrites_file(self, mock_settings, tmp_path):
+        ws = tmp_path / "workspace"
+        create_workspace(ws)
+        mock_settings.workspace_root = ws
+
+        text_file = tmp_path / "draft.md"
+        text_file.write_text("The spilled ink dried, and she realizes it.\nHer breath hitched.\n")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["fix", str(text_file)])
+        assert result.exit_code == 0
+        assert text_file.read_text() == "The ink dried.\nHer breath hitched.\n"
+        assert "Applied 2 fixes" in result.output
+
+    @patch("harness.cli.settings")
+    def test_fix_dry_run(self, mock_settings, tmp_path):
+        ws = tmp_path / "workspace"
+        create_workspace(ws)
+        mock_settings.workspace_root = ws
+
+        text_file = tmp_path / "draft.md"
+        text_file.write_text("The spilled ink dried.")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["fix", "--dry-run", str(text_file)])
+        assert result.exit_code == 0
+        assert text_file.read_text() == "The spilled ink dried."
+        assert "Would apply 1 fixes" in result.output
+
+    @patch("harness.cli.settings")
+    def test_fix_no_matches(self, mock_settings, tmp_path):
+        ws = tmp_path / "workspace"
+        create_workspace(ws)
+        mock_settings.workspace_root = ws
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["fix", str(tmp_path / "missing" / "*.md")])
+        assert result.exit_code == 1
+
+
+# ── CLI ledger and continuity commands ──────────────────────────────
+class TestCLILedger:
+    @patch("harness.pipelines.draft.draft_scene")
+    @patch("harness.cli.settings")
+    def test_draft_records_ledger(self, mock_settings, mock_draft_scene, tmp_path):
+        ws, scene_path = _setup_workspace(tmp_path)
+        mock_settings.workspace_root = ws
+        mock_draft_scene.return_value = {
+            "draft_text": "He sat in Novo-Ogaryovo. Phoenix waited.",
+            "style_violations": [],
+            "continuity_violations": [],
+            "ledger": load_continuity_ledger(ws / "state.yaml"),
+        }
+        result = CliRunner().invoke(cli, ["draft", str(scene_path)])
+        assert result.exit_code == 0
+        assert "scene 1 version 1" in result.output
+        assert (ws / "ledger" / "history.jsonl").exists()
+
+    @patch("harness.cli.settings")
+    def test_record_show_log(self, mock_settings, tmp_path):
+        ws, _ = _setup_workspace(tmp_path)
+        mock_settings.workspace_root = ws
+        runner = CliRunner()
+        assert runner.invoke(cli, ["ledger", "record", "3"]).exit_code == 0
+        result = runner.invoke(cli, ["ledger", "show", "3"])
+        assert result.exit_code == 0
+        assert yaml.safe_load(result.output)["date_or_day_count"] == "Day 17"
+        assert runner.invoke(cli, ["ledger", "show", "3", "--version", "2"]).exit_code == 1
+        assert runner.invoke(cli, ["ledger", "show", "4"]).exit_code == 1
+        result = runner.invoke(cli, ["ledger", "log"])
+        assert result.exit_code == 0
+        assert "3" in result.output
+
+    @patch("harness.cli.settings")
+    def test_continuity_across_scenes(self, mock_settings, tmp_path):
+        ws, _ = _setup_workspace(tmp_path)
+        mock_settings.workspace_root = ws
+        runner = CliRunner()
+        runner.invoke(cli, ["ledger", "record", "1"])
+        state = yaml.safe_load((ws / "state.yaml").read_text())
+        state["date_or_day_count"] = "Day 16"
+        (ws / "state.yaml").write_text(yaml.safe_dump(state))
+        runner.invoke(cli, ["ledger", "record", "2"])
+        (ws / "outputs" / "0002_scene_out.md").write_text("He waited in the Novo-Ogaryovo salon with Phoenix.")
+        (ws / "outputs" / "0003_scene_draft.md").write_text("Unrecorded.")
+
+        result = runner.invoke(cli, ["continuity", "--jobs", "1"])
+        assert result.exit_code == 1
+        assert "Story time runs backwards" in result.output
+        assert "Checked 2 scenes" in result.output
+        assert "No recorded ledger for scenes: 3" in result.output
+
+        result = runner.invoke(cli, ["continuity", "--jobs", "1", "--ignore", "continuity:time_order"])
+        assert result.exit_code == 0
+
+    @patch("harness.cli.settings")
+    def test_continuity_without_ledgers(self, mock_settings, tmp_path):
+        ws, _ = _setup_workspace(tmp_path)
+        mock_settings.workspace_root = ws
+        result = CliRunner().invoke(cli, ["continuity"])
+        assert result.exit_code == 1
+        assert "No ledgers recorded" in result.output
+
+
 # ── CLI init error handling ─────────────────────────────────────────
 class TestCLIInitError:
     @patch("harness.cli.create_workspace")
@@ -397,3 +660,21 @@ class TestMain:
         from harness.cli import main
         main()
         mock_cli.assert_called_once()
+
+
+# ── startup cost ────────────────────────────────────────────────────
+class TestStartup:
+    def test_import_skips_heavy_modules(self):
+        code = "import sys, harness.cli; print(' '.join(sorted(sys.modules)))"
+        loaded = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent.parent,
+        ).stdout.split()
+        for module in ("pydantic", "pydantic_settings", "rich", "yaml", "harness.config", "harness.lint.ruleset"):
+            assert module not in loaded
+
+    def test_lsp_debounce_default(self):
+        from harness.cli import lsp
+        from harness.lsp import DEFAULT_DEBOUNCE
+        [option] = [p for p in lsp.params if p.name == "debounce"]
+        assert option.default == DEFAULT_DEBOUNCE
@@ -14,6 +14,7 @@ class TestSettings:
         assert s.provider == "anthropic"
         assert s.max_tokens == 4000
         assert s.model_name == "claude-3-5-sonnet-20241022"
+        assert s.lint_cache_max_bytes == 64 * 1024 * 1024
 
     def test_validate_provider_anthropic_missing_key(self):
         s = Settings(
@@ -0,0 +1,230 @@
+"""Tests for harness.daemon and harness.client — the warm lint server."""
+import json
+import socket
+import threading
+from pathlib import Path
+import pytest
+from unittest.mock import patch
+from click.testing import CliRunner
+from harness.cli import cli, create_workspace
+from harness.client import DaemonClient, DaemonError, MAX_SOCKET_PATH, configured_workspace_root, main, socket_path
+from harness.daemon import (
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    WRONG_WORKSPACE,
+    LintDaemon,
+    serve,
+)
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    ws = tmp_path / "ws"
+    create_workspace(ws)
+    (ws / "lore" / "salon.md").write_text("# Salon\n\nThe salon has north-facing windows and a low table.\n")
+    return ws
+
+
+@pytest.fixture
+def running(workspace):
+    ready = threading.Event()
+    thread = threading.Thread(target=serve, args=(workspace,), kwargs={"on_ready": lambda path: ready.set()}, daemon=True)
+    thread.start()
+    assert ready.wait(10)
+    yield workspace
+    client = DaemonClient.connect(workspace)
+    if client is not None:
+        with client:
+            client.call("shutdown")
+    thread.join(10)
+    assert not thread.is_alive()
+
+
+# ── socket_path ─────────────────────────────────────────────────────
+class TestSocketPath:
+    def test_in_workspace_cache(self, tmp_path):
+        assert socket_path(tmp_path) == tmp_path.resolve() / ".cache" / "daemon.sock"
+
+    def test_long_path_moves_to_tempdir(self, tmp_path):
+        deep = tmp_path / ("x" * MAX_SOCKET_PATH)
+        path = socket_path(deep)
+        assert path.name.startswith("harness-") and len(str(path)) <= MAX_SOCKET_PATH
+        assert socket_path(deep) == path
+
+
+# ── configured_workspace_root ───────────────────────────────────────
+class TestConfiguredWorkspaceRoot:
+    def test_environment_in_any_case(self, tmp_path):
+        (tmp_path / ".env").write_text("WORKSPACE_ROOT=from-file\n")
+        assert configured_workspace_root({"workspace_root": "/env"}, tmp_path / ".env") == Path("/env")
+
+    def test_env_file(self, tmp_path):
+        (tmp_path / ".env").write_text('# WORKSPACE_ROOT=/old\nexport WORKSPACE_ROOT="/books/one"  \nMAX_TOKENS=10\n')
+        assert configured_workspace_root({}, tmp_path / ".env") == Path("/books/one")
+
+    def test_default(self, tmp_path):
+        assert configured_workspace_root({}, tmp_path / ".env") == Path("./workspace")
+
+
+# ── LintDaemon.respond ──────────────────────────────────────────────
+class TestRespond:
+    def _call(self, daemon, method, **params):
+        return daemon.respond(json.dumps({"jsonrpc": "2.0", "id": 7, "method": method, "params": params}).encode())
+
+    def test_lint_text(self, workspace):
+        response = self._call(LintDaemon(workspace), "lint_text", text="Her breath hitched.")
+        assert response["id"] == 7
+        assert "banned:0" in [v["rule_id"] for v in response["result"]["style"]]
+
+    def test_lint_text_select(self, workspace):
+        response = self._call(LintDaemon(workspace), "lint_text", text="Her breath hitched. You wait.", select=["style:pov_and_address"])
+        assert [v["rule_id"] for v in response["result"]["style"]] == ["style:pov_and_address"]
+        assert response["result"]["continuity"] == []
+
+    def test_parse_error(self, workspace):
+        response = LintDaemon(workspace).respond(b"{not json")
+        assert response["error"]["code"] == PARSE_ERROR
+
+    def test_unknown_method(self, workspace):
+        assert self._call(LintDaemon(workspace), "nope")["error"]["code"] == METHOD_NOT_FOUND
+
+    def test_invalid_params(self, workspace):
+        daemon = LintDaemon(workspace)
+        assert self._call(daemon, "lint_text", txt="x")["error"]["code"] == INVALID_PARAMS
+        assert self._call(daemon, "lint", paths=["relative.md"])["error"]["code"] == INVALID_PARAMS
+
+    def test_wrong_workspace(self, workspace, tmp_path):
+        response = self._call(LintDaemon(workspace), "status", workspace=str(tmp_path))
+        assert response["error"]["code"] == WRONG_WORKSPACE
+
+    def test_reloads_changed_ledger(self, workspace):
+        daemon = LintDaemon(workspace)
+        assert daemon.state.ledger() is daemon.state.ledger()
+        before = daemon.state.ledger()
+        state = workspace / "state.yaml"
+        state.write_text(state.read_text().replace("early afternoon", "late evening") + "\n")
+        assert daemon.state.ledger() is not before
+        assert daemon.state.ledger().time_of_day == "late evening"
+
+
+# ── serve over the socket ───────────────────────────────────────────
+class TestServe:
+    def test_status_and_requests(self, running, tmp_path):
+        scene = tmp_path / "scene.md"
+        scene.write_text("Her breath hitched in the salon.")
+        with DaemonClient.connect(running, timeout=30) as client:
+            assert client.call("status")["workspace"] == str(running.resolve())
+            [report] = client.call("lint", {"paths": [str(scene)]})["reports"]
+            assert report["path"] == str(scene) and report["error"] is None
+            assert "banned:0" in [v["rule_id"] for v in report["style"]]
+            assert "north-facing" in "".join(client.call("retrieve", {"keywords": ["salon"]})["snippets"])
+            prompt = client.call("build_prompt", {"seed_text": "She waited by the salon window."})["prompt"]
+            assert "She waited by the salon window." in prompt and "north-facing" in prompt
+            with pytest.raises(DaemonError) as raised:
+                client.call("nope")
+            assert raised.value.code == METHOD_NOT_FOUND
+
+    def test_open_connection_does_not_block_others(self, running, tmp_path):
+        scene = tmp_path / "scene.md"
+        scene.write_text("Her breath hitched.")
+        with DaemonClient.connect(running, timeout=30) as idle:
+            idle.call("status")
+            with DaemonClient.connect(running, timeout=10) as other:
+                assert other.call("status")["workspace"] == str(running.resolve())
+                [report] = other.call("lint", {"paths": [str(scene)]})["reports"]
+                assert report["style"]
+            assert idle.call("status")["requests"] >= 3
+
+    def test_refuses_second_daemon(self, running):
+        with pytest.raises(RuntimeError):
+            serve(running)
+
+    def test_replaces_stale_socket(self, workspace):
+        path = socket_path(workspace)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+        assert DaemonClient.connect(workspace) is None
+        ready = threading.Event()
+        thread = threading.Thread(target=serve, args=(workspace,), kwargs={"on_ready": lambda p: ready.set()}, daemon=True)
+        thread.start()
+        assert ready.wait(10)
+        with DaemonClient.connect(workspace) as client:
+            client.call("shutdown")
+        thread.join(10)
+        assert not path.exists()
+
+
+# ── python -m harness.client ────────────────────────────────────────
+class TestClientMain:
+    def test_relative_paths(self, running, tmp_path, monkeypatch, capsys):
+        (tmp_path / "scene.md").write_text("Her breath hitched.")
+        monkeypatch.chdir(tmp_path)
+        code = main(["lint", '{"paths": ["scene.md"]}', "--workspace", str(running)])
+        assert code == 0
+        [report] = json.loads(capsys.readouterr().out)["reports"]
+        assert report["path"] == str(tmp_path / "scene.md")
+        assert report["style"]
+
+    def test_no_daemon(self, workspace, capsys):
+        assert main(["status", "--workspace", str(workspace)]) == 2
+        assert "No daemon is running" in capsys.readouterr().err
+
+
+# ── CLI ─────────────────────────────────────────────────────────────
+class TestCLIDaemon:
+    @patch("harness.cli.settings")
+    def test_lint_uses_daemon(self, mock_settings, running, tmp_path):
+        mock_settings.workspace_root = running
+        scene = tmp_path / "scene.md"
+        scene.write_text("Her breath hitched.")
+        runner = CliRunner()
+        with patch("harness.cli._local_reports") as local:
+            result = runner.invoke(cli, ["lint", str(scene)])
+        assert result.exit_code == 0
+        assert "Banned" in result.output
+        local.assert_not_called()
+        with DaemonClient.connect(running) as client:
+            assert client.call("status")["requests"] >= 2
+
+    @patch("harness.cli.settings")
+    def test_lint_falls_back_without_daemon(self, mock_settings, workspace, tmp_path):
+        mock_settings.workspace_root = workspace
+        scene = tmp_path / "scene.md"
+        scene.write_text("Her breath hitched.")
+        result = CliRunner().invoke(cli, ["lint", str(scene)])
+        assert result.exit_code == 0
+        assert "Banned" in result.output
+
+    @patch("harness.cli.DAEMON_TIMEOUT", 0.2)
+    @patch("harness.cli.settings")
+    def test_lint_falls_back_when_daemon_unresponsive(self, mock_settings, workspace, tmp_path):
+        mock_settings.workspace_root = workspace
+        scene = tmp_path / "scene.md"
+        scene.write_text("Her breath hitched.")
+        path = socket_path(workspace)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Accepts connections (into its backlog) but never answers.
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wedged:
+            wedged.bind(str(path))
+            wedged.listen()
+            result = CliRunner().invoke(cli, ["lint", str(scene)])
+            status = CliRunner().invoke(cli, ["daemon", "status"])
+        assert result.exit_code == 0
+        assert "Banned" in result.output
+        assert status.exit_code == 1 and "Error" in status.output
+
+    @patch("harness.cli.settings")
+    def test_status_and_stop(self, mock_settings, running):
+        mock_settings.workspace_root = running
+        runner = CliRunner()
+        status = runner.invoke(cli, ["daemon", "status"])
+        assert status.exit_code == 0 and "Daemon running" in status.output
+        assert runner.invoke(cli, ["daemon", "stop"]).exit_code == 0
+
+    @patch("harness.cli.settings")
+    def test_status_without_daemon(self, mock_settings, workspace):
+        mock_settings.workspace_root = workspace
+        result = CliRunner().invoke(cli, ["daemon", "status"])
+        assert result.exit_code == 1
+        assert "No daemon" in result.output
@@ -0,0 +1,175 @@
+"""Tests for harness.index — the workspace entity index."""
+import os
+import pytest
+from unittest.mock import patch
+from click.testing import CliRunner
+from harness.cli import cli, create_workspace
+from harness.models import ContinuityLedger
+from harness.ledger import workspace_history
+from harness.index import (
+    EntityIndex,
+    index_targets,
+    ledger_entities,
+    merge_entities,
+    object_aliases,
+    update_workspace_index,
+    workspace_entities,
+)
+
+
+def _ledger(**overrides):
+    defaults = dict(
+        location_current="Library",
+        time_of_day="afternoon",
+        date_or_day_count="Day 3",
+        elapsed_time_since_last_scene="30 minutes",
+        who_present=["Alice", "Bob"],
+    )
+    defaults.update(overrides)
+    return ContinuityLedger(**defaults)
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    ws = tmp_path / "ws"
+    create_workspace(ws)
+    outputs = ws / "outputs"
+    (outputs / "0001_scene_out.md").write_text("Phoenix waited in the private salon.\nHe poured from the carafe.")
+    (outputs / "0001_style_lint.md").write_text("Phoenix is mentioned in a report.")
+    (outputs / "0002_scene_draft.md").write_text("The rain.\nNix laughed.\nPhoenix, again.")
+    (ws / "lore" / "moscow_politics.md").write_text("Moscow Politics lore.")
+    return ws
+
+
+class TestEntities:
+    def test_ledger_entities(self):
+        ledger = _ledger(
+            who_present=["He", "Phoenix", "Aide (outside door)"],
+            character_aliases={"Phoenix": ["Nix"]},
+            location_current="Novo-Ogaryovo — private salon",
+            devices_and_objects_in_scene=["Water carafe and glass on low table"],
+        )
+        entities = ledger_entities(ledger)
+        assert entities["Phoenix"] == ("character", ["Nix"])
+        assert entities["Aide"] == ("character", [])
+        assert "He" not in entities
+        assert entities["Novo-Ogaryovo — private salon"] == ("location", ["Novo-Ogaryovo", "private salon"])
+        assert entities["Water carafe and glass on low table"][0] == "object"
+
+    def test_location_hierarchy_and_aliases(self):
+        ledger = _ledger(
+            location_current="Salon B",
+            location_hierarchy=["Novo-Ogaryovo", "east wing", "Salon B"],
+            location_aliases={"salon b": ["the blue room"]},
+        )
+        assert ledger_entities(ledger)["Salon B"] == ("location", ["Novo-Ogaryovo", "east wing", "the blue room"])
+
+    def test_object_aliases(self):
+        assert object_aliases("Water carafe and glass on low table") == ["Water carafe", "carafe", "glass", "low table", "table"]
+        assert object_aliases("His phone on side table (silent)") == ["phone", "side table", "table"]
+        assert object_aliases("carafe") == []
+
+    def test_merge_keeps_strongest_kind_and_all_aliases(self):
+        merged = merge_entities([{"Phoenix": ("lore", [])}, {"Phoenix": ("character", ["Nix"])}])
+        assert merged == {"Phoenix": ("character", ["Nix"])}
+
+    def test_workspace_entities(self, workspace):
+        workspace_history(workspace).record(1, _ledger(who_present=["Carol"]))
+        entities = workspace_entities(workspace)
+        assert entities["Phoenix"][0] == "character"
+        assert entities["Carol"][0] == "character"
+        assert entities["moscow politics"][0] == "lore"
+
+    def test_index_targets_skip_reports(self, workspace):
+        assert [p.name for p in index_targets(workspace)] == ["0001_scene_out.md", "0002_scene_draft.md"]
+
+
+class TestEntityIndex:
+    ENTITIES = {"Phoenix": ("character", ["Nix"]), "carafe": ("object", [])}
+
+    def test_lookup(self, workspace, tmp_path):
+        paths = index_targets(workspace)
+        with EntityIndex(tmp_path / "index.sqlite") as index:
+            stats = index.update(paths, self.ENTITIES)
+            assert (stats.indexed, stats.postings, stats.rebuilt) == (2, 4, True)
+            postings = index.lookup("phoenix")
+            assert [(p.scene, p.line, p.column) for p in postings] == [(1, 1, 1), (2, 2, 1), (2, 3, 1)]
+            assert postings[0].path == str(paths[0].resolve())
+            assert index.lookup("Nix") == postings
+            assert index.resolve("nix") == [("Phoenix", "character")]
+            assert index.last_scene("carafe") == 1
+            assert index.lookup("Bob") == [] and index.last_scene("Bob") is None
+
+    def test_columns_after_lengthening_lowercase(self, tmp_path):
+        # "İ" lowercases to two characters; positions must still be in the original text.
+        path = tmp_path / "0001_scene_out.md"
+        path.write_text("İİİ Phoenix waited.\nİstanbul, said Nix.")
+        with EntityIndex(tmp_path / "index.sqlite") as index:
+            index.update([path], self.ENTITIES)
+            assert [(p.line, p.column) for p in index.lookup("Phoenix")] == [(1, 5), (2, 16)]
+
+    def test_incremental_update(self, workspace, tmp_path):
+        paths = index_targets(workspace)
+        with EntityIndex(tmp_path / "index.sqlite") as index:
+            index.update(paths, self.ENTITIES)
+            stats = index.update(paths, self.ENTITIES)
+            assert (stats.indexed, stats.unchanged, stats.rebuilt) == (0, 2, False)
+
+            os.utime(paths[0], ns=(1, 1))  # new mtime, same content
+            assert index.update(paths, self.ENTITIES).indexed == 0
+
+            paths[1].write_text("Nobody here.")
+            stats = index.update(paths, self.ENTITIES)
+            assert (stats.indexed, stats.unchanged) == (1, 1)
+            assert [p.scene for p in index.lookup("Phoenix")] == [1]
+
+            stats = index.update(paths[:1], self.ENTITIES)
+            assert stats.removed == 1
+
+    def test_entity_change_reindexes(self, workspace, tmp_path):
+        paths = index_targets(workspace)
+        with EntityIndex(tmp_path / "index.sqlite") as index:
+            index.update(paths, self.ENTITIES)
+            stats = index.update(paths, {"rain": ("object", [])})
+            assert stats.rebuilt and stats.indexed == 2
+            assert index.lookup("Phoenix") == []
+            assert [p.scene for p in index.lookup("rain")] == [2]
+
+    def test_persists(self, workspace, tmp_path):
+        paths = index_targets(workspace)
+        with EntityIndex(tmp_path / "index.sqlite") as index:
+            index.update(paths, self.ENTITIES)
+        with EntityIndex(tmp_path / "index.sqlite") as index:
+            assert len(index.lookup("Phoenix")) == 3
+            assert ("carafe", "object", 1, 1) in index.counts()
+
+    def test_update_workspace_index(self, workspace):
+        index, stats = update_workspace_index(workspace)
+        with index:
+            assert stats.indexed == 2
+            assert index.path == workspace / ".cache" / "index.sqlite"
+            assert [p.scene for p in index.lookup("private salon")] == [1]
+
+
+class TestCLIIndex:
+    @patch("harness.cli.settings")
+    def test_build_and_query(self, mock_settings, workspace):
+        mock_settings.workspace_root = workspace
+        runner = CliRunner()
+        result = runner.invoke(cli, ["index"])
+        assert result.exit_code == 0
+        assert "Indexed 2 files" in result.output
+
+        result = runner.invoke(cli, ["index", "query", "Phoenix", "--last"])
+        assert result.exit_code == 0
+        assert "Scene 2" in result.output and "Scene 1" not in result.output
+
+        result = runner.invoke(cli, ["index", "list"])
+        assert result.exit_code == 0
+        assert "Phoenix" in result.output
+
+    @patch("harness.cli.settings")
+    def test_unknown_entity(self, mock_settings, workspace):
+        mock_settings.workspace_root = workspace
+        result = CliRunner().invoke(cli, ["index", "query", "Zorro"])
+        assert result.exit_code == 1
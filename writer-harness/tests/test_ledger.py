@@ -0,0 +1,120 @@
+"""Tests for harness.ledger — the append-only per-scene ledger history."""
+import json
+import threading
+from harness.models import ContinuityLedger
+from harness.ledger import SNAPSHOT_EVERY, LedgerHistory, workspace_history
+
+
+def _ledger(day=1, **overrides):
+    defaults = dict(
+        location_current="Library",
+        time_of_day="afternoon",
+        date_or_day_count=f"Day {day}",
+        elapsed_time_since_last_scene="30 minutes",
+        who_present=["Alice", "Bob"],
+    )
+    defaults.update(overrides)
+    return ContinuityLedger(**defaults)
+
+
+def _records(history):
+    return [json.loads(line) for line in history.log_path.read_text().splitlines()]
+
+
+class TestLedgerHistory:
+    def test_record_and_get(self, tmp_path):
+        history = LedgerHistory(tmp_path)
+        assert history.record(1, _ledger(1)) == 1
+        assert history.record(2, _ledger(2)) == 1
+        assert history.record(1, _ledger(1, location_current="Hall")) == 2
+        assert history.scenes() == [1, 2]
+        assert history.versions(1) == 2
+        assert history.get(1).location_current == "Hall"
+        assert history.get(1, version=1) == _ledger(1)
+        assert history.get(3) is None
+        assert history.get(1, version=3) is None
+
+    def test_unchanged_ledger_not_appended(self, tmp_path):
+        history = LedgerHistory(tmp_path)
+        history.record(1, _ledger())
+        assert history.record(1, _ledger()) == 1
+        assert len(_records(history)) == 1
+
+    def test_diffs_between_snapshots(self, tmp_path):
+        history = LedgerHistory(tmp_path)
+        for day in range(SNAPSHOT_EVERY + 2):
+            history.record(day, _ledger(day))
+        records = _records(history)
+        assert [i for i, r in enumerate(records) if "snapshot" in r] == [0, SNAPSHOT_EVERY]
+        assert records[1]["diff"] == {"set": {"date_or_day_count": "Day 1"}, "unset": []}
+        assert history.get(SNAPSHOT_EVERY + 1) == _ledger(SNAPSHOT_EVERY + 1)
+
+    def test_cleared_field(self, tmp_path):
+        history = LedgerHistory(tmp_path)
+        history.record(1, _ledger(location_previous="Hall"))
+        history.record(2, _ledger())
+        assert _records(history)[1]["diff"] == {"set": {"location_previous": None}, "unset": []}
+        assert history.get(2).location_previous is None
+
+    def test_latest_matches_get(self, tmp_path):
+        history = LedgerHistory(tmp_path)
+        for i in range(40):
+            history.record(i % 7, _ledger(i))
+        latest = history.latest()
+        assert list(latest) == list(range(7))
+        assert all(latest[scene] == history.get(scene) for scene in latest)
+
+    def test_reopen_uses_index(self, tmp_path):
+        history = LedgerHistory(tmp_path)
+        history.record(1, _ledger(1))
+        history.record(2, _ledger(2))
+        reopened = LedgerHistory(tmp_path)
+        assert reopened._entries == history._entries
+        assert reopened.get(2) == _ledger(2)
+
+    def test_missing_index_rebuilt(self, tmp_path):
+        history = LedgerHistory(tmp_path)
+        for day in range(SNAPSHOT_EVERY + 3):
+            history.record(day, _ledger(day))
+        history.index_path.unlink()
+        reopened = LedgerHistory(tmp_path)
+        assert reopened._entries == history._entries
+        assert history.index_path.exists()
+
+    def test_torn_write_dropped(self, tmp_path):
+        history = LedgerHistory(tmp_path)
+        history.record(1, _ledger(1))
+        with open(history.log_path, "ab") as f:
+            f.write(b'{"scene": 2, "vers')
+        reopened = LedgerHistory(tmp_path)
+        assert reopened.scenes() == [1]
+        reopened.record(2, _ledger(2))
+        assert [r["scene"] for r in _records(reopened)] == [1, 2]
+        assert LedgerHistory(tmp_path).get(2) == _ledger(2)
+
+    def test_concurrent_recorders(self, tmp_path):
+        # Each history is loaded before any of them records, as in separate processes.
+        histories = [LedgerHistory(tmp_path) for _ in range(4)]
+
+        def record(scene, history):
+            for day in range(1, 11):
+                history.record(scene, _ledger(day))
+
+        threads = [threading.Thread(target=record, args=(scene, history)) for scene, history in enumerate(histories)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        history = LedgerHistory(tmp_path)
+        assert len(_records(history)) == 40
+        assert [history.versions(scene) for scene in range(4)] == [10] * 4
+        assert history.get(2, version=3) == _ledger(3)
+        assert history.latest() == {scene: _ledger(10) for scene in range(4)}
+
+    def test_log(self, tmp_path):
+        history = workspace_history(tmp_path)
+        assert history.log() == []
+        history.record(1, _ledger())
+        [(scene, version, recorded)] = history.log()
+        assert (scene, version) == (1, 1) and recorded
+        assert history.log_path == tmp_path / "ledger" / "history.jsonl"
@@ -0,0 +1,123 @@
+"""Tests for harness.lint.autofix — deterministic banned-phrase fixes."""
+import pytest
+from harness.models import BannedPhrases, PhraseFix
+from harness.lint.ruleset import compile_ruleset
+from harness.lint.autofix import apply_fixes
+
+
+def _fix(text, fixes, banned=()):
+    bp = BannedPhrases(
+        banned_regex=list(fixes) + list(banned),
+        fixes={pattern: PhraseFix(**spec) for pattern, spec in fixes.items()},
+    )
+    return apply_fixes(text, compile_ruleset(bp))
+
+
+DELETE = {"action": "delete"}
+DROP = {"action": "drop_clause"}
+
+
+class TestDelete:
+    def test_removes_phrase_and_space(self):
+        assert _fix("He moved like a grandmaster.", {r"(?i)like\s+a\s+grandmaster": DELETE}).text == "He moved."
+
+    def test_mid_sentence(self):
+        result = _fix("He moved like a grandmaster across the board.", {r"(?i)like\s+a\s+grandmaster": DELETE})
+        assert result.text == "He moved across the board."
+
+    def test_capitalizes_new_sentence_start(self):
+        result = _fix("He sat. The truth is, he left.", {r"(?i)the\s+truth\s+is,?\s+": DELETE})
+        assert result.text == "He sat. He left."
+
+    def test_every_match_fixed(self):
+        result = _fix("He moved like a grandmaster.\nShe played like a grandmaster.", {r"(?i)like\s+a\s+grandmaster": DELETE})
+        assert result.text == "He moved.\nShe played."
+        assert [a.line_number for a in result.applied] == [1, 2]
+
+    def test_opening_word_takes_its_comma(self):
+        assert _fix("Suddenly, he left.", {r"(?i)suddenly": DELETE}).text == "He left."
+
+    def test_marks_between_deleted_words(self):
+        assert _fix("It was very, very good.", {r"\bvery\b": DELETE}).text == "It was good."
+
+    def test_capitalizes_after_opening_quote(self):
+        assert _fix('"Very good," she said.', {r"(?i)\bvery\b": DELETE}).text == '"Good," she said.'
+
+
+class TestReplace:
+    def test_replacement(self):
+        result = _fix("The spilled ink dried.", {r"(?i)spilled\s+ink": {"action": "replace", "replacement": "ink"}})
+        assert result.text == "The ink dried."
+        [applied] = result.applied
+        assert (applied.before, applied.after) == ("spilled ink", "ink")
+
+    def test_keeps_leading_capital(self):
+        result = _fix("Spilled ink everywhere.", {r"(?i)spilled\s+ink": {"action": "replace", "replacement": "ink"}})
+        assert result.text == "Ink everywhere."
+
+    def test_group_template(self):
+        fixes = {r"(?i)the\s+air\s+(thickens|tightens)": {"action": "replace", "replacement": r"the air \1 slightly"}}
+        assert _fix("Then the air thickens.", fixes).text == "Then the air thickens slightly."
+
+
+class TestDropClause:
+    def test_trailing_clause(self):
+        result = _fix("He stood, and she realizes it was late.", {r"(?i)she\s+realizes": DROP})
+        assert result.text == "He stood."
+
+    def test_opening_clause(self):
+        result = _fix("He left. She realizes it, and turns.", {r"(?i)she\s+realizes": DROP})
+        assert result.text == "He left. And turns."
+
+    def test_whole_sentence(self):
+        result = _fix("She realizes the door is locked. He left.", {r"(?i)she\s+realizes": DROP})
+        assert result.text == "He left."
+
+    def test_whole_line_removed_with_break(self):
+        result = _fix("He left.\nShe realizes it.\nThen he sat.", {r"(?i)she\s+realizes": DROP})
+        assert result.text == "He left.\nThen he sat."
+
+
+class TestDialogue:
+    FIXES = {r"(?i)he\s+realizes": DROP, r"(?i)like\s+a\s+grandmaster": DELETE}
+
+    @pytest.mark.parametrize("text", [
+        '"He realizes nothing," she said.',
+        '"You know," he realizes, "this is wrong."',
+        'She smiled, "he realizes it," and left.',
+        '"Like a grandmaster," she said.',
+    ])
+    def test_quoting_left_intact(self, text):
+        result = _fix(text, self.FIXES)
+        assert result.text == text
+        assert result.applied == []
+
+    def test_fix_outside_quotes_still_applied(self):
+        result = _fix('He moved like a grandmaster. "Fine," she said.', self.FIXES)
+        assert result.text == 'He moved. "Fine," she said.'
+
+
+class TestApplyFixes:
+    def test_rules_without_fix_untouched(self):
+        result = _fix("Her breath hitched.", {}, banned=[r"(?i)breath\s+hitch"])
+        assert result.text == "Her breath hitched."
+        assert result.applied == []
+
+    def test_overlapping_fixes_first_wins(self):
+        fixes = {
+            r"(?i)she\s+realizes": DROP,
+            r"(?i)realizes\s+it": {"action": "replace", "replacement": "sees it"},
+        }
+        result = _fix("He stood, and she realizes it.", fixes)
+        assert result.text == "He stood."
+        assert len(result.applied) == 1
+
+    def test_warn_rules_fixed(self):
+        bp = BannedPhrases(warn_regex=[r"(?i)\s*perfectly"], fixes={r"(?i)\s*perfectly": PhraseFix(action="delete")})
+        assert apply_fixes("It was perfectly aligned.", compile_ruleset(bp)).text == "It was aligned."
+
+    def test_fixed_text_is_clean(self):
+        fixes = {r"(?i)spilled\s+ink": {"action": "replace", "replacement": "ink"}, r"(?i)she\s+realizes": DROP}
+        text = "The spilled ink dried, and she realizes it.\nHe waited."
+        fixed = _fix(text, fixes).text
+        assert _fix(fixed, fixes).applied == []
@@ -0,0 +1,70 @@
+"""Tests for harness.lint.cache — on-disk lint result cache."""
+import os
+import pytest
+from harness.models import BannedPhrases, LintViolation
+from harness.lint.ruleset import compile_ruleset
+from harness.lint.cache import LintCache, lint_text, workspace_cache
+
+
+TEXT = "Her breath hitched in the Salon."
+
+
+# ── LintCache ───────────────────────────────────────────────────────
+class TestLintCache:
+    def test_key_depends_on_inputs(self, ruleset, ledger):
+        key = LintCache.key(TEXT, ruleset, ledger)
+        assert key == LintCache.key(TEXT, ruleset, ledger)
+        assert key != LintCache.key(TEXT + " ", ruleset, ledger)
+        assert key != LintCache.key(TEXT, compile_ruleset(BannedPhrases()), ledger)
+        moved = ledger.model_copy(update={"location_current": "Hallway"})
+        assert key != LintCache.key(TEXT, ruleset, moved)
+
+    def test_roundtrip(self, tmp_path):
+        cache = LintCache(tmp_path, max_bytes=1 << 20)
+        style = [LintViolation(category="style", severity="error", message="Banned: x", line_number=2, column=3, start=7, end=8)]
+        cache.put("ab" * 32, style, [])
+        assert cache.get("ab" * 32) == (style, [])
+
+    def test_miss_and_corrupt_entry(self, tmp_path):
+        cache = LintCache(tmp_path, max_bytes=1 << 20)
+        assert cache.get("cd" * 32) is None
+        (tmp_path / "cd").mkdir()
+        (tmp_path / "cd" / f"{'cd' * 32}.json").write_text("{not json")
+        assert cache.get("cd" * 32) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        violation = LintViolation(category="style", severity="warning", message="m" * 200)
+        cache = LintCache(tmp_path, max_bytes=10_000)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, [violation], [])
+            path = cache._path(key)
+            os.utime(path, (1000 + age, 1000 + age))
+        entry_size = cache.size() // 3
+        cache.get(keys[0])  # now the most recently used
+
+        small = LintCache(tmp_path, max_bytes=int(entry_size * 3.5))
+        small.put("99" * 32, [violation], [])
+        assert small.get(keys[0]) is not None
+        assert small.get(keys[1]) is None
+        assert small.size() <= small.max_bytes
+
+
+# ── lint_text ───────────────────────────────────────────────────────
+class TestLintText:
+    def test_uncached(self, ruleset, ledger):
+        style, continuity = lint_text(TEXT, ruleset, ledger)
+        assert any("Banned" in v.message for v in style)
+
+    def test_cached_result_matches(self, tmp_path, ruleset, ledger):
+        cache = workspace_cache(tmp_path)
+        first = lint_text(TEXT, ruleset, ledger, cache)
+        assert list((tmp_path / ".cache" / "lint").glob("*/*.json"))
+        assert lint_text(TEXT, ruleset, ledger, cache) == first
+
+    def test_hit_skips_linting(self, tmp_path, ruleset, ledger, monkeypatch):
+        cache = workspace_cache(tmp_path)
+        lint_text(TEXT, ruleset, ledger, cache)
+        monkeypatch.setattr("harness.lint.cache.lint_style", lambda *a, **k: pytest.fail("linted"))
+        style, _ = lint_text(TEXT, ruleset, ledger, cache)
+        assert style
@@ -0,0 +1,78 @@
+"""Tests for harness.lint.chunked — bounded-memory linting in paragraph chunks."""
+import io
+import pytest
+from harness.lint.style import lint_style
+from harness.lint.continuity import lint_continuity
+from harness.lint.chunked import lint_chunks, lint_path, read_chunks, split_categories
+
+
+@pytest.fixture
+def ledger(ledger):
+    return ledger.model_copy(update={"who_present": ["Phoenix", "Marta"]})
+
+
+DIALOGUE = "\n".join(['"Line."'] * 12)
+TEXT = "\n\n".join([
+    "Her breath hitched in the Salon.\nYou could tell.",
+    "He adjusted his cufflinks. The lamp sighs quietly.",
+    DIALOGUE,
+    "Phoenix waited 45 minutes by the door.",
+    "He said nothing. Her breath\nhitched again.",
+    DIALOGUE,
+]) + "\n"
+
+
+def _key(v):
+    return (v.category, v.line_number or 0, v.start or 0, v.message)
+
+
+def _dump(violations):
+    return [v.model_dump() for v in sorted(violations, key=_key)]
+
+
+class TestReadChunks:
+    def test_chunks_end_after_blank_line(self):
+        lines = io.StringIO("a\nb\n\nc\n\nd\n").readlines()
+        assert list(read_chunks(lines, chunk_chars=1)) == ["a\nb\n\n", "c\n\n", "d\n"]
+
+    def test_small_text_is_one_chunk(self):
+        assert list(read_chunks(["a\n", "\n", "b"])) == ["a\n\nb"]
+
+    def test_oversized_paragraph_split_at_line(self):
+        # With chunk_chars=1 a paragraph is split once it reaches MAX_CHUNK_FACTOR (16) characters.
+        assert list(read_chunks(["xxxx\n"] * 8, chunk_chars=1)) == ["xxxx\n" * 4] * 2
+
+
+class TestLintChunks:
+    @pytest.mark.parametrize("chunk_chars", [8, 40, 10_000])
+    def test_matches_whole_text(self, ruleset, ledger, chunk_chars):
+        whole = lint_style(TEXT, ruleset, scene_location="Salon") + lint_continuity(TEXT, ledger)
+        chunked = list(lint_chunks(read_chunks(io.StringIO(TEXT), chunk_chars), ruleset, ledger))
+        assert _dump(chunked) == _dump(whole)
+
+    def test_dialogue_block_closed_at_end(self, ruleset, ledger):
+        chunked = list(lint_chunks(read_chunks(io.StringIO(TEXT), 1), ruleset, ledger))
+        blocks = [v for v in chunked if v.message.startswith("Long dialogue block")]
+        # chunk_chars=1 also splits inside the dialogue paragraphs; the open run carries over.
+        assert [(v.line_number, v.context) for v in blocks] == [(6, "Lines 6–17"), (24, "Lines 24–35")]
+
+    def test_presence_decided_at_end(self, ruleset, ledger):
+        messages = [v.message for v in lint_chunks(read_chunks(io.StringIO(TEXT), 1), ruleset, ledger)]
+        assert messages[-1] == "Character 'Marta' supposed present but not mentioned"
+        assert not any("Phoenix" in m for m in messages)
+        assert not any("location" in m for m in messages)
+
+    def test_location_alias_in_any_chunk(self, ruleset, ledger):
+        aliased = ledger.model_copy(update={"location_current": "Estate — Blue Salon", "location_aliases": {"Blue Salon": ["salon"]}})
+        messages = [v.message for v in lint_chunks(read_chunks(io.StringIO(TEXT), 40), ruleset, aliased)]
+        assert not any("location" in m for m in messages)
+        moved = ledger.model_copy(update={"location_current": "Estate — library"})
+        messages = [v.message for v in lint_chunks(read_chunks(io.StringIO(TEXT), 40), ruleset, moved)]
+        assert "Current location 'Estate — library' not mentioned in text" in messages
+
+    def test_lint_path(self, tmp_path, ruleset, ledger):
+        path = tmp_path / "book.md"
+        path.write_text(TEXT)
+        style, continuity = split_categories(lint_path(path, ruleset, ledger, chunk_chars=40))
+        assert _dump(style) == _dump(lint_style(TEXT, ruleset))
+        assert _dump(continuity) == _dump(lint_continuity(TEXT, ledger))
@@ -1,11 +1,16 @@
 """Tests for harness.lint.continuity — continuity checking."""
 import pytest
-from harness.models import ContinuityLedger
+from harness.models import BannedPhrases, ContinuityLedger, LintConfig
+from harness.lint.ruleset import compile_ruleset
 from harness.lint.continuity import (
+    MentionCounter,
+    character_counter,
     lint_location_change,
+    location_levels,
     lint_who_present,
     lint_timeline,
     lint_continuity,
+    mention_counts,
 )
 
 
@@ -45,6 +50,43 @@ class TestLintLocationChange:
         text = "They were in the library, reading. " * 3
         assert lint_location_change(text, ledger) == []
 
+    def test_innermost_level_counts(self):
+        ledger = _ledger(location_current="Novo-Ogaryovo — private salon")
+        text = "The private salon was quiet; he waited by the window. " * 3
+        assert lint_location_change(text, ledger) == []
+
+    def test_outer_level_alone_does_not_count(self):
+        ledger = _ledger(location_current="Novo-Ogaryovo > bathing wing > private salon")
+        text = "Novo-Ogaryovo was quiet and the bathing wing was empty tonight. " * 3
+        assert len(lint_location_change(text, ledger)) == 1
+
+    def test_alias_counts(self):
+        ledger = _ledger(
+            location_current="Novo-Ogaryovo — private salon",
+            location_aliases={"private salon": ["the salon", "drawing room"]},
+        )
+        text = "He crossed the drawing room and sat down to wait for her. " * 3
+        assert lint_location_change(text, ledger) == []
+
+    def test_explicit_hierarchy(self):
+        ledger = _ledger(
+            location_current="Salon B",
+            location_hierarchy=["Novo-Ogaryovo", "east wing", "Salon B"],
+            location_aliases={"Salon B": "the blue room"},
+        )
+        assert location_levels(ledger) == ["Novo-Ogaryovo", "east wing", "Salon B"]
+        text = "The blue room smelled of polish and old smoke, as ever. " * 3
+        assert lint_location_change(text, ledger) == []
+
+    def test_levels_from_location_current(self):
+        ledger = _ledger(location_current="Estate — west wing > study")
+        assert location_levels(ledger) == ["Estate", "west wing", "study"]
+
+    def test_whole_words_only(self):
+        ledger = _ledger(location_current="Hall")
+        text = "They walked down the hallway, saying nothing at all. " * 3
+        assert len(lint_location_change(text, ledger)) == 1
+
 
 # ── lint_who_present ────────────────────────────────────────────────
 class TestLintWhoPresent:
@@ -78,6 +120,45 @@ class TestLintWhoPresent:
         assert lint_who_present(text, ledger) == []
 
 
+    def test_alias_counts_as_mention(self):
+        ledger = _ledger(who_present=["Phoenix", "Bob"], character_aliases={"Phoenix": ["Nix"]})
+        text = "Nix poured coffee. Bob nodded."
+        assert lint_who_present(text, ledger) == []
+
+    def test_alias_as_string(self):
+        ledger = _ledger(who_present=["Phoenix"], character_aliases={"Phoenix": "Nix"})
+        assert ledger.character_aliases == {"Phoenix": ["Nix"]}
+
+
+# ── mention_counts ──────────────────────────────────────────────────
+class TestMentionCounts:
+    def test_counts_names_and_aliases(self):
+        ledger = _ledger(who_present=["Phoenix", "Bob", "aide"], character_aliases={"Phoenix": ["Nix"]})
+        text = "Phoenix sat. Nix waited. NIX stood. Bob left."
+        assert mention_counts(text, ledger) == {"Phoenix": 3, "Bob": 1}
+
+    def test_whole_words_only(self):
+        ledger = _ledger(who_present=["Nix", "Bob"])
+        assert mention_counts("Nixon met Bobby.", ledger) == {"Nix": 0, "Bob": 0}
+
+    def test_nested_names_each_counted(self):
+        counter = MentionCounter({"Anna": [], "Anna Karenina": [], "Karenina": ["Mrs. K"]})
+        counts = counter.counts("anna karenina arrived. anna sat.")
+        assert counts == {"Anna": 2, "Anna Karenina": 1, "Karenina": 1}
+
+    def test_ensemble_matches_separate_searches(self):
+        names = [f"Char{n}" for n in range(40)]
+        ledger = _ledger(who_present=names, character_aliases={name: [f"{name}-alias"] for name in names[:10]})
+        text = " ".join(f"Char{n} waited." for n in range(0, 40, 3)) + " Char1-alias spoke."
+        counts = mention_counts(text, ledger)
+        assert counts["Char1"] == 1 and counts["Char3"] == 1 and counts["Char2"] == 0
+        assert len(lint_who_present(text, ledger)) == 40 - 14 - 1
+
+    def test_counter_is_cached(self):
+        ledger = _ledger(who_present=["Alice", "Bob"])
+        assert character_counter(ledger) is character_counter(_ledger(who_present=["Alice", "Bob"]))
+
+
 # ── lint_timeline ───────────────────────────────────────────────────
 class TestLintTimeline:
     def test_no_time_refs(self):
@@ -96,6 +177,8 @@ class TestLintTimeline:
         vs = lint_timeline(text, ledger)
         assert len(vs) == 1
         assert "500" in vs[0].message
+        assert vs[0].line_number == 1
+        assert text[vs[0].start:vs[0].end] == "500 minutes"
 
     def test_no_elapsed_numeric(self):
         ledger = _ledger(elapsed_time_since_last_scene="unknown")
@@ -114,6 +197,26 @@ class TestLintTimeline:
         vs = lint_timeline(text, ledger)
         assert len(vs) == 1
 
+    def test_compares_across_units(self):
+        ledger = _ledger(elapsed_time_since_last_scene="25 minutes")
+        vs = lint_timeline("Three days had passed.", ledger)
+        assert len(vs) == 1
+        assert "Three days" in vs[0].message
+
+    def test_smaller_number_larger_unit(self):
+        ledger = _ledger(elapsed_time_since_last_scene="90 minutes")
+        assert lint_timeline("It had been 2 hours.", ledger) == []
+        assert len(lint_timeline("It had been 5 hours.", ledger)) == 1
+
+    def test_larger_number_smaller_unit(self):
+        ledger = _ledger(elapsed_time_since_last_scene="2 days")
+        assert lint_timeline("They had talked for 500 minutes.", ledger) == []
+
+    def test_spelled_out_elapsed(self):
+        ledger = _ledger(elapsed_time_since_last_scene="about twenty minutes")
+        assert lint_timeline("Ten minutes later, the door opened.", ledger) == []
+        assert len(lint_timeline("Two weeks later, the door opened.", ledger)) == 1
+
 
 # ── lint_continuity (aggregator) ────────────────────────────────────
 class TestLintContinuity:
@@ -133,3 +236,10 @@ class TestLintContinuity:
         vs = lint_continuity(text, ledger)
         categories = {v.message for v in vs}
         assert len(vs) >= 2  # at least location + missing character
+
+    def test_ruleset_selection(self):
+        ledger = _ledger(location_current="Library", who_present=["Bob"], elapsed_time_since_last_scene="10 minutes")
+        text = "She stood alone for 500 minutes in an empty room. " * 3
+        ruleset = compile_ruleset(BannedPhrases(), LintConfig(ignore=["continuity:who_present", "continuity:timeline"]))
+        [v] = lint_continuity(text, ledger, ruleset)
+        assert v.rule_id == "continuity:location_change"
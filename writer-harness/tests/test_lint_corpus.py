@@ -0,0 +1,104 @@
+"""Tests for harness.lint.corpus — multi-file and parallel linting."""
+import pytest
+from harness.lint.corpus import expand_targets, lint_file, lint_files
+from harness.lint.cache import workspace_cache
+
+
+@pytest.fixture
+def ledger(ledger):
+    return ledger.model_copy(update={"who_present": []})
+
+
+def _corpus(tmp_path, count=6):
+    book = tmp_path / "book"
+    (book / "part1").mkdir(parents=True)
+    for i in range(count):
+        text = "Her breath hitched in the Salon." if i % 2 else "He waited in the Salon."
+        (book / "part1" / f"{i:02d}.md").write_text(text)
+    (book / "notes.json").write_text("{}")
+    return book
+
+
+# ── expand_targets ──────────────────────────────────────────────────
+class TestExpandTargets:
+    def test_directory_is_recursive_and_filtered(self, tmp_path):
+        book = _corpus(tmp_path, count=3)
+        paths = expand_targets([str(book)])
+        assert [p.name for p in paths] == ["00.md", "01.md", "02.md"]
+
+    def test_glob(self, tmp_path):
+        book = _corpus(tmp_path, count=3)
+        paths = expand_targets([str(book / "**" / "0[12].md")])
+        assert [p.name for p in paths] == ["01.md", "02.md"]
+
+    def test_deduplicates(self, tmp_path):
+        book = _corpus(tmp_path, count=2)
+        single = book / "part1" / "00.md"
+        paths = expand_targets([str(single), str(book)])
+        assert [p.name for p in paths] == ["00.md", "01.md"]
+
+    def test_no_match(self, tmp_path):
+        assert expand_targets([str(tmp_path / "missing" / "*.md")]) == []
+
+
+# ── lint_file / lint_files ──────────────────────────────────────────
+class TestLintFiles:
+    def test_lint_file(self, tmp_path, ruleset, ledger):
+        path = tmp_path / "scene.md"
+        path.write_text("Her breath hitched in the Salon.")
+        report = lint_file(path, ruleset, ledger)
+        assert report.error is None
+        assert any("Banned" in v.message for v in report.style)
+        assert report.total == len(report.style) + len(report.continuity)
+
+    def test_unreadable_file(self, tmp_path, ruleset, ledger):
+        path = tmp_path / "binary.md"
+        path.write_bytes(b"\xff\xfe\x00bad")
+        report = lint_file(path, ruleset, ledger)
+        assert report.error
+        assert report.total == 0
+
+    def test_serial(self, tmp_path, ruleset, ledger):
+        paths = expand_targets([str(_corpus(tmp_path))])
+        reports = list(lint_files(paths, ruleset, ledger, jobs=1))
+        assert [r.path for r in reports] == paths
+
+    def test_pool_matches_serial(self, tmp_path, ruleset, ledger):
+        paths = expand_targets([str(_corpus(tmp_path))])
+        serial = {r.path: [v.message for v in r.style] for r in lint_files(paths, ruleset, ledger, jobs=1)}
+        pooled = {r.path: [v.message for v in r.style] for r in lint_files(paths, ruleset, ledger, jobs=2)}
+        assert pooled == serial
+
+    def test_cache_hits_match(self, tmp_path, ruleset, ledger):
+        paths = expand_targets([str(_corpus(tmp_path))])
+        cache = workspace_cache(tmp_path / "ws")
+        cold = {r.path: r.style for r in lint_files(paths, ruleset, ledger, jobs=2, cache=cache)}
+        assert len(list(cache.root.glob("*/*.json"))) == len({p.read_text() for p in paths})
+        warm = {r.path: r.style for r in lint_files(paths, ruleset, ledger, jobs=2, cache=cache)}
+        assert warm == cold
+
+    def test_stream_matches_whole_file(self, tmp_path, ruleset, ledger):
+        path = tmp_path / "scene.md"
+        path.write_text("Her breath hitched in the Salon.\n\nHe waited 45 minutes.\n")
+        whole = lint_file(path, ruleset, ledger)
+        streamed = lint_file(path, ruleset, ledger, stream=True)
+        assert sorted(v.message for v in streamed.style) == sorted(v.message for v in whole.style)
+        assert streamed.continuity == whole.continuity
+
+    def test_stream_uses_cache(self, tmp_path, ruleset, ledger):
+        paths = expand_targets([str(_corpus(tmp_path))])
+        cache = workspace_cache(tmp_path / "ws")
+        cold = {r.path: r.style for r in lint_files(paths, ruleset, ledger, jobs=1, cache=cache, stream=True)}
+        assert cache.size() > 0
+        warm = {r.path: r.style for r in lint_files(paths, ruleset, ledger, jobs=1, cache=cache)}
+        assert warm == cold
+
+    def test_fail_fast_stops_at_first_error(self, tmp_path, ruleset, ledger):
+        paths = expand_targets([str(_corpus(tmp_path))])
+        reports = list(lint_files(paths, ruleset, ledger, jobs=2, fail_fast=True))
+        assert [r.path.name for r in reports] == ["00.md", "01.md"]
+        assert reports[-1].errors == 1
+
+    def test_fail_fast_with_stream_rejected(self, tmp_path, ruleset, ledger):
+        with pytest.raises(ValueError):
+            lint_file(tmp_path / "scene.md", ruleset, ledger, stream=True, fail_fast=True)
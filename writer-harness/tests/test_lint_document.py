@@ -0,0 +1,97 @@
+"""Tests for harness.lint.document — offset mapping and the shared document analysis."""
+import pytest
+from harness.lint.document import DocumentAnalysis, LineIndex, analyze
+
+
+class TestLineIndex:
+    def test_single_line(self):
+        index = LineIndex("hello")
+        assert len(index) == 1
+        assert index.position(0) == (1, 1)
+        assert index.position(4) == (1, 5)
+
+    def test_multiple_lines(self):
+        text = "ab\ncde\n\nf"
+        index = LineIndex(text)
+        assert len(index) == 4
+        assert index.position(text.index("d")) == (2, 2)
+        assert index.line_of(text.index("f")) == 4
+
+    def test_newline_belongs_to_its_line(self):
+        index = LineIndex("ab\ncd")
+        assert index.line_of(2) == 1
+        assert index.line_of(3) == 2
+
+    def test_line_text(self):
+        index = LineIndex("ab\ncde\n")
+        assert index.line_text(1) == "ab"
+        assert index.line_text(2) == "cde"
+        assert index.line_text(3) == ""
+
+    def test_lines_matches_split(self):
+        text = "a\n\nb\n"
+        assert LineIndex(text).lines() == text.split('\n')
+
+
+class TestDocumentAnalysis:
+    def test_lower_and_lines(self):
+        doc = DocumentAnalysis("She Ran.\nHome")
+        assert doc.lower == "she ran.\nhome"
+        assert doc.lines == ["She Ran.", "Home"]
+
+    def test_folded_offsets_map_back(self):
+        text = "Straße. BREATH"
+        doc = DocumentAnalysis(text)
+        assert doc.folded == "strasse. breath"
+        start = doc.folded.index("breath")
+        assert doc.unfold(start, start + 6) == (text.index("BREATH"), len(text))
+        assert doc.unfold(doc.folded.index("ss"), doc.folded.index("ss") + 2) == (4, 5)
+
+    def test_folded_same_length_is_identity(self):
+        doc = DocumentAnalysis("Breath")
+        assert doc.unfold(1, 4) == (1, 4)
+
+    def test_unlower_maps_lengthened_text(self):
+        text = "İzmir. Then Ana left."
+        doc = DocumentAnalysis(text)
+        start = doc.lower.index("ana")
+        assert doc.unlower(start, start + 3) == (text.index("Ana"), text.index("Ana") + 3)
+        assert doc.unlower(0, 2) == (0, 1)
+
+    def test_sentences(self):
+        text = "One. Two! Three\nFour"
+        doc = DocumentAnalysis(text)
+        assert [text[start:end] for start, end in doc.sentences] == ["One. ", "Two! ", "Three\n", "Four"]
+
+    def test_dialogue_spans_across_lines(self):
+        text = 'He said, "Wait,\nyou fool." Then left.'
+        doc = DocumentAnalysis(text)
+        [(start, end)] = doc.dialogue
+        assert text[start:end] == '"Wait,\nyou fool."'
+        assert doc.in_dialogue(text.index("you"))
+        assert not doc.in_dialogue(text.index("Then"))
+
+    def test_paragraph_break_closes_quote(self):
+        text = '"Never closed\n\nyou see'
+        doc = DocumentAnalysis(text)
+        assert doc.dialogue == [(0, text.index("\n"))]
+        assert not doc.in_dialogue(text.index("you"))
+
+    def test_curly_quotes(self):
+        text = "“Go,” she said."
+        doc = DocumentAnalysis(text)
+        assert doc.dialogue == [(0, text.index("”") + 1)]
+
+    def test_single_quotes_ignored(self):
+        assert DocumentAnalysis("It's 'fine' now").dialogue == []
+
+    def test_word_chains(self):
+        doc = DocumentAnalysis("The door\nopened. It\n\nshut")
+        assert [(word, chain) for word, chain, _, _ in doc.words] == [
+            ("the", 0), ("door", 0), ("opened", 0), ("it", 1), ("shut", 2),
+        ]
+
+    def test_analyze_reuses_analysis(self):
+        doc = DocumentAnalysis("text")
+        assert analyze(doc) is doc
+        assert analyze("text").text == "text"
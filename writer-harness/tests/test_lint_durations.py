@@ -0,0 +1,48 @@
+"""Tests for harness.lint.durations — duration parsing."""
+import pytest
+from harness.lint.durations import DAY, HOUR, MINUTE, WEEK, durations, parse_duration, parse_number
+
+
+class TestParseNumber:
+    @pytest.mark.parametrize("text, value", [
+        ("90", 90), ("1.5", 1.5), ("twelve", 12), ("Twenty", 20), ("twenty-five", 25), ("forty two", 42),
+        ("a", 1), ("An", 1), ("half an", 0.5), ("half a", 0.5),
+    ])
+    def test_values(self, text, value):
+        assert parse_number(text) == value
+
+
+class TestDurations:
+    @pytest.mark.parametrize("text, seconds", [
+        ("25 minutes", 25 * MINUTE),
+        ("1 minute", MINUTE),
+        ("90 mins", 90 * MINUTE),
+        ("2 hours", 2 * HOUR),
+        ("1.5 hrs", 1.5 * HOUR),
+        ("three days", 3 * DAY),
+        ("Twenty-five minutes", 25 * MINUTE),
+        ("two weeks", 2 * WEEK),
+        ("a 90-minute drive", 90 * MINUTE),
+        ("an hour", HOUR),
+        ("A day later", DAY),
+        ("a week", WEEK),
+        ("half an hour", 30 * MINUTE),
+    ])
+    def test_parse_duration(self, text, seconds):
+        assert parse_duration(text) == seconds
+
+    def test_no_duration(self):
+        assert parse_duration("unknown") is None
+        assert parse_duration("a while") is None
+        assert parse_duration("Day 17") is None
+
+    def test_spans_in_one_pass(self):
+        text = "After 90 minutes, then two hours, and 3 daylights."
+        found = list(durations(text))
+        assert [text[start:end] for start, end, _ in found] == ["90 minutes", "two hours"]
+        assert [seconds for _, _, seconds in found] == [90 * MINUTE, 2 * HOUR]
+
+    def test_words_inside_other_words_ignored(self):
+        assert list(durations("someone days")) == []
+        assert list(durations("often hours")) == []
+        assert list(durations("the spa day")) == []
@@ -0,0 +1,120 @@
+"""Tests for harness.lint.engine — single-pass multi-pattern scanner."""
+import pytest
+from harness.models import BannedPhrases
+from harness.lint.ruleset import compile_ruleset
+from harness.lint.document import DocumentAnalysis
+from harness.lint.engine import Scanner, TokenWindowDetector
+
+
+def _scanner(banned):
+    return Scanner(compile_ruleset(BannedPhrases(banned_regex=banned)).group("banned"))
+
+
+def _hit_lines(scanner, text):
+    return [[line for line, _ in hits] for hits in scanner.scan(DocumentAnalysis(text))]
+
+
+# ── Scanner ─────────────────────────────────────────────────────────
+class TestScanner:
+    def test_literal_rules_routed(self):
+        scanner = _scanner([r"(?i)breath\s+hitch"])
+        assert scanner.routed and not scanner.merged
+
+    def test_literal_free_rules_merged(self):
+        scanner = _scanner([r"(?i)(?:he|she)\s+(?:of|to)", r"[a-z]{40}"])
+        assert scanner.merged_folded == [0]
+        assert scanner.merged == [1]
+        assert scanner.combined is not None
+        assert scanner.combined_folded is not None
+
+    def test_backreference_not_merged(self):
+        scanner = _scanner([r"(\w)\1"])
+        assert scanner.unmerged == [0]
+
+    def test_empty_match_not_merged(self):
+        scanner = _scanner([r"(?:x)?"])
+        assert scanner.unmerged == [0]
+
+    def test_hits_per_rule_in_line_order(self):
+        scanner = _scanner([r"(?i)breath\s+hitch", r"(?i)(?:he|she)\s+(?:of|to)", r"(\w)\1"])
+        text = "Her BREATH hitched.\nShe to it.\nA good book.\nbreath hitch"
+        assert _hit_lines(scanner, text) == [[1, 4], [2], [3]]
+
+    def test_overlapping_rules_all_reported(self):
+        # Both merged rules match the same span; the gate must not hide the second.
+        scanner = _scanner([r"(?i)(?:he|she)\s+to", r"(?i)(?:he|she)\s+(?:of|to)"])
+        assert _hit_lines(scanner, "she to") == [[1], [1]]
+
+    def test_first_match_per_line(self):
+        scanner = _scanner([r"(?i)hum\w*"])
+        hits = scanner.scan(DocumentAnalysis("humming and humming"))
+        assert len(hits[0]) == 1
+        assert hits[0][0][1].group(0) == "humming"
+
+    def test_match_wrapping_line_break(self):
+        scanner = _scanner([r"(?i)breath\s+hitch"])
+        text = "Nothing here.\nHer breath\nhitched."
+        hits = scanner.scan(DocumentAnalysis(text))
+        assert [(line, m.start()) for line, m in hits[0]] == [(2, 18)]
+
+    def test_wrapped_match_keeps_next_lines_hit(self):
+        # Line 1's "in\nreverie" must not use up line 2's own "reverie".
+        scanner = _scanner([r"(?i)(?:in\s+)?(?:a\s+)?(?:flashback|reverie|memory)"])
+        assert _hit_lines(scanner, "She kept a memory in\nreverie she drifted.\n") == [[1, 2]]
+
+    def test_match_never_spans_blank_line(self):
+        scanner = _scanner([r"(?i)he\s+had\s+won", r"he\s+had\s+won"])
+        assert _hit_lines(scanner, "he had\n\nwon") == [[], []]
+        assert _hit_lines(scanner, "he had\nwon") == [[1], [1]]
+
+    def test_absent_literal_skips_rule(self):
+        scanner = _scanner([r"(?i)breath\s+hitch", r"(?i)silence\s+pools"])
+        assert scanner.active("Her breath hitched.") == [0]
+
+    def test_line_anchors_per_line(self):
+        scanner = _scanner([r"^He\b"])
+        assert _hit_lines(scanner, "She left.\nHe stayed.\nThen He sat.") == [[2]]
+
+    def test_folded_match_reports_original_text(self):
+        scanner = _scanner([r"(?i)breath\s+hitch\w*"])
+        assert scanner.rules[0].folded is not None
+        text = "Straße.\nHer BREATH Hitched."
+        [[(line, match)]] = scanner.scan(DocumentAnalysis(text))
+        assert line == 2
+        assert match.group(0) == "BREATH Hitched"
+        assert match.span() == (text.index("BREATH"), text.index(".", 8))
+
+    def test_uppercase_pattern_not_folded(self):
+        scanner = _scanner([r"(?i)Phoenix"])
+        assert scanner.rules[0].folded is None
+        assert _hit_lines(scanner, "PHOENIX rose") == [[1]]
+
+
+# ── TokenWindowDetector ─────────────────────────────────────────────
+class TestTokenWindowDetector:
+    def _find(self, text, window=3):
+        detector = TokenWindowDetector(["door", "wall"], ["waits", "listens"], window)
+        return [(line, noun, verb) for line, noun, verb, _, _ in detector.find(DocumentAnalysis(text))]
+
+    def test_within_window(self):
+        assert self._find("The door slowly waits.") == [(1, "door", "waits")]
+
+    def test_outside_window(self):
+        assert self._find("The door very very slowly waits.") == []
+
+    def test_wraps_single_line_break(self):
+        assert self._find("The door\nwaits.") == [(1, "door", "waits")]
+
+    def test_blank_line_ends_window(self):
+        assert self._find("The door\n\nwaits.") == []
+
+    def test_ordered_by_list_position(self):
+        assert self._find("The wall listens, the door waits and listens.", window=3) == [
+            (1, "door", "waits"), (1, "door", "listens"), (1, "wall", "listens"),
+        ]
+
+    def test_span(self):
+        text = "x\nThe door waits."
+        detector = TokenWindowDetector(["door"], ["waits"], 3)
+        [(line, _, _, start, end)] = detector.find(DocumentAnalysis(text))
+        assert text[start:end] == "door waits"
@@ -0,0 +1,78 @@
+"""Tests for harness.lint.incremental — paragraph-granular re-linting."""
+from harness.lint.style import lint_style
+from harness.lint.continuity import lint_continuity
+from harness.lint.incremental import IncrementalLinter, split_blocks
+
+
+PARAGRAPHS = [
+    "Her breath hitched in the Salon.\nYou could tell.",
+    "He adjusted his cufflinks. The lamp sighs quietly.",
+    "Phoenix waited 45 minutes by the door.",
+    "\n".join(['"Line."'] * 12),
+    "He said nothing. Her breath\nhitched again.",
+]
+
+
+def _dump(violations):
+    return [v.model_dump() for v in violations]
+
+
+def _assert_matches_full(linter, text, ruleset, ledger):
+    style, continuity = linter.lint(text)
+    assert _dump(style) == _dump(lint_style(text, ruleset))
+    assert _dump(continuity) == _dump(lint_continuity(text, ledger))
+
+
+# ── split_blocks ────────────────────────────────────────────────────
+class TestSplitBlocks:
+    def test_roundtrip(self):
+        text = "one\ntwo\n\n\nthree\n  \nfour\n"
+        blocks = split_blocks(text)
+        assert "".join(blocks) == text
+        assert blocks == ["one\ntwo\n\n\n", "three\n  \n", "four\n"]
+
+    def test_empty(self):
+        assert split_blocks("") == [""]
+
+
+# ── IncrementalLinter ───────────────────────────────────────────────
+class TestIncrementalLinter:
+    def test_matches_full_lint(self, ruleset, ledger):
+        linter = IncrementalLinter(ruleset, ledger)
+        _assert_matches_full(linter, "\n\n".join(PARAGRAPHS), ruleset, ledger)
+
+    def test_only_changed_block_rescanned(self, ruleset, ledger):
+        linter = IncrementalLinter(ruleset, ledger)
+        linter.lint("\n\n".join(PARAGRAPHS))
+        assert linter.scanned == len(PARAGRAPHS)
+
+        edited = list(PARAGRAPHS)
+        edited[2] = "Phoenix waited 90 minutes by the door. The reader knew."
+        _assert_matches_full(linter, "\n\n".join(edited), ruleset, ledger)
+        assert linter.scanned == 1
+
+    def test_moved_blocks_shift_lines(self, ruleset, ledger):
+        linter = IncrementalLinter(ruleset, ledger)
+        linter.lint("\n\n".join(PARAGRAPHS))
+
+        moved = ["A new opening line.\nAnd another."] + PARAGRAPHS
+        _assert_matches_full(linter, "\n\n".join(moved), ruleset, ledger)
+        assert linter.scanned == 1
+
+    def test_dialogue_run_across_blocks(self, ruleset, ledger):
+        # A dialogue run only ends at a following line; appending one adds the violation.
+        linter = IncrementalLinter(ruleset, ledger)
+        run = "\n".join(['"Line."'] * 12)
+        _assert_matches_full(linter, run, ruleset, ledger)
+        _assert_matches_full(linter, run + "\nHe left.", ruleset, ledger)
+
+    def test_location_check_sees_whole_document(self, ruleset, ledger):
+        linter = IncrementalLinter(ruleset, ledger)
+        filler = "He waited without a word, as he had done for most of the long afternoon."
+        text = "\n\n".join([filler, filler])
+        style, continuity = linter.lint(text)
+        assert any("not mentioned" in v.message for v in continuity)
+
+        style, continuity = linter.lint(text + "\n\nStill in the Salon.")
+        assert not any("Salon" in v.message for v in continuity)
+        assert linter.scanned == 1
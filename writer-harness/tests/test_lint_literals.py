@@ -0,0 +1,76 @@
+"""Tests for harness.lint.literals — required-literal extraction."""
+import pytest
+from harness.lint.literals import required_literals, fold, casefolded_pattern, LiteralSet
+
+
+class TestRequiredLiterals:
+    def test_plain_literal(self):
+        assert required_literals(r"(?i)breath\s+hitch") == {"breath"}
+
+    def test_alternation_any_of(self):
+        assert required_literals(r"(?i)(?:in\s+)?(?:flashback|reverie|memory)") == {"flashback", "reverie", "memory"}
+
+    def test_optional_group_ignored(self):
+        assert required_literals(r"(?i)chess(piece|board|\s+pieces)?") == {"chess"}
+
+    def test_case_folded(self):
+        assert required_literals(r"Phoenix\b") == {"phoenix"}
+
+    def test_short_alternatives_rejected(self):
+        assert required_literals(r"(?i)(?:she|he)\s+(?:of|to)") is None
+
+    def test_optional_alternative_rejected(self):
+        assert required_literals(r"(?:walls|)\s+listen") == {"listen"}
+        assert required_literals(r"(?:walls|x)") is None
+
+    def test_malformed_pattern(self):
+        assert required_literals("[invalid") is None
+
+
+class TestCasefoldedPattern:
+    def test_ignorecase_dropped(self):
+        assert casefolded_pattern(r"(?i)\bbreath\s+hitch") == r"\bbreath\s+hitch"
+
+    def test_other_flags_kept(self):
+        assert casefolded_pattern(r"(?im)^silence$") == r"(?m)^silence$"
+
+    def test_case_sensitive_pattern_left_alone(self):
+        assert casefolded_pattern(r"breath") is None
+
+    def test_uppercase_literal_rejected(self):
+        assert casefolded_pattern(r"(?i)Phoenix") is None
+        assert casefolded_pattern(r"(?i)[A-Z]+ing") is None
+
+    def test_backreference_rejected(self):
+        assert casefolded_pattern(r"(?i)(\w)\1") is None
+
+    def test_scoped_case_flag_rejected(self):
+        assert casefolded_pattern(r"(?i)breath(?-i:X)") is None
+
+    def test_malformed_pattern(self):
+        assert casefolded_pattern("(?i)[invalid") is None
+
+
+class TestFold:
+    def test_dotless_and_dotted_i(self):
+        assert "hit" in fold("HİT")
+        assert "hit" in fold("hıt")
+
+
+class TestLiteralSet:
+    def test_empty(self):
+        assert LiteralSet([]).present("anything") == set()
+
+    def test_finds_present_only(self):
+        ls = LiteralSet(["breath", "silence", "chess"])
+        assert ls.present(fold("Her BREATH hitched over the chessboard.")) == {"breath", "chess"}
+
+    def test_overlapping_literals(self):
+        # "the" starts inside "breathe"; "breathe" and "breath" share a start.
+        ls = LiteralSet(["breath", "breathe", "the", "hes"])
+        assert ls.present("breathes") == {"breath", "breathe", "the", "hes"}
+
+    def test_many_literals(self):
+        literals = [f"word{i:04d}" for i in range(1000)]
+        ls = LiteralSet(literals)
+        assert ls.present("x word0042 y word0999") == {"word0042", "word0999"}
@@ -0,0 +1,175 @@
+"""Tests for harness.lint.manuscript — continuity across consecutive scenes."""
+from pathlib import Path
+from harness.models import BannedPhrases, ContinuityLedger, LintConfig
+from harness.lint.ruleset import compile_ruleset
+from harness.lint.manuscript import (
+    ENTRANCE,
+    LOCATION_JUMP,
+    TIME_ORDER,
+    check_manuscript,
+    check_scene,
+    scene_number,
+    scene_texts,
+)
+
+
+def _ledger(**overrides):
+    defaults = dict(
+        location_current="Library",
+        time_of_day="afternoon",
+        date_or_day_count="Day 3",
+        elapsed_time_since_last_scene="30 minutes",
+        who_present=["Alice", "Bob"],
+    )
+    defaults.update(overrides)
+    return ContinuityLedger(**defaults)
+
+
+def _rule_ids(report):
+    return [v.rule_id for v in report.violations]
+
+
+def _pair(previous, current, text=None, tmp_path=None, ruleset=None):
+    path = None
+    if text is not None:
+        path = tmp_path / "0002_scene_out.md"
+        path.write_text(text)
+    return check_scene(2, path, current, previous, ruleset)
+
+
+class TestSceneFiles:
+    def test_scene_number(self):
+        assert scene_number(Path("outputs/0012_scene_out.md")) == 12
+        assert scene_number(Path("notes.md")) is None
+
+    def test_scene_texts_prefers_output(self):
+        paths = [Path(name) for name in (
+            "0001_scene_draft.md", "0001_scene_out.md", "0001_style_lint.md", "0002_scene_draft.md", "readme.md",
+        )]
+        assert scene_texts(paths) == {1: Path("0001_scene_out.md"), 2: Path("0002_scene_draft.md")}
+
+
+class TestLocationJump:
+    def test_same_location(self):
+        assert _pair(_ledger(), _ledger(location_current="library")).violations == []
+
+    def test_unexplained_jump(self):
+        report = _pair(_ledger(), _ledger(location_current="Kitchen"))
+        assert _rule_ids(report) == [LOCATION_JUMP]
+        assert "Library" in report.violations[0].message
+
+    def test_declared_transport(self):
+        current = _ledger(location_current="Moscow", transport_last_leg={"mode": "train"})
+        assert _pair(_ledger(), current).violations == []
+
+    def test_travel_in_text(self, tmp_path):
+        text = "Alice and Bob drove to the Kitchen."
+        report = _pair(_ledger(), _ledger(location_current="Kitchen"), text, tmp_path)
+        assert LOCATION_JUMP not in _rule_ids(report)
+
+    def test_location_previous_mismatch(self):
+        current = _ledger(location_current="Kitchen", location_previous="Garden", transport_last_leg={"mode": "car"})
+        report = _pair(_ledger(), current)
+        assert _rule_ids(report) == [LOCATION_JUMP]
+        assert "Garden" in report.violations[0].message
+
+
+class TestEntrance:
+    def test_new_character_without_entrance(self, tmp_path):
+        text = "Alice read in the Library.\nCarol sighed. Bob nodded."
+        report = _pair(_ledger(), _ledger(who_present=["Alice", "Bob", "Carol"]), text, tmp_path)
+        [v] = [v for v in report.violations if v.rule_id == ENTRANCE]
+        assert "Carol" in v.message
+        assert (v.line_number, v.column) == (2, 1)
+
+    def test_mention_located_in_original_text(self, tmp_path):
+        # Each "İ" lowercases to two characters, which used to push Carol into the next sentence.
+        text = "İ" * 16 + " Carol sighed. Alice entered. Bob nodded."
+        report = _pair(_ledger(), _ledger(who_present=["Alice", "Bob", "Carol"]), text, tmp_path)
+        [v] = [v for v in report.violations if v.rule_id == ENTRANCE]
+        assert (v.line_number, v.column) == (1, 18)
+
+    def test_new_character_entering(self, tmp_path):
+        text = "Alice read in the Library. Carol entered. Bob nodded."
+        report = _pair(_ledger(), _ledger(who_present=["Alice", "Bob", "Carol"]), text, tmp_path)
+        assert ENTRANCE not in _rule_ids(report)
+
+    def test_alias_counts_as_entrance(self, tmp_path):
+        text = "Alice read in the Library. The colonel walked in. Carol sat. Bob nodded."
+        current = _ledger(who_present=["Alice", "Bob", "Carol"], character_aliases={"Carol": ["the colonel"]})
+        assert ENTRANCE not in _rule_ids(_pair(_ledger(), current, text, tmp_path))
+
+    def test_alias_mention_span(self, tmp_path):
+        text = "Alice read in the Library. The colonel sighed. Bob nodded."
+        current = _ledger(who_present=["Alice", "Bob", "Carol"], character_aliases={"Carol": ["the colonel"]})
+        [v] = [v for v in _pair(_ledger(), current, text, tmp_path).violations if v.rule_id == ENTRANCE]
+        assert text[v.start:v.end] == "The colonel"
+
+    def test_present_before(self, tmp_path):
+        text = "Alice read in the Library. Bob nodded."
+        assert _pair(_ledger(), _ledger(), text, tmp_path).violations == []
+
+
+class TestTimeOrder:
+    def test_day_goes_backwards(self):
+        report = _pair(_ledger(), _ledger(date_or_day_count="Day 2"))
+        assert _rule_ids(report) == [TIME_ORDER]
+        assert report.violations[0].severity == "error"
+
+    def test_same_day_earlier_time(self):
+        report = _pair(_ledger(), _ledger(time_of_day="early morning"))
+        assert _rule_ids(report) == [TIME_ORDER]
+
+    def test_same_day_later_time(self):
+        assert _pair(_ledger(), _ledger(time_of_day="late afternoon")).violations == []
+
+    def test_elapsed_days_without_day_change(self):
+        report = _pair(_ledger(), _ledger(elapsed_time_since_last_scene="2 days"))
+        assert _rule_ids(report) == [TIME_ORDER]
+
+    def test_elapsed_too_short_for_day_jump(self):
+        current = _ledger(date_or_day_count="Day 7", elapsed_time_since_last_scene="3 hours")
+        assert _rule_ids(_pair(_ledger(), current)) == [TIME_ORDER]
+
+    def test_next_day(self):
+        current = _ledger(date_or_day_count="Day 4", time_of_day="morning", elapsed_time_since_last_scene="16 hours")
+        assert _pair(_ledger(), current).violations == []
+
+
+class TestCheckManuscript:
+    def _ledgers(self):
+        return {
+            1: _ledger(date_or_day_count="Day 1"),
+            2: _ledger(date_or_day_count="Day 2", elapsed_time_since_last_scene="1 day"),
+            3: _ledger(date_or_day_count="Day 1", location_current="Kitchen"),
+        }
+
+    def test_checks_each_consecutive_pair(self):
+        reports = check_manuscript(self._ledgers(), {})
+        assert [r.scene for r in reports] == [1, 2, 3]
+        assert reports[0].violations == [] and reports[1].violations == []
+        assert sorted(_rule_ids(reports[2])) == [LOCATION_JUMP, TIME_ORDER]
+
+    def test_scene_text_checked_against_own_ledger(self, tmp_path):
+        path = tmp_path / "0001_scene_out.md"
+        path.write_text("Alice waited.")
+        [report] = check_manuscript({1: _ledger()}, {1: path})
+        assert report.path == path
+        assert [v.rule_id for v in report.violations] == ["continuity:who_present"]
+        assert "Bob" in report.violations[0].message
+
+    def test_parallel_matches_serial(self):
+        ledgers = self._ledgers()
+        serial = check_manuscript(ledgers, {}, jobs=1)
+        parallel = check_manuscript(ledgers, {}, jobs=2)
+        assert [(r.scene, _rule_ids(r)) for r in parallel] == [(r.scene, _rule_ids(r)) for r in serial]
+
+    def test_ignored_rules(self):
+        ruleset = compile_ruleset(BannedPhrases(), LintConfig(ignore=["continuity:time_order"]))
+        reports = check_manuscript(self._ledgers(), {}, ruleset)
+        assert _rule_ids(reports[2]) == [LOCATION_JUMP]
+
+    def test_parallel_workers_rebuild_selection(self):
+        ruleset = compile_ruleset(BannedPhrases(), LintConfig(ignore=["continuity:time_order"]))
+        reports = check_manuscript(self._ledgers(), {}, ruleset, jobs=2)
+        assert _rule_ids(reports[2]) == [LOCATION_JUMP]
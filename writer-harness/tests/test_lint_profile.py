@@ -0,0 +1,70 @@
+"""Tests for harness.lint.profile — per-rule timing."""
+import json
+from harness.models import BannedPhrases, ContinuityLedger
+from harness.lint.ruleset import compile_ruleset
+from harness.lint.style import lint_style
+from harness.lint.continuity import lint_continuity
+from harness.lint.cache import lint_text, workspace_cache
+from harness.lint.profile import LintProfiler, active_profiler, profiling
+
+TEXT = "Her breath hitched.\nHer breath hitched again.\nYou knew. The reader knew."
+
+LEDGER = ContinuityLedger(
+    location_current="Salon",
+    time_of_day="evening",
+    date_or_day_count="Day 1",
+    elapsed_time_since_last_scene="10 minutes",
+    who_present=["Phoenix"],
+)
+
+
+class TestLintProfiler:
+    def test_add_accumulates(self):
+        profiler = LintProfiler()
+        profiler.add("banned:0", "x", 0.5, 2)
+        profiler.add("banned:0", "x", 0.25, 1)
+        profiler.add("warn:0", "y", 1.0, 0)
+        assert [s.rule_id for s in profiler.rows()] == ["warn:0", "banned:0"]
+        stats = profiler.stats["banned:0"]
+        assert (stats.seconds, stats.calls, stats.hits) == (0.75, 2, 3)
+        assert profiler.total_seconds == 1.75
+
+    def test_write_json(self, tmp_path):
+        profiler = LintProfiler()
+        profiler.add("banned:0", "x", 0.5, 2)
+        path = tmp_path / "profile.json"
+        profiler.write_json(path)
+        data = json.loads(path.read_text())
+        assert data["rules"][0] == {"rule_id": "banned:0", "label": "x", "seconds": 0.5, "calls": 1, "hits": 2}
+
+
+class TestProfiling:
+    def test_inactive_by_default(self):
+        assert active_profiler() is None
+        lint_style(TEXT, BannedPhrases())
+
+    def test_records_every_rule_kind(self):
+        ruleset = compile_ruleset(BannedPhrases(banned_regex=[r"(?i)breath\s+hitch"]))
+        with profiling() as profiler:
+            lint_style(TEXT, ruleset)
+            lint_continuity(TEXT, LEDGER)
+        assert active_profiler() is None
+
+        stats = profiler.stats
+        assert stats["banned:0"].hits == 2
+        assert stats["banned:0"].label == r"(?i)breath\s+hitch"
+        assert stats["style:pov_and_address"].hits == 1
+        assert "scanner:prefilter" in stats
+        assert "style:object_anthropomorphism" in stats
+        assert "style:dialogue_exposition" in stats
+        assert stats["continuity:location_change"].hits == 0
+        assert stats["continuity:who_present"].hits == 1
+        assert "continuity:timeline" in stats
+
+    def test_bypasses_cache(self, tmp_path):
+        ruleset = compile_ruleset(BannedPhrases(banned_regex=[r"(?i)breath\s+hitch"]))
+        cache = workspace_cache(tmp_path)
+        lint_text(TEXT, ruleset, LEDGER, cache)
+        with profiling() as profiler:
+            lint_text(TEXT, ruleset, LEDGER, cache)
+        assert profiler.stats["banned:0"].calls == 1
@@ -0,0 +1,105 @@
+"""Tests for harness.lint.redos — backtracking analysis and time budgets."""
+import time
+import pytest
+from harness.models import BannedPhrases, LintConfig
+from harness.lint import patterns
+from harness.lint.ruleset import compile_ruleset
+from harness.lint.style import lint_banned_phrases
+from harness.lint.redos import RegexTimeout, TimeBudget, backtracking_risk
+
+
+# ── backtracking_risk ───────────────────────────────────────────────
+class TestBacktrackingRisk:
+    @pytest.mark.parametrize("pattern", [
+        r"(\w+\s*)*$",
+        r"(a+)+b",
+        r"(?:\w+\s?)*!",
+        r"(?:\s*\w+)*!",
+        r"(?:x\w*)*y",
+        r"(a*)*b",
+        r"(?i)(?:the|th\w+)*x",
+        r"(a|aa)*c",
+        r"(?:ab|a|abab)+c",
+    ])
+    def test_exponential(self, pattern):
+        assert "exponentially" in backtracking_risk(pattern)
+
+    @pytest.mark.parametrize("pattern", [r".*\s+.*x", r"\w*\w*x"])
+    def test_polynomial(self, pattern):
+        assert "polynomially" in backtracking_risk(pattern)
+
+    @pytest.mark.parametrize("pattern", [
+        r"(?i)breath\s+hitch",
+        r"(?:\w+\s+)*x",
+        r"(?:[a-z]+,)*z",
+        r"\w+\s+\w+",
+        r"(?:\w++\s*)*",
+        r"(a|ab)*c",
+        r"(ab|a)*b",
+        r"(?>\w+\s*)*x",
+        r"(?i)\bwon\b.*(?:over|the\s+day)",
+        r"[invalid",
+    ])
+    def test_safe(self, pattern):
+        assert backtracking_risk(pattern) is None
+
+    def test_builtins_are_safe(self):
+        for table in (
+            patterns.SCENE_CONTAINMENT_PATTERNS,
+            patterns.META_NARRATIVE_PATTERNS,
+            patterns.EDITORIALIZING_PATTERNS,
+            patterns.POV_CONSISTENCY_PATTERNS,
+        ):
+            for pattern, _ in table:
+                assert backtracking_risk(pattern) is None, pattern
+
+
+# ── TimeBudget ──────────────────────────────────────────────────────
+class TestTimeBudget:
+    def test_interrupts_runaway_match(self):
+        import re
+        started = time.perf_counter()
+        with pytest.raises(RegexTimeout):
+            with TimeBudget(0.1) as budget:
+                budget.arm()
+                re.search(r"(\w+\s?)*!", "word " * 40 + "x")
+        assert time.perf_counter() - started < 2
+
+    def test_disabled(self):
+        with TimeBudget(None) as budget:
+            budget.arm()
+            budget.disarm()
+        assert budget.seconds is None
+
+    def test_unenforced_off_main_thread_logged_once(self, caplog, monkeypatch):
+        import threading
+        from harness.lint import redos
+        monkeypatch.setattr(redos, "_unenforced", set())
+        budgets = []
+        worker = threading.Thread(target=lambda: budgets.extend([TimeBudget(0.5), TimeBudget(0.5)]))
+        worker.start()
+        worker.join()
+        assert [budget.seconds for budget in budgets] == [None, None]
+        assert caplog.text.count("not enforced") == 1
+        assert "outside the main thread" in caplog.text
+
+
+# ── rule loading and scanning ───────────────────────────────────────
+class TestRuleGuard:
+    def test_risky_rule_flagged_at_load(self, capsys, caplog):
+        rs = compile_ruleset(BannedPhrases(banned_regex=[r"(\w+\s?)*!", r"(?i)breath\s+hitch"]))
+        assert [bool(r.risk) for r in rs.group("banned")] == [True, False]
+        assert "may be slow" in caplog.text
+        assert capsys.readouterr().out == ""
+
+    def test_runaway_rule_skipped(self, capsys, caplog):
+        rs = compile_ruleset(
+            BannedPhrases(banned_regex=[r"(\w+\s?)*!", r"(?i)breath\s+hitch"]),
+            LintConfig(pattern_time_budget=0.1),
+        )
+        started = time.perf_counter()
+        violations = lint_banned_phrases("word " * 40 + "x\nHer breath hitched.", rs)
+        assert time.perf_counter() - started < 2
+        assert [v.message for v in violations] == ["Banned: breath hitch"]
+        assert "exceeded" in caplog.text
+        assert capsys.readouterr().out == ""
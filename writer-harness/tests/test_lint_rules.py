@@ -36,6 +36,21 @@ class TestLoadStyleRules:
         assert "pov" in rules.hard_rules
         assert rules.output_targets["length_words"] == [600, 1200]
 
+    def test_lint_section_defaults(self, tmp_dir):
+        rules = load_style_rules(tmp_dir / "nonexistent.yaml")
+        assert "silence" in rules.lint.object_anthropomorphism.nouns
+        assert rules.lint.object_anthropomorphism.window >= 1
+
+    def test_lint_section_overrides(self, tmp_dir):
+        data = {"lint": {"object_anthropomorphism": {"verbs": ["glares"], "window": 3}}}
+        path = tmp_dir / "style.yaml"
+        with open(path, "w") as f:
+            yaml.dump(data, f)
+        config = load_style_rules(path).lint.object_anthropomorphism
+        assert config.verbs == ["glares"]
+        assert config.window == 3
+        assert "silence" in config.nouns
+
 
 class TestLoadBannedPhrases:
     def test_missing_file_returns_empty(self, tmp_dir):
@@ -60,3 +75,30 @@ class TestLoadBannedPhrases:
         bp = load_banned_phrases(path)
         assert len(bp.banned_regex) == 2
         assert len(bp.warn_regex) == 1
+
+    def test_entries_with_fixes(self, tmp_dir):
+        data = {
+            "banned_regex": [
+                r"(?i)breath\s+hitch",
+                {"pattern": r"(?i)spilled\s+ink", "fix": {"replace": "ink"}},
+                {"pattern": r"(?i)she\s+realizes", "fix": "drop_clause"},
+            ],
+            "warn_regex": [{"pattern": r"(?i)perfectly", "fix": {"action": "delete"}}],
+        }
+        path = tmp_dir / "banned.yaml"
+        with open(path, "w") as f:
+            yaml.dump(data, f)
+        bp = load_banned_phrases(path)
+        assert bp.banned_regex == [r"(?i)breath\s+hitch", r"(?i)spilled\s+ink", r"(?i)she\s+realizes"]
+        assert bp.warn_regex == [r"(?i)perfectly"]
+        assert bp.fixes[r"(?i)spilled\s+ink"].replacement == "ink"
+        assert bp.fixes[r"(?i)she\s+realizes"].action == "drop_clause"
+        assert bp.fixes[r"(?i)perfectly"].action == "delete"
+        assert r"(?i)breath\s+hitch" not in bp.fixes
+
+    def test_unknown_fix_action_rejected(self, tmp_dir):
+        path = tmp_dir / "banned.yaml"
+        with open(path, "w") as f:
+            yaml.dump({"banned_regex": [{"pattern": "x", "fix": "rewrite"}]}, f)
+        with pytest.raises(ValueError):
+            load_banned_phrases(path)
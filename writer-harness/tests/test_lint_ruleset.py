@@ -0,0 +1,176 @@
+"""Tests for harness.lint.ruleset — compiled, cached rule sets."""
+import pytest
+import yaml
+from harness.models import BannedPhrases, LintConfig, PhraseFix
+from harness.lint.ruleset import (
+    MAX_CACHED_RULESETS,
+    RuleSet,
+    _FILE_DIGESTS,
+    _RULESETS,
+    compile_ruleset,
+    load_ruleset,
+    get_ruleset,
+    clear_ruleset_cache,
+    select_rules,
+    selects,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_ruleset_cache()
+    yield
+    clear_ruleset_cache()
+
+
+def _write_banned(path, banned=None, warn=None):
+    with open(path, "w") as f:
+        yaml.dump({"banned_regex": banned or [], "warn_regex": warn or []}, f)
+
+
+# ── compile_ruleset ─────────────────────────────────────────────────
+class TestCompileRuleset:
+    def test_includes_builtins(self):
+        rs = compile_ruleset(BannedPhrases())
+        assert rs.group("scene_containment")
+        assert rs.group("meta_narrative")
+        assert rs.group("editorializing")
+        assert rs.group("pov_consistency")
+        assert rs.group("banned") == []
+
+    def test_banned_and_warn_groups(self):
+        rs = compile_ruleset(BannedPhrases(banned_regex=[r"(?i)breath\s+hitch"], warn_regex=[r"(?i)cufflinks"]))
+        assert [r.severity for r in rs.group("banned", "warn")] == ["error", "warning"]
+        assert rs.group("banned")[0].rule_id == "banned:0"
+
+    def test_literals_extracted_at_load(self):
+        rs = compile_ruleset(BannedPhrases(banned_regex=[r"(?i)breath\s+hitch", r"(?i)(?:he|she)\s+to"]))
+        assert [r.literals for r in rs.group("banned")] == [{"breath"}, None]
+
+    def test_reused_for_equal_content(self):
+        a = compile_ruleset(BannedPhrases(banned_regex=["x"]))
+        b = compile_ruleset(BannedPhrases(banned_regex=["x"]))
+        assert a is b
+
+    def test_different_content_different_digest(self):
+        a = compile_ruleset(BannedPhrases(banned_regex=["x"]))
+        b = compile_ruleset(BannedPhrases(banned_regex=["y"]))
+        assert a.digest != b.digest
+
+    def test_fix_attached_and_in_digest(self):
+        plain = compile_ruleset(BannedPhrases(banned_regex=["spilled ink"]))
+        fixed = compile_ruleset(BannedPhrases(
+            banned_regex=["spilled ink"],
+            fixes={"spilled ink": PhraseFix(action="replace", replacement="ink")},
+        ))
+        assert plain.group("banned")[0].fix is None
+        assert fixed.group("banned")[0].fix.replacement == "ink"
+        assert plain.digest != fixed.digest
+
+    def test_malformed_pattern_skipped(self, capsys, caplog):
+        rs = compile_ruleset(BannedPhrases(banned_regex=["[invalid", "ok"]))
+        assert [r.pattern for r in rs.group("banned")] == ["ok"]
+        assert "Malformed" in caplog.text
+        assert capsys.readouterr().out == ""
+
+
+# ── load_ruleset ────────────────────────────────────────────────────
+class TestLoadRuleset:
+    def test_missing_file(self, tmp_path):
+        rs = load_ruleset(tmp_path / "missing.yaml")
+        assert rs.group("banned", "warn") == []
+
+    def test_cached_by_file_content(self, tmp_path):
+        path = tmp_path / "banned_phrases.yaml"
+        _write_banned(path, banned=[r"(?i)breath\s+hitch"])
+        assert load_ruleset(path) is load_ruleset(path)
+
+    def test_reloads_on_change(self, tmp_path):
+        path = tmp_path / "banned_phrases.yaml"
+        _write_banned(path, banned=["one"])
+        first = load_ruleset(path)
+        _write_banned(path, banned=["two"])
+        second = load_ruleset(path)
+        assert first is not second
+        assert second.group("banned")[0].pattern == "two"
+
+    def test_cache_bounded(self, tmp_path):
+        path = tmp_path / "banned_phrases.yaml"
+        _write_banned(path, banned=["first"])
+        first = load_ruleset(path)
+        for n in range(MAX_CACHED_RULESETS + 5):
+            _write_banned(path, banned=[f"edit{n}"])
+            assert load_ruleset(path).group("banned")[0].pattern == f"edit{n}"
+        assert len(_RULESETS) == len(_FILE_DIGESTS) == MAX_CACHED_RULESETS
+        assert first not in _RULESETS.values()
+
+    def test_recently_used_kept(self):
+        kept = compile_ruleset(BannedPhrases(banned_regex=["kept"]))
+        for n in range(MAX_CACHED_RULESETS * 2):
+            compile_ruleset(BannedPhrases(banned_regex=[f"other{n}"]))
+            assert compile_ruleset(BannedPhrases(banned_regex=["kept"])) is kept
+
+    def test_style_rules_lint_config(self, tmp_path):
+        banned = tmp_path / "banned_phrases.yaml"
+        _write_banned(banned)
+        rules = tmp_path / "style_rules.yaml"
+        with open(rules, "w") as f:
+            yaml.dump({"lint": {"object_anthropomorphism": {"window": 2}}}, f)
+        rs = load_ruleset(banned, rules)
+        assert rs.anthropomorphism.window == 2
+        assert rs.digest != load_ruleset(banned).digest
+
+    def test_matches_model_ruleset(self, tmp_path):
+        path = tmp_path / "banned_phrases.yaml"
+        _write_banned(path, banned=["one"], warn=["two"])
+        assert load_ruleset(path) is compile_ruleset(BannedPhrases(banned_regex=["one"], warn_regex=["two"]))
+
+
+# ── get_ruleset ─────────────────────────────────────────────────────
+class TestGetRuleset:
+    def test_passthrough(self):
+        rs = compile_ruleset(BannedPhrases())
+        assert get_ruleset(rs) is rs
+
+    def test_none_is_builtins_only(self):
+        rs = get_ruleset(None)
+        assert isinstance(rs, RuleSet)
+        assert rs.group("banned", "warn") == []
+
+
+# ── select / ignore ─────────────────────────────────────────────────
+class TestSelection:
+    def test_selects(self):
+        assert selects("style", "banned:0", "style")
+        assert selects("banned", "banned:0", "style")
+        assert selects("banned:0", "banned:0", "style")
+        assert selects("style", "style:pov_and_address", "style")
+        assert not selects("banned:1", "banned:10", "style")
+        assert not selects("style", "continuity:timeline", "continuity")
+
+    def test_everything_enabled_by_default(self):
+        rs = compile_ruleset(BannedPhrases(banned_regex=["a", "b"]))
+        assert rs.enabled("banned:0") and rs.enabled("continuity:timeline", "continuity")
+
+    def test_select_and_ignore(self):
+        rs = compile_ruleset(
+            BannedPhrases(banned_regex=["a", "b"]),
+            LintConfig(select=["banned", "continuity"], ignore=["banned:1", "continuity:timeline"]),
+        )
+        assert rs.enabled("banned:0")
+        assert not rs.enabled("banned:1")
+        assert not rs.enabled("meta_narrative:0")
+        assert not rs.enabled("style:pov_and_address")
+        assert rs.enabled("continuity:who_present", "continuity")
+        assert not rs.enabled("continuity:timeline", "continuity")
+
+    def test_scanner_only_has_enabled_rules(self):
+        rs = compile_ruleset(BannedPhrases(banned_regex=["a", "b"]), LintConfig(ignore=["banned:0", "warn"]))
+        assert [r.rule_id for r in rs.scanner("banned", "warn").rules] == ["banned:1"]
+
+    def test_select_rules_overrides_config(self):
+        rs = compile_ruleset(BannedPhrases(banned_regex=["a"]), LintConfig(select=["continuity"]))
+        selected = select_rules(rs, select=["banned"])
+        assert selected.lint_config.select == ["banned"]
+        assert selected.digest != rs.digest
+        assert select_rules(rs) is rs
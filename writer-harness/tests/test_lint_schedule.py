@@ -0,0 +1,38 @@
+"""Tests for harness.lint.schedule — cost-ordered, fail-fast linting."""
+from harness.models import BannedPhrases, LintConfig
+from harness.lint.ruleset import compile_ruleset
+from harness.lint.style import lint_style
+from harness.lint.continuity import lint_continuity
+from harness.lint.profile import profiling
+from harness.lint.schedule import lint_fail_fast
+from harness.lint.cache import LintCache, lint_text
+
+
+class TestLintFailFast:
+    def test_no_error_matches_full_lint(self, ruleset, ledger):
+        text = "Phoenix waited in the Salon, perfectly still.\nThe door waits.\nHe sat for 45 minutes."
+        style, continuity = lint_fail_fast(text, ruleset, ledger)
+        assert style == lint_style(text, ruleset)
+        assert continuity == lint_continuity(text, ledger)
+
+    def test_stops_before_expensive_checks(self, ruleset, ledger):
+        text = "Her breath hitched. The door waits."
+        with profiling() as profiler:
+            style, _ = lint_fail_fast(text, ruleset, ledger)
+        assert [v.rule_id for v in style] == ["banned:0"]
+        assert "style:object_anthropomorphism" not in profiler.stats
+        assert "style:pov_and_address" not in profiler.stats
+        assert "continuity:location_change" in profiler.stats
+
+    def test_skips_deselected_checks(self, ledger):
+        ruleset = compile_ruleset(BannedPhrases(banned_regex=[r"(?i)breath\s+hitch"]), LintConfig(select=["style:pov_and_address"]))
+        style, continuity = lint_fail_fast("Her breath hitched. You wait.", ruleset, ledger)
+        assert [v.rule_id for v in style] == ["style:pov_and_address"]
+        assert continuity == []
+
+    def test_lint_text_caches_only_complete_results(self, tmp_path, ruleset, ledger):
+        cache = LintCache(tmp_path / "cache", 10_000_000)
+        lint_text("Her breath hitched.", ruleset, ledger, cache, fail_fast=True)
+        assert cache.size() == 0
+        lint_text("Phoenix waited in the Salon.", ruleset, ledger, cache, fail_fast=True)
+        assert cache.size() > 0
@@ -0,0 +1,66 @@
+"""Tests for harness.lint.streaming — linting text as it is generated."""
+from harness.models import StreamAbortConfig
+from harness.lint.streaming import StreamingLinter, consume_stream
+
+
+def _tokens(text, size=3):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+BAD = "Her breath hitched.\n" * 10
+CLEAN = "He waited by the window. " * 100
+
+
+class TestStreamingLinter:
+    def test_lints_completed_sentences_only(self, ruleset, ledger):
+        linter = StreamingLinter(ruleset, ledger)
+        linter.feed("Her breath hitch")
+        assert linter.completed == 0 and linter.violations == []
+        linter.feed("ed. ")
+        assert linter.completed == len("Her breath hitched. ")
+        assert [v.message for v in linter.errors] == ["Banned: breath hitch"]
+
+    def test_newline_completes_a_line(self, ruleset, ledger):
+        linter = StreamingLinter(ruleset, ledger)
+        linter.feed("# Heading\nNext")
+        assert linter.completed == len("# Heading\n")
+
+    def test_no_abort_without_threshold(self, ruleset, ledger):
+        linter = StreamingLinter(ruleset, ledger, StreamAbortConfig())
+        assert not any(linter.feed(t) for t in _tokens(BAD))
+        assert not linter.aborted
+
+    def test_aborts_past_threshold(self, ruleset, ledger):
+        linter = StreamingLinter(ruleset, ledger, StreamAbortConfig(max_errors=2))
+        results = [linter.feed(t) for t in _tokens(BAD)]
+        assert linter.aborted and results[-1]
+        assert len(linter.errors) == 3
+
+    def test_errors_after_window_do_not_abort(self, ruleset, ledger):
+        linter = StreamingLinter(ruleset, ledger, StreamAbortConfig(max_errors=2, within_words=50))
+        for t in _tokens(CLEAN + BAD):
+            linter.feed(t)
+        assert not linter.aborted
+        assert linter.text == CLEAN + BAD
+
+
+class TestConsumeStream:
+    def test_closes_stream_on_abort(self, ruleset, ledger):
+        closed = []
+
+        def chunks():
+            try:
+                for t in _tokens(BAD + CLEAN):
+                    yield t
+            finally:
+                closed.append(True)
+
+        linter = StreamingLinter(ruleset, ledger, StreamAbortConfig(max_errors=1))
+        text = consume_stream(chunks(), linter)
+        assert closed == [True]
+        assert linter.aborted
+        assert len(text) < len(BAD + CLEAN)
+
+    def test_full_text_without_abort(self, ruleset, ledger):
+        linter = StreamingLinter(ruleset, ledger)
+        assert consume_stream(iter(_tokens(CLEAN)), linter) == CLEAN
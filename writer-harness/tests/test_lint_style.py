@@ -1,6 +1,7 @@
 """Tests for harness.lint.style — all 8 style checkers + aggregator."""
 import pytest
-from harness.models import BannedPhrases
+from harness.models import BannedPhrases, LintConfig
+from harness.lint.ruleset import compile_ruleset
 from harness.lint.style import (
     lint_banned_phrases,
     lint_scene_containment,
@@ -43,6 +44,10 @@ class TestLintBannedPhrases:
         assert vs[0].severity == "warning"
         assert "Caution" in vs[0].message
 
+    def test_wrapped_match_echoed_on_one_line(self):
+        vs = lint_banned_phrases("Caution: the\nnarrative turns.", _bp(warn=[r"(?i)the\s+narrative"]))
+        assert [v.message for v in vs] == ["Caution: the narrative"]
+
     def test_multiple_lines(self):
         text = "Line one.\nHer breath hitched.\nLine three.\nSilence pools around them."
         bp = _bp(banned=[r"(?i)breath\s+hitch", r"(?i)silence\s+pools"])
@@ -57,6 +62,21 @@ class TestLintBannedPhrases:
         vs = lint_banned_phrases(text, bp)
         assert vs == []
 
+    def test_span_fields(self):
+        text = "Line one.\nHer breath hitched."
+        bp = _bp(banned=[r"(?i)breath\s+hitch"])
+        [v] = lint_banned_phrases(text, bp)
+        assert v.line_number == 2
+        assert v.column == 5
+        assert text[v.start:v.end] == "breath hitch"
+
+    def test_phrase_wrapped_across_lines(self):
+        text = "Her breath\nhitched in the dark."
+        bp = _bp(banned=[r"(?i)breath\s+hitch"])
+        vs = lint_banned_phrases(text, bp)
+        assert len(vs) == 1
+        assert vs[0].line_number == 1
+
     def test_context_truncated(self):
         text = "x" * 200 + " breath hitch"
         bp = _bp(banned=[r"(?i)breath\s+hitch"])
@@ -135,6 +155,12 @@ class TestLintPovAndAddress:
         assert len(vs) == 1
         assert "you" in vs[0].message.lower()
 
+    def test_second_person_span(self):
+        text = "She waited.\nThen you could see it."
+        [v] = lint_pov_and_address(text)
+        assert (v.line_number, v.column) == (2, 6)
+        assert text[v.start:v.end] == "you"
+
     def test_second_person_in_dialogue_ok(self):
         text = '"You should leave," she said.'
         vs = lint_pov_and_address(text)
@@ -154,6 +180,16 @@ class TestLintPovAndAddress:
         vs = lint_pov_and_address(text)
         assert vs == []
 
+    def test_second_person_in_quote_continued_across_lines(self):
+        text = 'She said, "Listen to me.\nYou should leave now."\nThen she went.'
+        assert lint_pov_and_address(text) == []
+
+    def test_second_person_after_multiline_quote_flagged(self):
+        text = '"Listen to me.\nPlease." Then you could see it.'
+        [v] = lint_pov_and_address(text)
+        assert v.line_number == 2
+        assert text[v.start:v.end] == "you"
+
 
 # ── lint_editorializing ─────────────────────────────────────────────
 class TestLintEditorializing:
@@ -205,6 +241,26 @@ class TestLintObjectAnthropomorphism:
         vs = lint_object_anthropomorphism(text)
         assert any("door" in v.message and "waits" in v.message for v in vs)
 
+    def test_punctuation_breaks_window(self):
+        text = "He closed the door. Nobody waits for him."
+        assert lint_object_anthropomorphism(text) == []
+
+    def test_window_bounded(self):
+        text = "The door " + "very " * 20 + "slowly waits."
+        assert lint_object_anthropomorphism(text) == []
+
+    def test_configured_nouns_verbs_window(self):
+        config = LintConfig(object_anthropomorphism={"nouns": ["carafe"], "verbs": ["judges"], "window": 2})
+        rs = compile_ruleset(BannedPhrases(), config)
+        vs = lint_object_anthropomorphism("The carafe quietly judges them.", ruleset=rs)
+        assert [v.message for v in vs] == ["Object anthropomorphism: 'carafe' + 'judges'"]
+        assert lint_object_anthropomorphism("The carafe sat there and judges.", ruleset=rs) == []
+        assert lint_object_anthropomorphism("The door waits.", ruleset=rs) == []
+
+    def test_long_line_linear(self):
+        text = " ".join(["door"] * 20000)
+        assert lint_object_anthropomorphism(text) == []
+
 
 # ── lint_dialogue_exposition ────────────────────────────────────────
 class TestLintDialogueExposition:
@@ -0,0 +1,106 @@
+"""Tests for harness.lint.violation — compact records and the per-rule cap."""
+import pytest
+from harness.models import BannedPhrases, ContinuityLedger, LintConfig, LintViolation
+from harness.lint.ruleset import compile_ruleset
+from harness.lint.style import lint_style
+from harness.lint.incremental import IncrementalLinter
+from harness.lint.chunked import lint_chunks, read_chunks, split_categories
+from harness.lint.violation import Violation, cap_per_rule, to_models
+
+
+def _violation(rule_id="banned:0", line=1):
+    return Violation(rule_id, "style", "error", "Banned phrase", line, "ctx", 2, 5, 9)
+
+
+@pytest.fixture
+def ledger():
+    return ContinuityLedger(
+        location_current="Salon",
+        time_of_day="evening",
+        date_or_day_count="Day 1",
+        elapsed_time_since_last_scene="10 minutes",
+        who_present=["Phoenix"],
+    )
+
+
+def _ruleset(cap=None):
+    return compile_ruleset(
+        BannedPhrases(banned_regex=[r"(?i)breath\s+hitch"]),
+        LintConfig(max_violations_per_rule=cap),
+    )
+
+
+DENSE = "\n\n".join(f"Her breath hitched. You wait. The door waits. ({n})" for n in range(12))
+
+
+# ── Violation ───────────────────────────────────────────────────────
+class TestViolation:
+    def test_to_model(self):
+        model = _violation().to_model()
+        assert isinstance(model, LintViolation)
+        assert model == LintViolation(
+            rule_id="banned:0", category="style", severity="error", message="Banned phrase",
+            line_number=1, context="ctx", column=2, start=5, end=9,
+        )
+
+    def test_to_models(self):
+        assert [v.line_number for v in to_models([_violation(line=1), _violation(line=4)])] == [1, 4]
+
+    def test_shifted(self):
+        moved = _violation().shifted(3, 100)
+        assert (moved.line_number, moved.column, moved.start, moved.end) == (4, 2, 105, 109)
+
+    def test_shifted_without_position(self):
+        v = Violation("continuity:who_present", "continuity", "warning", "missing")
+        assert v.shifted(3, 100).line_number is None
+
+
+# ── cap_per_rule ────────────────────────────────────────────────────
+class TestCapPerRule:
+    def test_no_limit(self):
+        violations = [_violation(line=n) for n in range(5)]
+        assert cap_per_rule(violations, None) == violations
+
+    def test_limit_per_rule(self):
+        violations = [_violation("a", 1), _violation("b", 1), _violation("a", 2), _violation("a", 3)]
+        assert [(v.rule_id, v.line_number) for v in cap_per_rule(violations, 2)] == [("a", 1), ("b", 1), ("a", 2)]
+
+    def test_counts_carry_across_calls(self):
+        counts = {}
+        assert len(cap_per_rule([_violation(line=1), _violation(line=2)], 3, counts)) == 2
+        assert len(cap_per_rule([_violation(line=3), _violation(line=4)], 3, counts)) == 1
+
+
+# ── max_violations_per_rule ─────────────────────────────────────────
+class TestMaxViolationsPerRule:
+    def test_rule_ids_reported(self):
+        rule_ids = {v.rule_id for v in lint_style(DENSE, _ruleset())}
+        assert rule_ids == {"banned:0", "style:pov_and_address", "style:object_anthropomorphism"}
+
+    def test_lint_style_capped(self):
+        violations = lint_style(DENSE, _ruleset(cap=3))
+        by_rule = {}
+        for v in violations:
+            by_rule.setdefault(v.rule_id, []).append(v.line_number)
+        assert by_rule == {
+            "banned:0": [1, 3, 5],
+            "style:pov_and_address": [1, 3, 5],
+            "style:object_anthropomorphism": [1, 3, 5],
+        }
+
+    def test_config_rejects_zero(self):
+        with pytest.raises(ValueError):
+            LintConfig(max_violations_per_rule=0)
+
+    def test_incremental_matches_full(self, ledger):
+        ruleset = _ruleset(cap=3)
+        style, _ = IncrementalLinter(ruleset, ledger).lint(DENSE)
+        assert style == lint_style(DENSE, ruleset)
+
+    def test_chunked_matches_full(self, ledger):
+        ruleset = _ruleset(cap=3)
+        chunks = read_chunks(DENSE.splitlines(keepends=True), chunk_chars=40)
+        style, _ = split_categories(lint_chunks(chunks, ruleset, ledger))
+        # Chunks report in text order, lint_style rule by rule.
+        key = lambda v: (v.rule_id, v.line_number)
+        assert sorted(style, key=key) == sorted(lint_style(DENSE, ruleset), key=key)
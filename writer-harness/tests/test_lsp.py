@@ -0,0 +1,240 @@
+"""Tests for harness.lsp — LSP diagnostics driven by a scripted client."""
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+import pytest
+from harness.cli import create_workspace
+from harness.lsp import (
+    METHOD_NOT_FOUND,
+    SERVER_NOT_INITIALIZED,
+    LintLanguageServer,
+    apply_change,
+    line_starts,
+    read_message,
+    to_offset,
+    to_position,
+    write_message,
+)
+
+URI = "file:///scene.md"
+
+
+class ScriptedClient:
+    """Drives a LintLanguageServer running in a thread through a pair of pipes."""
+
+    def __init__(self, workspace, debounce=0.05):
+        to_server, self._out = os.pipe()
+        self._in, from_server = os.pipe()
+        self._writer = os.fdopen(self._out, "wb")
+        self._reader = os.fdopen(self._in, "rb")
+        self.server = LintLanguageServer(workspace, os.fdopen(to_server, "rb"), os.fdopen(from_server, "wb"), debounce)
+        self.exit_code = None
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        self._ids = 0
+        self.logs = []
+
+    def _next(self):
+        message = read_message(self._reader)
+        if message.get("method") == "window/logMessage":
+            self.logs.append(message["params"])
+        return message
+
+    def _serve(self):
+        self.exit_code = self.server.serve()
+        self.server.writer.close()
+
+    def notify(self, method, params=None):
+        write_message(self._writer, {"jsonrpc": "2.0", "method": method, "params": params or {}})
+
+    def request(self, method, params=None):
+        self._ids += 1
+        write_message(self._writer, {"jsonrpc": "2.0", "id": self._ids, "method": method, "params": params or {}})
+        while True:
+            message = self._next()
+            if message.get("id") == self._ids:
+                return message
+
+    def diagnostics(self):
+        """The next publishDiagnostics notification's params."""
+        while True:
+            message = self._next()
+            if message.get("method") == "textDocument/publishDiagnostics":
+                return message["params"]
+
+    def initialize(self):
+        return self.request("initialize", {"processId": None, "rootUri": None, "capabilities": {}})
+
+    def open(self, text, uri=URI):
+        self.notify("textDocument/didOpen", {"textDocument": {"uri": uri, "languageId": "markdown", "version": 1, "text": text}})
+
+    def change(self, version, changes, uri=URI):
+        self.notify("textDocument/didChange", {"textDocument": {"uri": uri, "version": version}, "contentChanges": changes})
+
+    def stop(self):
+        self.request("shutdown")
+        self.notify("exit")
+        self._thread.join(10)
+        return self.exit_code
+
+
+def _edit(line, start, end, text):
+    return {"range": {"start": {"line": line, "character": start}, "end": {"line": line, "character": end}}, "text": text}
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    ws = tmp_path / "ws"
+    create_workspace(ws)
+    return ws
+
+
+@pytest.fixture
+def client(workspace):
+    client = ScriptedClient(workspace)
+    client.initialize()
+    yield client
+    if client._thread.is_alive():
+        client.stop()
+
+
+def _codes(params):
+    return [d.get("code") for d in params["diagnostics"]]
+
+
+# ── positions and edits ─────────────────────────────────────────────
+class TestPositions:
+    def test_offsets_round_trip(self):
+        text = "one\ntwo 😀 three\n"
+        starts = line_starts(text)
+        offset = text.index("three")
+        position = to_position(text, starts, offset)
+        assert position == {"line": 1, "character": 7}
+        assert to_offset(text, starts, position) == offset
+
+    def test_apply_ranged_change(self):
+        assert apply_change("Her breath hitched.\nHe sat.", _edit(0, 4, 18, "pulse held")) == "Her pulse held.\nHe sat."
+
+    def test_apply_change_after_astral_character(self):
+        assert apply_change("😀 cat", _edit(0, 3, 6, "dog")) == "😀 dog"
+
+    def test_full_replacement(self):
+        assert apply_change("old", {"text": "new"}) == "new"
+
+
+# ── server ──────────────────────────────────────────────────────────
+class TestServer:
+    def test_initialize(self, workspace):
+        client = ScriptedClient(workspace)
+        assert client.request("shutdown")["error"]["code"] == SERVER_NOT_INITIALIZED
+        capabilities = client.initialize()["result"]["capabilities"]
+        assert capabilities["textDocumentSync"]["change"] == 2
+        assert client.stop() == 0
+
+    def test_exit_without_shutdown(self, workspace):
+        client = ScriptedClient(workspace)
+        client.notify("exit")
+        client._thread.join(10)
+        assert client.exit_code == 1
+
+    def test_unknown_request(self, client):
+        assert client.request("textDocument/hover", {})["error"]["code"] == METHOD_NOT_FOUND
+
+    def test_open_publishes_diagnostics(self, client):
+        client.open("He sat in the salon.\nHer breath hitched.\n")
+        params = client.diagnostics()
+        assert params["uri"] == URI and params["version"] == 1
+        [banned] = [d for d in params["diagnostics"] if d["code"] == "banned:0"]
+        assert banned["severity"] == 1 and banned["source"] == "harness"
+        assert banned["range"] == {"start": {"line": 1, "character": 4}, "end": {"line": 1, "character": 16}}
+
+    def test_incremental_change_clears_violation(self, client):
+        client.open("He sat in the salon.\nHer breath hitched.\n")
+        assert "banned:0" in _codes(client.diagnostics())
+        client.change(2, [_edit(1, 4, 18, "pulse held")])
+        params = client.diagnostics()
+        assert params["version"] == 2
+        assert "banned:0" not in _codes(params)
+        assert client.server.documents[URI].text == "He sat in the salon.\nHer pulse held.\n"
+
+    def test_rapid_changes_are_debounced(self, client):
+        client.open("He waited.")
+        client.diagnostics()
+        client.change(2, [_edit(0, 10, 10, " Her")])
+        client.change(3, [_edit(0, 14, 14, " breath")])
+        client.change(4, [_edit(0, 21, 21, " hitched.")])
+        params = client.diagnostics()
+        assert params["version"] == 4
+        assert "banned:0" in _codes(params)
+
+    def test_reuses_unchanged_paragraphs(self, client):
+        text = "\n\n".join(f"Paragraph {n}. He waited in the salon." for n in range(50))
+        client.open(text)
+        client.diagnostics()
+        client.change(2, [_edit(20, 0, 0, "Her breath hitched. ")])
+        params = client.diagnostics()
+        [banned] = [d for d in params["diagnostics"] if d["code"] == "banned:0"]
+        assert banned["range"]["start"] == {"line": 20, "character": 4}
+        assert client.server.documents[URI].linter.scanned == 1
+
+    def test_close_clears_diagnostics(self, client):
+        client.open("Her breath hitched.")
+        client.diagnostics()
+        client.notify("textDocument/didClose", {"textDocument": {"uri": URI}})
+        assert client.diagnostics() == {"uri": URI, "diagnostics": []}
+        assert URI not in client.server.documents
+
+
+BAD_RULES = 'banned_regex:\n  - "[bad"\n  - "(\\\\w+\\\\s?)*!"\n  - "(?i)breath hitch"\nwarn_regex: []\n'
+
+
+def _frames(data: bytes):
+    """Parse a byte stream strictly as Content-Length framed JSON messages."""
+    stream = io.BytesIO(data)
+    frames = []
+    while stream.tell() < len(data):
+        header = stream.readline()
+        assert header.startswith(b"Content-Length: "), header
+        assert stream.readline() == b"\r\n"
+        frames.append(json.loads(stream.read(int(header.split(b":")[1]))))
+    return frames
+
+
+class TestRuleWarnings:
+    def test_sent_as_log_messages(self, workspace):
+        (workspace / "banned_phrases.yaml").write_text(BAD_RULES)
+        client = ScriptedClient(workspace)
+        client.initialize()
+        client.open("Her breath hitched.")
+        assert "banned:2" in _codes(client.diagnostics())
+        messages = [log["message"] for log in client.logs]
+        assert any("Malformed regex pattern '[bad'" in m for m in messages)
+        assert any("may be slow" in m for m in messages)
+        assert client.stop() == 0
+
+    def test_stdout_carries_only_protocol_frames(self, workspace):
+        (workspace / "banned_phrases.yaml").write_text(BAD_RULES)
+        requests = [
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {"capabilities": {}}},
+            {"jsonrpc": "2.0", "method": "textDocument/didOpen", "params": {"textDocument": {
+                "uri": URI, "languageId": "markdown", "version": 1, "text": "Her breath hitched."}}},
+            {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        ]
+        stdin = io.BytesIO()
+        for request in requests:
+            write_message(stdin, request)
+        env = dict(os.environ, WORKSPACE_ROOT=str(workspace), PYTHONPATH=str(Path(__file__).parent.parent))
+        result = subprocess.run(
+            [sys.executable, "-m", "harness.cli", "lsp", "--debounce", "0"],
+            input=stdin.getvalue(), capture_output=True, env=env, timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
+        frames = _frames(result.stdout)
+        assert [f.get("id") for f in frames if "id" in f] == [1, 2]
+        logs = [f["params"]["message"] for f in frames if f.get("method") == "window/logMessage"]
+        assert any("Malformed" in m for m in logs)
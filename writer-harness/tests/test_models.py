@@ -99,6 +99,8 @@ class TestLintViolation:
         v = LintViolation(category="style", severity="error", message="Bad")
         assert v.line_number is None
         assert v.context == ""
+        assert v.column is None
+        assert v.start is None and v.end is None
 
     def test_full(self):
         v = LintViolation(
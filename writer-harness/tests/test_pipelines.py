@@ -119,6 +119,31 @@ class TestDraftScene:
         assert "style_violations" in result
         assert "continuity_violations" in result
         assert result["draft_text"] == "Alice sat in the Library and opened a book."
+        assert result["aborted"] is False
+
+    @patch("harness.pipelines.draft.get_provider")
+    @patch("harness.pipelines.draft.settings")
+    def test_draft_scene_stream_aborts(self, mock_settings, mock_get_provider, tmp_path):
+        workspace, scene_path = self._setup_workspace(tmp_path)
+        with open(workspace / "banned_phrases.yaml", "w") as f:
+            yaml.dump({"banned_regex": [r"(?i)breath\s+hitch"], "warn_regex": []}, f)
+
+        mock_settings.max_tokens = 1000
+        mock_settings.provider = "anthropic"
+        mock_settings.anthropic_api_key = "test"
+        mock_settings.openai_api_key = ""
+        mock_settings.model_name = "claude-3"
+
+        mock_provider = MagicMock()
+        mock_provider.stream.return_value = iter(["Her breath hitched.\n"] * 50)
+        mock_get_provider.return_value = mock_provider
+
+        from harness.pipelines.draft import draft_scene
+        result = draft_scene(scene_path, workspace_root=workspace, use_lore=False, stream=True, max_errors=3)
+
+        assert result["aborted"] is True
+        assert result["draft_text"] == "Her breath hitched.\n" * 4
+        mock_provider.generate.assert_not_called()
 
 
 # ── revise_draft (integration with mocks) ───────────────────────────
@@ -172,3 +197,61 @@ class TestReviseDraft:
         assert "revised_text" in result
         assert "style_violations" in result
         assert "continuity_violations" in result
+
+    def _write_fixes(self, workspace):
+        banned = {
+            "banned_regex": [
+                {"pattern": r"(?i)spilled\s+ink", "fix": {"replace": "ink"}},
+                r"(?i)breath\s+hitch",
+            ],
+        }
+        with open(workspace / "banned_phrases.yaml", "w") as f:
+            yaml.dump(banned, f)
+
+    @patch("harness.pipelines.revise.get_provider")
+    @patch("harness.pipelines.revise.settings")
+    def test_autofix_first_skips_provider_when_clean(self, mock_settings, mock_get_provider, tmp_path):
+        workspace = self._setup_workspace(tmp_path)
+        self._write_fixes(workspace)
+        mock_settings.workspace_root = workspace
+
+        from harness.pipelines.revise import revise_draft
+        result = revise_draft(
+            "Alice sat in the Library. The spilled ink dried.",
+            workspace_root=workspace,
+            autofix_first=True,
+        )
+
+        assert result["revised_text"] == "Alice sat in the Library. The ink dried."
+        assert result["provider_called"] is False
+        assert len(result["autofixes"]) == 1
+        assert result["style_violations"] == []
+        mock_get_provider.assert_not_called()
+
+    @patch("harness.pipelines.revise.get_provider")
+    @patch("harness.pipelines.revise.settings")
+    def test_autofix_first_sends_remainder_to_provider(self, mock_settings, mock_get_provider, tmp_path):
+        workspace = self._setup_workspace(tmp_path)
+        self._write_fixes(workspace)
+        mock_settings.workspace_root = workspace
+        mock_settings.max_tokens = 1000
+        mock_settings.provider = "anthropic"
+        mock_settings.anthropic_api_key = "test"
+        mock_settings.openai_api_key = ""
+        mock_settings.model_name = "claude-3"
+
+        mock_provider = MagicMock()
+        mock_provider.generate.return_value = "Alice sat in the Library. The ink dried."
+        mock_get_provider.return_value = mock_provider
+
+        from harness.pipelines.revise import revise_draft
+        result = revise_draft(
+            "Alice sat in the Library. The spilled ink dried. Her breath hitched.",
+            workspace_root=workspace,
+            autofix_first=True,
+        )
+
+        assert result["provider_called"] is True
+        prompt = mock_provider.generate.call_args[0][0]
+        assert "spilled ink" not in prompt
+        assert "breath hitch" in prompt.lower()
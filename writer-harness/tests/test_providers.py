@@ -28,6 +28,15 @@ class TestGetProvider:
             assert isinstance(provider, AnthropicProvider)
 
 
+class TestDefaultStream:
+    def test_yields_generate_result(self):
+        class Fixed(LLMProvider):
+            def generate(self, prompt, max_tokens):
+                return "All at once."
+
+        assert list(Fixed().stream("p", 10)) == ["All at once."]
+
+
 class TestAnthropicProvider:
     def test_generate(self):
         with patch("harness.providers.anthropic_provider.anthropic") as mock_api:
@@ -49,6 +58,20 @@ class TestAnthropicProvider:
             )
 
 
+    def test_stream(self):
+        with patch("harness.providers.anthropic_provider.anthropic") as mock_api:
+            mock_client = MagicMock()
+            mock_api.Anthropic.return_value = mock_client
+            mock_stream = MagicMock()
+            mock_stream.text_stream = iter(["Gen", "erated."])
+            mock_client.messages.stream.return_value.__enter__.return_value = mock_stream
+
+            from harness.providers.anthropic_provider import AnthropicProvider
+            provider = AnthropicProvider(api_key="test-key", model_name="claude-3")
+            assert list(provider.stream("Write something", max_tokens=100)) == ["Gen", "erated."]
+            mock_client.messages.stream.return_value.__exit__.assert_called_once()
+
+
 class TestOpenAIProvider:
     def test_generate(self):
         with patch("harness.providers.openai_provider.openai") as mock_api:
@@ -70,3 +93,25 @@ class TestOpenAIProvider:
                 max_tokens=100,
                 messages=[{"role": "user", "content": "Write something"}],
             )
+
+    def test_stream_closes_response(self):
+        with patch("harness.providers.openai_provider.openai") as mock_api:
+            mock_client = MagicMock()
+            mock_api.OpenAI.return_value = mock_client
+            chunks = []
+            for text in ["GPT", None, " output."]:
+                chunk = MagicMock()
+                chunk.choices = [MagicMock()]
+                chunk.choices[0].delta.content = text
+                chunks.append(chunk)
+            mock_response = MagicMock()
+            mock_response.__iter__.return_value = iter(chunks)
+            mock_client.chat.completions.create.return_value = mock_response
+
+            from harness.providers.openai_provider import OpenAIProvider
+            provider = OpenAIProvider(api_key="test-key", model_name="gpt-4")
+            stream = provider.stream("Write something", max_tokens=100)
+            assert next(stream) == "GPT"
+            stream.close()
+            mock_response.close.assert_called_once()
+            assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
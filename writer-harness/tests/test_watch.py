@@ -0,0 +1,141 @@
+"""Tests for harness.watch — change detection and re-linting for `lint --watch`."""
+import pytest
+from unittest.mock import patch
+from click.testing import CliRunner
+from harness.cli import cli, create_workspace
+from harness.watch import Batch, InotifyWatcher, LintWatch, PollingWatcher, debounced, open_watcher
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    ws = tmp_path / "ws"
+    create_workspace(ws)
+    (ws / "scenes" / "a.md").write_text("He waited in the salon.")
+    return ws
+
+
+def _inotify():
+    watcher = open_watcher()
+    if not isinstance(watcher, InotifyWatcher):
+        pytest.skip("inotify is not available")
+    return watcher
+
+
+# ── watchers ────────────────────────────────────────────────────────
+class TestInotifyWatcher:
+    def test_reports_written_file(self, tmp_path):
+        watcher = _inotify()
+        watcher.add(tmp_path)
+        (tmp_path / "a.md").write_text("x")
+        assert tmp_path / "a.md" in watcher.changes(5)
+        watcher.close()
+
+    def test_watches_new_subdirectories(self, tmp_path):
+        watcher = _inotify()
+        watcher.add(tmp_path)
+        (tmp_path / "sub").mkdir()
+        watcher.changes(5)
+        (tmp_path / "sub" / "b.md").write_text("x")
+        assert tmp_path / "sub" / "b.md" in watcher.changes(5)
+        watcher.close()
+
+    def test_non_recursive(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        watcher = _inotify()
+        watcher.add(tmp_path, recursive=False)
+        (tmp_path / "sub" / "b.md").write_text("x")
+        assert watcher.changes(0.2) == set()
+        watcher.close()
+
+    def test_debounced_burst(self, tmp_path):
+        watcher = _inotify()
+        watcher.add(tmp_path)
+        for name in ("a.md", "b.md", "a.md"):
+            (tmp_path / name).write_text(name)
+        assert next(debounced(watcher, 0.1)) == {tmp_path / "a.md", tmp_path / "b.md"}
+        watcher.close()
+
+
+class TestPollingWatcher:
+    def test_reports_changes(self, tmp_path):
+        (tmp_path / "a.md").write_text("x")
+        watcher = PollingWatcher(interval=0.01)
+        watcher.add(tmp_path)
+        (tmp_path / "a.md").write_text("longer")
+        (tmp_path / "b.md").write_text("x")
+        assert watcher.changes(1) == {tmp_path / "a.md", tmp_path / "b.md"}
+        (tmp_path / "b.md").unlink()
+        assert watcher.changes(1) == {tmp_path / "b.md"}
+        assert watcher.changes(0.05) == set()
+
+
+# ── LintWatch ───────────────────────────────────────────────────────
+class TestLintWatch:
+    def test_relints_changed_file_only(self, workspace):
+        session = LintWatch(workspace, [str(workspace / "scenes")], jobs=1, no_cache=True)
+        (workspace / "scenes" / "b.md").write_text("He waited.")
+        assert [r.path.name for r in session.lint(session.paths())] == ["a.md", "b.md"]
+        (workspace / "scenes" / "a.md").write_text("Her breath hitched.")
+        batch = session.handle({workspace / "scenes" / "a.md", workspace / "scenes" / "a.md~"})
+        [report] = batch.reports
+        assert report.path.name == "a.md"
+        assert "banned:0" in [v.rule_id for v in report.style]
+
+    def test_removed_file(self, workspace):
+        session = LintWatch(workspace, [str(workspace / "scenes")], jobs=1, no_cache=True)
+        (workspace / "scenes" / "a.md").unlink()
+        assert session.handle({workspace / "scenes" / "a.md"}) == Batch(removed=[workspace / "scenes" / "a.md"])
+
+    def test_config_change_reloads_and_relints_all(self, workspace):
+        session = LintWatch(workspace, [str(workspace / "scenes")], jobs=1, no_cache=True)
+        assert not any(v.rule_id == "banned:0" for r in session.lint(session.paths()) for v in r.style)
+        banned = workspace / "banned_phrases.yaml"
+        banned.write_text('banned_regex:\n  - "(?i)waited"\nwarn_regex: []\n')
+        batch = session.handle({banned})
+        assert batch.reloaded == ["banned_phrases.yaml"]
+        [report] = batch.reports
+        assert [v.rule_id for v in report.style] == ["banned:0"]
+
+    def test_broken_config_keeps_previous_rules(self, workspace):
+        session = LintWatch(workspace, [str(workspace / "scenes")], jobs=1, no_cache=True)
+        ruleset = session.ruleset
+        banned = workspace / "banned_phrases.yaml"
+        banned.write_text("banned_regex: [\n")
+        batch = session.handle({banned})
+        assert batch.error and not batch.reloaded
+        assert session.ruleset is ruleset
+
+    def test_file_target_ignores_siblings(self, workspace):
+        session = LintWatch(workspace, [str(workspace / "scenes" / "a.md")], jobs=1, no_cache=True)
+        (workspace / "scenes" / "b.md").write_text("Her breath hitched.")
+        assert session.handle({workspace / "scenes" / "b.md"}) == Batch()
+
+
+# ── CLI ─────────────────────────────────────────────────────────────
+class TestCLIWatch:
+    @patch("harness.cli.settings")
+    def test_watch_prints_batches(self, mock_settings, workspace):
+        mock_settings.workspace_root = workspace
+
+        def batches(self, watcher):
+            (workspace / "scenes" / "a.md").write_text("Her breath hitched.")
+            yield self.handle({workspace / "scenes" / "a.md"})
+            raise KeyboardInterrupt
+
+        with patch.object(LintWatch, "batches", batches):
+            result = CliRunner().invoke(cli, ["lint", "--watch", "--no-cache"])
+        assert result.exit_code == 0
+        assert "Watching" in result.output and "Banned" in result.output
+        assert "Stopped watching" in result.output
+
+    @patch("harness.cli.settings")
+    def test_watch_rejects_fail_fast(self, mock_settings, workspace):
+        mock_settings.workspace_root = workspace
+        result = CliRunner().invoke(cli, ["lint", "--watch", "--fail-fast"])
+        assert result.exit_code == 2
+
+    @patch("harness.cli.settings")
+    def test_lint_requires_targets_without_watch(self, mock_settings, workspace):
+        mock_settings.workspace_root = workspace
+        result = CliRunner().invoke(cli, ["lint"])
+        assert result.exit_code == 2